@@ -4,6 +4,15 @@ This file demonstrates all the important dictionary methods in Python.
 Dictionary methods help you manipulate and work with dictionaries efficiently.
 """
 
+import os
+import sys
+
+# Make the project's ``src`` package importable when running this file directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.cache import memoize  # noqa: E402
+from src.records import group_by  # noqa: E402
+
 print("=== Python Dictionary Methods Tutorial ===\n")
 
 # =============================================================================
@@ -252,25 +261,23 @@ print(f"Host: {host}, Port: {port}, Debug: {debug}")
 
 # Pattern 2: Dictionary as cache
 print(f"\nPattern 2: Dictionary as cache")
-cache = {}
+# A plain dict used as a cache grows forever and never forgets stale values.
+# memoize() keeps the results in a bounded cache that drops the least recently
+# used entry once it is full, and recomputes entries older than `ttl` seconds.
 
 
+@memoize(maxsize=128, policy="lru", ttl=300)
 def expensive_calculation(n):
-    if n in cache:
-        print(f"  Cache hit for {n}")
-        return cache[n]
-    else:
-        print(f"  Calculating for {n}")
-        result = n**2  # Simulate expensive calculation
-        cache[n] = result
-        return result
+    return n**2  # Simulate expensive calculation
 
 
 print("First call (cache miss):")
 result1 = expensive_calculation(5)
 print("Second call (cache hit):")
 result2 = expensive_calculation(5)
-print(f"Cache: {cache}")
+stats = expensive_calculation.cache.stats
+print(f"Hits: {stats.hits}, misses: {stats.misses}")
+print(f"Cache: {dict(expensive_calculation.cache)}")
 
 # Pattern 3: Grouping with setdefault
 print(f"\nPattern 3: Grouping with setdefault")
@@ -282,10 +289,15 @@ students = [
     {"name": "Eve", "grade": "B"},
 ]
 
-grouped_by_grade = {}
-for student in students:
-    grade = student["grade"]
-    grouped_by_grade.setdefault(grade, []).append(student["name"])
+# The classic loop is:
+#     grouped_by_grade = {}
+#     for student in students:
+#         grouped_by_grade.setdefault(student["grade"], []).append(student["name"])
+# group_by() builds the same dictionary from the two columns in one pass.
+grouped_by_grade = group_by(
+    [student["grade"] for student in students],
+    [student["name"] for student in students],
+)
 
 print(f"Students: {students}")
 print(f"Grouped by grade: {grouped_by_grade}")
@@ -4,6 +4,14 @@ This file demonstrates how dictionaries work in Python.
 Dictionaries store data in key-value pairs and are very efficient for lookups.
 """
 
+import os
+import sys
+
+# Make the project's ``src`` package importable when running this file directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.records import group_by  # noqa: E402
+
 print("=== Python Dictionaries Tutorial ===\n")
 
 # =============================================================================
@@ -222,12 +230,11 @@ items = [
     {"name": "Orange", "category": "Fruit"},
 ]
 
-grouped = {}
-for item in items:
-    category = item["category"]
-    if category not in grouped:
-        grouped[category] = []
-    grouped[category].append(item["name"])
+# group_by() does the "create the list if missing, then append" loop for us:
+# it gives every category a number once, then collects the names per number.
+grouped = group_by(
+    [item["category"] for item in items], [item["name"] for item in items]
+)
 
 print("Grouped items:")
 for category, names in grouped.items():
@@ -4,6 +4,20 @@ This file demonstrates all the important list methods in Python.
 List methods help you manipulate and work with lists efficiently.
 """
 
+import os
+import sys
+
+# Make the project's ``src`` package importable when running this file directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.sequences import (  # noqa: E402
+    BlockList,
+    RingBuffer,
+    chunk_views,
+    flatten,
+    gather,
+)
+
 print("=== Python List Methods Tutorial ===\n")
 
 # =============================================================================
@@ -268,6 +282,11 @@ test_list = [1, 2, 3]
 print(f"safe_get(test_list, 1): {safe_get(test_list, 1)}")
 print(f"safe_get(test_list, 10, 'Not found'): {safe_get(test_list, 10, 'Not found')}")
 
+# gather() is the batch form: it checks all the bounds first instead of
+# raising and catching IndexError for every miss
+batch = gather(test_list, [1, 10, -1, -4], "Not found")
+print(f"gather(test_list, [1, 10, -1, -4], 'Not found'): {batch}")
+
 # Pattern 2: List rotation
 print(f"\nPattern 2: List rotation")
 
@@ -282,6 +301,11 @@ rotated = rotate_list(original, 2)
 print(f"Original: {original}")
 print(f"Rotated by 2: {rotated}")
 
+# rotate_list() copies the whole list; a RingBuffer only moves its start offset
+schedule = RingBuffer(original)
+schedule.rotate(2)
+print(f"RingBuffer rotated by 2: {list(schedule)} (offset {schedule.offset})")
+
 # Pattern 3: Chunking a list
 print(f"\nPattern 3: Chunking a list")
 
@@ -295,6 +319,11 @@ chunks = chunk_list(numbers, 3)
 print(f"Numbers: {numbers}")
 print(f"Chunks of 3: {chunks}")
 
+# chunk_views() yields the same chunks lazily as views into the list, so no
+# element is copied; call list() on a view when you need a real list
+views = chunk_views(numbers, 3)
+print(f"Chunk views of 3: {[list(view) for view in views]}")
+
 # Pattern 4: Flattening nested lists
 print(f"\nPattern 4: Flattening nested lists")
 
@@ -314,6 +343,11 @@ flattened = flatten_list(nested)
 print(f"Nested: {nested}")
 print(f"Flattened: {flattened}")
 
+# flatten() gives the same leaves from an explicit stack instead of recursion,
+# so it also works on lists nested thousands of levels deep
+print(f"Flattened iteratively: {list(flatten(nested))}")
+print(f"Flattened one level: {list(flatten(nested, max_depth=1))}")
+
 # =============================================================================
 # PERFORMANCE CONSIDERATIONS
 # =============================================================================
@@ -342,6 +376,24 @@ print(f"append() 10000 elements: {append_time:.4f} seconds")
 print(f"insert(0) 1000 elements: {insert_time:.4f} seconds")
 print("Note: insert(0) is much slower for large lists!")
 
+# Comparison at the same size, including BlockList: it keeps its items in
+# small blocks, so an insert only shifts the items of one block
+print("\nFront inserts of 10000 elements:")
+for label, container in [("list", []), ("BlockList", BlockList())]:
+    start_time = time.time()
+    for i in range(10000):
+        container.insert(0, i)
+    front_time = time.time() - start_time
+    start_time = time.time()
+    for i in range(10000):
+        container.insert(len(container) // 2, i)
+    middle_time = time.time() - start_time
+    print(
+        f"{label:>9}: insert(0) {front_time:.4f} s, "
+        f"insert(middle) {middle_time:.4f} s, container[5000] = {container[5000]}"
+    )
+print("BlockList still supports indexing, slicing and iteration like a list.")
+
 # =============================================================================
 # METHOD CHAINING AND COMBINATIONS
 # =============================================================================
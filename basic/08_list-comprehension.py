@@ -4,6 +4,15 @@ This file demonstrates how list comprehensions work in Python.
 List comprehensions are a concise way to create lists from existing iterables.
 """
 
+import os
+import sys
+
+# Make the project's ``src`` package importable when running this file directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.records import RecordStore, query  # noqa: E402
+from src.sequences import Pipeline  # noqa: E402
+
 print("=== Python List Comprehensions Tutorial ===\n")
 
 # =============================================================================
@@ -231,21 +240,42 @@ print("-" * 25)
 
 # Example 1: Processing student data
 print("Example 1: Processing student data")
-students = [
-    {"name": "Alice", "grade": 85},
-    {"name": "Bob", "grade": 92},
-    {"name": "Charlie", "grade": 78},
-    {"name": "Diana", "grade": 96},
-]
+# RecordStore keeps the rows in typed columns instead of one dict per row;
+# each row still reads like a dict, so the comprehensions below are unchanged.
+students = RecordStore.from_records(
+    [
+        {"name": "Alice", "grade": 85},
+        {"name": "Bob", "grade": 92},
+        {"name": "Charlie", "grade": 78},
+        {"name": "Diana", "grade": 96},
+    ]
+)
 
 # Get names of students with grade >= 90
 top_students = [student["name"] for student in students if student["grade"] >= 90]
 print(f"Top students (grade >= 90): {top_students}")
 
+# A sorted index on "grade" answers the same range query with two binary
+# searches instead of a scan over every student (results come in grade order)
+by_grade = students.create_index("grade")
+indexed_top = [student["name"] for student in students.take(by_grade.range(90))]
+print(f"Top students via index: {indexed_top}")
+
 # Get grades of students whose names start with 'A' or 'B'
 ab_grades = [student["grade"] for student in students if student["name"][0] in "AB"]
 print(f"Grades of students with names starting with A or B: {ab_grades}")
 
+# The same filters written as a query can be planned: indexed predicates are
+# looked up, the rest are tested most selective first
+ab_top = (
+    query(students)
+    .where("grade", ">=", 90)
+    .where("name", "startswith", ("A", "B"))
+    .select("name")
+)
+print(f"Students with A or B names and grade >= 90: {ab_top.run()}")
+print(f"Plan:\n{ab_top.explain()}")
+
 # Example 2: Text processing
 print("\nExample 2: Text processing")
 text = "Python is a great programming language for beginners"
@@ -259,6 +289,16 @@ print(f"Long words in uppercase: {long_upper_words}")
 first_letters = [word[0] for word in words]
 print(f"First letters: {first_letters}")
 
+# A lazy pipeline runs the same steps in one pass, without building the
+# intermediate list of long uppercase words
+long_first_letters = (
+    Pipeline(words)
+    .filter(lambda word: len(word) > 4)
+    .map(str.upper)
+    .map(lambda word: word[0])
+)
+print(f"First letters of long words: {long_first_letters.to_list()}")
+
 # Example 3: Number processing
 print("\nExample 3: Number processing")
 numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
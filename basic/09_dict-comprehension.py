@@ -4,6 +4,14 @@ This file demonstrates how dictionary comprehensions work in Python.
 Dictionary comprehensions are a concise way to create dictionaries from existing iterables.
 """
 
+import os
+import sys
+
+# Make the project's ``src`` package importable when running this file directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.records import RecordStore, group_by  # noqa: E402
+
 print("=== Python Dictionary Comprehensions Tutorial ===\n")
 
 # =============================================================================
@@ -229,12 +237,16 @@ print("-" * 25)
 
 # Example 1: Processing student data
 print("Example 1: Processing student data")
-students = [
-    {"name": "Alice", "grade": 85},
-    {"name": "Bob", "grade": 92},
-    {"name": "Charlie", "grade": 78},
-    {"name": "Diana", "grade": 96},
-]
+# RecordStore keeps the rows in typed columns instead of one dict per row;
+# each row still reads like a dict, so the comprehensions below are unchanged.
+students = RecordStore.from_records(
+    [
+        {"name": "Alice", "grade": 85},
+        {"name": "Bob", "grade": 92},
+        {"name": "Charlie", "grade": 78},
+        {"name": "Diana", "grade": 96},
+    ]
+)
 
 # Create name to grade mapping
 name_to_grade = {student["name"]: student["grade"] for student in students}
@@ -295,11 +307,7 @@ items = [
     ("vegetable", "carrot"),
     ("fruit", "orange"),
 ]
-grouped = {}
-for category, item in items:
-    if category not in grouped:
-        grouped[category] = []
-    grouped[category].append(item)
+grouped = group_by([category for category, _ in items], [item for _, item in items])
 print(f"Grouped items: {grouped}")
 
 # Pattern 3: Counting occurrences
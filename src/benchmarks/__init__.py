@@ -0,0 +1,7 @@
+"""
+Benchmark scripts for the project's data-structure modules.
+
+Run one from the repository root, e.g.::
+
+    python -m src.benchmarks.bench_sharded_cache
+"""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Per-element memoized calls versus one batched call.
+
+``expensive_calculation`` is evaluated over 10**3 .. 10**N random inputs drawn
+from a key space one tenth the input size, first by calling a ``memoize``d
+scalar function once per element and then by one ``batch_memoize`` call.
+Uses NumPy arrays when NumPy is installed and plain lists otherwise.
+"""
+
+import argparse
+import random
+import time
+
+from src.cache import batch_memoize, memoize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-exp", type=int, default=6, help="largest 10**N")
+    args = parser.parse_args()
+
+    print(f"numpy: {'yes' if np is not None else 'no (list path)'}")
+    print(f"{'inputs':>10} {'per-element s':>14} {'batch s':>10} {'speedup':>8}")
+    for exp in range(3, args.max_exp + 1):
+        size = 10**exp
+        space = max(1, size // 10)
+
+        @memoize(maxsize=None)
+        def expensive_calculation(n):
+            return n**2
+
+        @batch_memoize(maxsize=None)
+        def expensive_calculation_batch(ns):
+            if np is not None and isinstance(ns, np.ndarray):
+                return ns**2
+            return [n**2 for n in ns]
+
+        if np is not None:
+            inputs = np.random.default_rng(0).integers(0, space, size)
+            scalar_inputs = inputs.tolist()
+        else:
+            rng = random.Random(0)
+            inputs = scalar_inputs = [rng.randrange(space) for _ in range(size)]
+
+        start = time.perf_counter()
+        expected = [expensive_calculation(n) for n in scalar_inputs]
+        per_element = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = expensive_calculation_batch(inputs)
+        batch = time.perf_counter() - start
+
+        assert list(result) == expected
+        speedup = per_element / batch
+        print(f"{size:>10} {per_element:>14.4f} {batch:>10.4f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
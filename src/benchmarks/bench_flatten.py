@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Recursive ``flatten_list`` versus the iterative ``flatten`` generator.
+
+Times both on a wide input (``--wide`` leaves in small lists nested three
+levels deep) and on a deep one (a single chain nested ``--deep`` levels),
+where the recursive version runs into the recursion limit.
+"""
+
+import argparse
+import sys
+import time
+
+from src.sequences import flatten
+
+
+def flatten_list(nested_list):
+    """The recursive version from the list methods lesson."""
+    result = []
+    for item in nested_list:
+        if isinstance(item, list):
+            result.extend(flatten_list(item))
+        else:
+            result.append(item)
+    return result
+
+
+def timed(label, run):
+    start = time.perf_counter()
+    try:
+        count = len(run())
+    except RecursionError:
+        print(f"{label:>28}   RecursionError")
+        return
+    print(f"{label:>28} {time.perf_counter() - start:>8.3f} s ({count} leaves)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--wide", type=int, default=10**6)
+    parser.add_argument("--deep", type=int, default=10**5)
+    args = parser.parse_args()
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+
+    leaves = list(range(args.wide))
+    wide = [
+        [leaves[j : j + 10] for j in range(i, min(i + 100, args.wide), 10)]
+        for i in range(0, args.wide, 100)
+    ]
+    timed("wide, recursive", lambda: flatten_list(wide))
+    timed("wide, iterative", lambda: list(flatten(wide)))
+
+    deep = [0]
+    for i in range(1, args.deep):
+        deep = [deep, i]
+    timed("deep, recursive", lambda: flatten_list(deep))
+    timed("deep, iterative", lambda: list(flatten(deep)))
+
+
+if __name__ == "__main__":
+    main()
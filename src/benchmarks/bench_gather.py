@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Exception-based ``safe_get`` in a loop versus bulk ``gather``.
+
+Looks up ``--lookups`` random indices, about ``--miss`` of them out of
+range, in a ``--size`` item sequence with the lessons' try/except
+``safe_get``, the bounds-checking :func:`safe_get`, :func:`gather` on a list
+and, when NumPy is installed, :func:`gather` on a NumPy array.
+"""
+
+import argparse
+import random
+import time
+
+from src.sequences import gather, safe_get
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def lesson_safe_get(lst, index, default=None):
+    """The try/except version from the list methods lesson."""
+    try:
+        return lst[index]
+    except IndexError:
+        return default
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--lookups", type=int, default=10**6)
+    parser.add_argument("--miss", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    data = list(range(args.size))
+    span = int(args.size / (1 - args.miss)) if args.miss < 1 else 2 * args.size
+    indices = [rng.randrange(-span, span) for _ in range(args.lookups)]
+    print(f"{args.lookups} lookups into {args.size} items, miss rate ~{args.miss}")
+
+    runs = [
+        ("try/except loop", lambda: [lesson_safe_get(data, i, -1) for i in indices]),
+        ("safe_get loop", lambda: [safe_get(data, i, -1) for i in indices]),
+        ("gather(list)", lambda: gather(data, indices, -1)),
+    ]
+    if np is not None:
+        array_data, array_indices = np.array(data), np.array(indices)
+        runs.append(("gather(ndarray)", lambda: gather(array_data, array_indices, -1)))
+
+    expected = None
+    for label, run in runs:
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:>20} {elapsed:>8.3f} s")
+        result = list(result)
+        assert expected is None or result == expected
+        expected = result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Dict-of-lists grouping versus the columnar ``GroupBy`` engine.
+
+Groups ``--rows`` (default 10**6; the target workload is 10**7) rows of
+``{"name": ..., "category": ...}`` records into per-category name lists
+with the lessons' ``setdefault(...).append(...)`` loop, then runs the same
+grouping plus count/sum/mean/min/max with :class:`GroupBy` on columns.
+Uses NumPy columns when NumPy is installed and lists otherwise.
+"""
+
+import argparse
+import random
+import time
+
+from src.records import GroupBy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--groups", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    categories = [f"cat{i}" for i in range(args.groups)]
+    key_list = [rng.choice(categories) for _ in range(args.rows)]
+    value_list = [rng.randrange(100) for _ in range(args.rows)]
+    records = [{"name": v, "category": k} for k, v in zip(key_list, value_list)]
+    if np is not None:
+        keys, values = np.array(key_list), np.array(value_list)
+    else:
+        keys, values = key_list, value_list
+    print(f"{args.rows} rows, {args.groups} groups, numpy: {np is not None}")
+
+    start = time.perf_counter()
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record["category"], []).append(record["name"])
+    print(f"{'dict setdefault loop':>24} {time.perf_counter() - start:>8.3f} s")
+
+    start = time.perf_counter()
+    by_category = GroupBy(keys)
+    print(f"{'factorize keys':>24} {time.perf_counter() - start:>8.3f} s")
+    for how in ["collect", "count", "sum", "mean", "min", "max"]:
+        start = time.perf_counter()
+        result = by_category.agg(values, how)
+        print(f"{'GroupBy ' + how:>24} {time.perf_counter() - start:>8.3f} s")
+        if how == "collect":
+            assert result == grouped
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Word counting on decoded ``str`` tokens versus memory-mapped ``bytes`` tokens.
+
+Compares, on a generated corpus:
+
+* ``read+split``: the lessons' pattern, ``text.split()`` on the whole file
+  and a ``dict.get`` counting loop;
+* ``stream str``: :func:`count_words`, chunked ``str.split()`` + ``Counter``;
+* ``mmap bytes``: :func:`count_words_mmap`, chunked ``bytes.split()`` on the
+  mapped file, decoding only the vocabulary.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.text import count_words, count_words_mmap
+
+
+def _read_split(path: str) -> dict:
+    with open(path, encoding="utf-8") as fp:
+        text = fp.read()
+    word_count = {}
+    for word in text.split():
+        word_count[word] = word_count.get(word, 0) + 1
+    return word_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=int, default=64)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = [f"wörd{i}" if i % 7 == 0 else f"word{i}" for i in range(args.vocabulary)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as fp:
+            written = 0
+            while written < args.megabytes << 20:
+                line = " ".join(rng.choices(words, k=5000)) + "\n"
+                written += fp.write(line)
+
+        expected = None
+        print(f"{args.megabytes} MB corpus")
+        for name, func in [
+            ("read+split", _read_split),
+            ("stream str", count_words),
+            ("mmap bytes", count_words_mmap),
+        ]:
+            start = time.perf_counter()
+            result = func(path)
+            elapsed = time.perf_counter() - start
+            expected = expected or result
+            assert result == expected
+            print(f"{name:>12} {elapsed:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Single-process ``group_by`` versus hash-partitioned ``parallel_group_by``.
+
+Groups ``--rows`` category keys with integer values using one process and
+then ``--workers`` processes, and prints the per-stage timings reported by
+:func:`parallel_group_by`. Uses NumPy columns when NumPy is installed.
+"""
+
+import argparse
+import os
+import random
+import time
+
+from src.records import group_by, parallel_group_by
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--how", default="sum")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    key_list = [f"cat{rng.randrange(args.groups)}" for _ in range(args.rows)]
+    value_list = [rng.randrange(100) for _ in range(args.rows)]
+    if np is not None:
+        keys, values = np.array(key_list), np.array(value_list)
+    else:
+        keys, values = key_list, value_list
+    print(
+        f"{args.rows} rows, {args.groups} groups, {args.workers} workers, "
+        f"numpy: {np is not None}"
+    )
+
+    start = time.perf_counter()
+    expected = group_by(keys, values, args.how)
+    print(f"{'group_by':>24} {time.perf_counter() - start:>8.3f} s")
+
+    timings = {}
+    start = time.perf_counter()
+    result = parallel_group_by(
+        keys, values, args.how, workers=args.workers, timings=timings
+    )
+    print(f"{'parallel_group_by':>24} {time.perf_counter() - start:>8.3f} s")
+    for stage, seconds in timings.items():
+        print(f"{'  ' + stage:>24} {seconds:>8.3f} s")
+    assert list(result) == list(expected)
+
+
+if __name__ == "__main__":
+    main()
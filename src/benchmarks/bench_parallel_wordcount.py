@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Speedup of multi-process word counting against worker count.
+
+Writes a temporary file of random words, counts it with the serial streaming
+counter and then with ``parallel_count_words`` at 1, 2, 4, ... workers, and
+checks that every result matches the serial one exactly.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.text import count_words, parallel_count_words
+
+
+def _write_corpus(path: str, megabytes: int, vocabulary: int) -> None:
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(vocabulary)]
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary)]
+    target = megabytes << 20
+    written = 0
+    with open(path, "w", encoding="utf-8") as fp:
+        while written < target:
+            line = " ".join(rng.choices(words, weights=weights, k=5000)) + "\n"
+            fp.write(line)
+            written += len(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--megabytes", type=int, default=64)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.txt")
+        _write_corpus(path, args.megabytes, args.vocabulary)
+
+        start = time.perf_counter()
+        expected = count_words(path)
+        serial = time.perf_counter() - start
+        print(f"{args.megabytes} MB, {len(expected)} distinct words")
+        print(f"{'workers':>7} {'seconds':>8} {'speedup':>8}")
+        print(f"{'serial':>7} {serial:>8.3f} {1.0:>7.2f}x")
+
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            result = parallel_count_words(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert result == expected and list(result) == list(expected)
+            print(f"{workers:>7} {elapsed:>8.3f} {serial / elapsed:>7.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Chained list comprehensions versus a lazy ``Pipeline``.
+
+Runs the lessons' text-processing chain (keep words longer than four
+characters, upper-case them, take the first letter) over ``--items`` words
+(default 10**7) both as eager comprehensions and as a :class:`Pipeline`, and
+reports the time and the peak memory (``tracemalloc``) of each.
+"""
+
+import argparse
+import time
+import tracemalloc
+from itertools import cycle, islice
+from operator import itemgetter
+
+from src.sequences import Pipeline
+
+WORDS = "Python is a great programming language for beginners".split()
+
+
+def measure(label, run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>20} {elapsed:>8.3f} s {peak / 2**20:>10.1f} MiB peak")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10**7)
+    args = parser.parse_args()
+    print(f"{args.items} words")
+
+    def source():
+        return islice(cycle(WORDS), args.items)
+
+    def eager():
+        words = list(source())
+        long_upper_words = [word.upper() for word in words if len(word) > 4]
+        first_letters = [word[0] for word in long_upper_words]
+        return len(first_letters)
+
+    def lazy():
+        return (
+            Pipeline(source())
+            .filter(lambda word: len(word) > 4)
+            .map(str.upper)
+            .map(itemgetter(0))
+            .count()
+        )
+
+    expected = measure("comprehensions", eager)
+    result = measure("Pipeline", lazy)
+    assert result == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Memory and scan time of a list of dicts versus a ``RecordStore``.
+
+Builds ``--rows`` student records ``{"name": ..., "grade": ...}`` both as a
+list of dicts and as a :class:`RecordStore`, reports the memory each
+allocates (measured with ``tracemalloc``) and times the lessons'
+``top_students`` comprehension against both.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from src.records import RecordStore
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--names", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"student{i}" for i in range(args.names)]
+    picks = [(rng.choice(names), rng.randrange(101)) for _ in range(args.rows)]
+    print(f"{args.rows} rows, {args.names} distinct names")
+
+    dicts, dict_bytes = measure(lambda: [{"name": n, "grade": g} for n, g in picks])
+    store, store_bytes = measure(
+        lambda: RecordStore(
+            {"name": str, "grade": "b"},
+            ({"name": n, "grade": g} for n, g in picks),
+        )
+    )
+    for label, size in [("list of dicts", dict_bytes), ("RecordStore", store_bytes)]:
+        print(f"{label:>16} {size / 2**20:>8.1f} MiB {size / args.rows:>8.1f} B/row")
+
+    for label, students in [("list of dicts", dicts), ("RecordStore", store)]:
+        start = time.perf_counter()
+        top_students = [s["name"] for s in students if s["grade"] >= 90]
+        elapsed = time.perf_counter() - start
+        print(f"{label:>16} top_students {elapsed:>8.3f} s ({len(top_students)})")
+
+
+if __name__ == "__main__":
+    main()
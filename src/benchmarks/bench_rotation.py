@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Rotation throughput of ``rotate_list`` slicing, ``deque`` and ``RingBuffer``.
+
+Rotates a ``--size`` item schedule ``--rotations`` times by a varying
+amount with the lessons' ``lst[n:] + lst[:n]``, with ``collections.deque``
+(``O(n)`` in the rotation amount) and with :class:`RingBuffer` (``O(1)``),
+reading one item after each rotation, and reports rotations per second.
+"""
+
+import argparse
+import time
+from collections import deque
+
+from src.sequences import RingBuffer
+
+
+def rotate_list(lst, n):
+    """The slicing version from the list methods lesson."""
+    n = n % len(lst)
+    return lst[n:] + lst[:n]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--rotations", type=int, default=10**4)
+    args = parser.parse_args()
+    steps = [(i * 7919) % args.size - args.size // 2 for i in range(args.rotations)]
+    print(f"{args.size} items, {args.rotations} rotations")
+
+    def run_list():
+        schedule = list(range(args.size))
+        for n in steps:
+            schedule = rotate_list(schedule, n)
+            schedule[0]
+        return schedule[0]
+
+    def run_deque():
+        schedule = deque(range(args.size))
+        for n in steps:
+            schedule.rotate(-n)
+            schedule[0]
+        return schedule[0]
+
+    def run_ring():
+        schedule = RingBuffer(range(args.size))
+        for n in steps:
+            schedule.rotate(n)
+            schedule[0]
+        return schedule[0]
+
+    results = set()
+    for label, run in [
+        ("rotate_list", run_list),
+        ("deque.rotate", run_deque),
+        ("RingBuffer.rotate", run_ring),
+    ]:
+        start = time.perf_counter()
+        results.add(run())
+        elapsed = time.perf_counter() - start
+        rate = args.rotations / elapsed
+        print(f"{label:>20} {elapsed:>8.3f} s {rate:>14,.0f} rotations/s")
+    assert len(results) == 1
+
+
+if __name__ == "__main__":
+    main()
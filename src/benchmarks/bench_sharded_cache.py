@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Throughput of concurrent memoized lookups from 1 to N threads.
+
+Compares three ways of sharing a cache between worker threads:
+
+* ``dict+lock``: the plain dict pattern guarded by one lock, computing misses
+  outside the lock (duplicate computations for the same cold key);
+* ``global``: one lock held across the computation (no duplicates, but every
+  miss serializes all threads);
+* ``sharded``: :class:`ShardedCache` with single-flight misses.
+
+The "expensive calculation" sleeps to stand in for I/O or a C extension that
+releases the GIL; pure-Python CPU work cannot scale across threads in CPython.
+"""
+
+import argparse
+import random
+import threading
+import time
+from typing import Callable, Dict, List
+
+from src.cache import ShardedCache
+
+
+def _workload(keys: int, lookups: int, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    # Skewed (Zipf-like) key popularity, as seen in production traffic.
+    weights = [1.0 / (rank + 1) for rank in range(keys)]
+    return rng.choices(range(keys), weights=weights, k=lookups)
+
+
+def _run(threads: int, worker: Callable[[List[int]], None], keys: List[int]) -> float:
+    per_thread = [keys[i::threads] for i in range(threads)]
+    pool = [threading.Thread(target=worker, args=(part,)) for part in per_thread]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return time.perf_counter() - start
+
+
+def bench(threads: int, keys: List[int], cost: float) -> Dict[str, tuple]:
+    results = {}
+    counter = {"n": 0}
+    count_lock = threading.Lock()
+
+    def compute(n: int) -> int:
+        with count_lock:
+            counter["n"] += 1
+        time.sleep(cost)
+        return n**2
+
+    # dict + lock, compute outside the lock
+    cache: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    def dict_worker(part: List[int]) -> None:
+        for n in part:
+            with lock:
+                if n in cache:
+                    continue
+            value = compute(n)
+            with lock:
+                cache[n] = value
+
+    counter["n"] = 0
+    elapsed = _run(threads, dict_worker, keys)
+    results["dict+lock"] = (elapsed, counter["n"])
+
+    # One lock held across the computation
+    cache = {}
+
+    def global_worker(part: List[int]) -> None:
+        for n in part:
+            with lock:
+                if n not in cache:
+                    cache[n] = compute(n)
+
+    counter["n"] = 0
+    elapsed = _run(threads, global_worker, keys)
+    results["global"] = (elapsed, counter["n"])
+
+    # Sharded, single-flight
+    sharded = ShardedCache(maxsize=None, shards=64)
+
+    def sharded_worker(part: List[int]) -> None:
+        for n in part:
+            sharded.get_or_compute(n, lambda n=n: compute(n))
+
+    counter["n"] = 0
+    elapsed = _run(threads, sharded_worker, keys)
+    results["sharded"] = (elapsed, counter["n"])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--cost", type=float, default=0.001, help="seconds per miss")
+    parser.add_argument("--max-threads", type=int, default=16)
+    args = parser.parse_args()
+
+    keys = _workload(args.keys, args.lookups, seed=0)
+    print(
+        f"{args.lookups} lookups over {args.keys} keys, {args.cost * 1e3:.1f} ms/miss"
+    )
+    print(
+        f"{'threads':>7} {'variant':>10} {'seconds':>8} {'ops/s':>10} {'computes':>9}"
+    )
+    threads = 1
+    while threads <= args.max_threads:
+        for name, (elapsed, computes) in bench(threads, keys, args.cost).items():
+            print(
+                f"{threads:>7} {name:>10} {elapsed:>8.3f} "
+                f"{args.lookups / elapsed:>10.0f} {computes:>9}"
+            )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Reusable caching utilities.
+
+Bounded replacements for the ``cache = {}`` memoization pattern used in the
+learning materials.
+"""
+
+from .aio import async_memoize
+from .base import MISSING, Cache
+from .batch import batch_memoize
+from .memo import make_key, memoize
+from .persistent import SqliteStore, TieredCache
+from .policies import POLICIES, EvictionPolicy, LFUPolicy, LRUPolicy, make_policy
+from .sharded import ShardedCache
+from .stats import CacheStats, LatencyHistogram, dump_stats
+from .ttl import TTLCache
+
+__all__ = [
+    "MISSING",
+    "POLICIES",
+    "Cache",
+    "CacheStats",
+    "EvictionPolicy",
+    "LFUPolicy",
+    "LRUPolicy",
+    "LatencyHistogram",
+    "ShardedCache",
+    "SqliteStore",
+    "TTLCache",
+    "TieredCache",
+    "async_memoize",
+    "batch_memoize",
+    "dump_stats",
+    "make_key",
+    "make_policy",
+    "memoize",
+]
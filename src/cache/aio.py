@@ -0,0 +1,87 @@
+"""
+Memoization for ``async def`` functions.
+
+The cache stores the task computing each result rather than the result itself,
+so concurrent awaiters of the same key share one computation. Tasks that fail
+or are cancelled are dropped from the cache so the next call retries.
+"""
+
+import asyncio
+import functools
+import time
+from collections.abc import MutableMapping
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .base import MISSING
+from .memo import _attach_cache, _latency, _make_store, make_key
+
+
+def async_memoize(
+    func: Optional[Callable[..., Awaitable[Any]]] = None,
+    *,
+    cache: Optional[MutableMapping] = None,
+    maxsize: Optional[int] = 128,
+    policy: Any = "lru",
+    ttl: Optional[float] = None,
+    key: Callable[[Tuple[Any, ...], Dict[str, Any]], Hashable] = make_key,
+) -> Any:
+    """Memoize a coroutine function, sharing in-flight calls per key.
+
+    Works like :func:`memoize`: use it bare or with options, and reach the
+    cache through ``wrapper.cache``, ``wrapper.cache_clear()`` and
+    ``wrapper.cache_info()``. A caller that is cancelled while waiting does
+    not cancel the shared computation for the other awaiters.
+
+    Args:
+        func: The coroutine function to wrap.
+        cache: An existing cache to store tasks in. When given, ``maxsize``,
+            ``policy`` and ``ttl`` are ignored.
+        maxsize: Entry limit for the cache created for ``func``.
+        policy: Eviction policy for the cache created for ``func``.
+        ttl: If given, results expire this many seconds after the call that
+            started computing them.
+        key: Function turning ``(args, kwargs)`` into a hashable cache key.
+
+    Byte limits are not offered: the cache holds tasks, whose size says
+    nothing about the size of their results.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        store = _make_store(cache, maxsize, policy, ttl)
+        latency = _latency(store)
+
+        def forget(k: Hashable, task: "asyncio.Future[Any]", start: float) -> None:
+            if not _failed(task):
+                latency.record(time.perf_counter() - start)
+                return
+            # Only drop the entry if it still refers to this task; it may
+            # have been evicted and replaced by a newer call meanwhile.
+            peek = getattr(store, "peek", store.get)
+            if peek(k, None) is task:
+                del store[k]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            k = key(args, kwargs)
+            task = store.get(k, MISSING)
+            if task is not MISSING and _failed(task):
+                task = MISSING  # its done callback has not removed it yet
+            if task is MISSING:
+                start = time.perf_counter()
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                store[k] = task
+                task.add_done_callback(functools.partial(forget, k, start=start))
+            elif task.done():
+                return task.result()
+            return await asyncio.shield(task)
+
+        _attach_cache(wrapper, store, latency)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def _failed(task: "asyncio.Future[Any]") -> bool:
+    return task.done() and (task.cancelled() or task.exception() is not None)
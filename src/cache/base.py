@@ -0,0 +1,211 @@
+"""
+Bounded in-memory cache.
+
+``Cache`` behaves like a dict (``in``, ``[]``, ``get``) so it can replace the
+plain ``cache = {}`` pattern, but it evicts entries once it is full instead of
+growing without limit.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .policies import EvictionPolicy, make_policy
+from .stats import CacheStats
+
+MISSING = object()
+"""Sentinel returned by ``Cache.get`` lookups that must tell misses from None."""
+
+
+class Cache(MutableMapping):
+    """A dict-like cache bounded by entry count and/or estimated bytes.
+
+    Args:
+        maxsize: Maximum number of entries, or ``None`` for no count limit.
+        policy: Eviction policy name (``"lru"``, ``"lfu"``), class or instance.
+        maxbytes: Maximum total estimated size of the cached values, or
+            ``None`` for no byte limit.
+        sizeof: Function estimating the size of a value in bytes. Only used
+            when ``maxbytes`` is set.
+
+    Values larger than ``maxbytes`` on their own are not stored at all.
+    Lookups through ``[]`` and ``get`` and evictions are counted in
+    :attr:`stats`.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        policy: Any = "lru",
+        maxbytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least 1 or None")
+        if maxbytes is not None and maxbytes < 1:
+            raise ValueError("maxbytes must be at least 1 or None")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._policy: EvictionPolicy = make_policy(policy)
+        self._data: Dict[Hashable, Any] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self.stats = CacheStats()
+
+    @property
+    def policy(self) -> str:
+        """Name of the eviction policy in use."""
+        return self._policy.name
+
+    @property
+    def currbytes(self) -> int:
+        """Estimated size of the cached values (0 unless ``maxbytes`` is set)."""
+        return self._bytes
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.stats.misses += 1
+            raise
+        self.stats.hits += 1
+        self._policy.touch(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it as used, or ``default``."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self._policy.touch(key)
+        return value
+
+    def get_many(self, keys: Iterable[Hashable], default: Any = None) -> List[Any]:
+        """Look up several keys at once, like ``[get(k, default) for k in keys]``.
+
+        Statistics are updated once per batch rather than once per key.
+        """
+        data = self._data
+        touch = self._policy.touch
+        values = []
+        hits = 0
+        for key in keys:
+            value = data.get(key, MISSING)
+            if value is MISSING:
+                values.append(default)
+            else:
+                touch(key)
+                values.append(value)
+                hits += 1
+        self.stats.hits += hits
+        self.stats.misses += len(values) - hits
+        return values
+
+    def set_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """Store several ``(key, value)`` pairs."""
+        for key, value in items:
+            self[key] = value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` without counting a lookup or a use."""
+        return self._data.get(key, default)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = 0
+        if self.maxbytes is not None:
+            size = self._sizeof(value)
+            if size > self.maxbytes:
+                if key in self._data:
+                    del self[key]
+                return
+        if key in self._data:
+            old = self._sizes.get(key, 0)
+            if self.maxbytes is None or self._bytes - old + size <= self.maxbytes:
+                self._data[key] = value
+                if self.maxbytes is not None:
+                    self._sizes[key] = size
+                    self._bytes += size - old
+                self._policy.touch(key)
+                return
+            del self[key]
+        # Make room before inserting so a new key is never its own victim.
+        while self._data and (
+            (self.maxsize is not None and len(self._data) >= self.maxsize)
+            or (self.maxbytes is not None and self._bytes + size > self.maxbytes)
+        ):
+            self.popvictim()
+        self._data[key] = value
+        self._policy.insert(key)
+        if self.maxbytes is not None:
+            self._sizes[key] = size
+            self._bytes += size
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+        self._bytes -= self._sizes.pop(key, 0)
+        self._policy.remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._data!r}, maxsize={self.maxsize}, "
+            f"policy={self.policy!r})"
+        )
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self._bytes = 0
+        self._policy.clear()
+
+    def popvictim(self) -> Tuple[Hashable, Any]:
+        """Evict and return the ``(key, value)`` pair the policy picks next.
+
+        Raises:
+            KeyError: If the cache is empty.
+        """
+        if not self._data:
+            raise KeyError("popvictim(): cache is empty")
+        key = self._policy.victim()
+        value = self._data[key]
+        del self[key]
+        self.stats.evictions += 1
+        return key, value
+
+    def info(self) -> Dict[str, Any]:
+        """Return the statistics and current size of the cache as a dict.
+
+        Value sizes are only measured when ``maxbytes`` is set; otherwise
+        ``bytes`` is ``None`` rather than a misleading 0.
+        """
+        info = self.stats.to_dict()
+        info.update(
+            entries=len(self),
+            maxsize=self.maxsize,
+            bytes=self._bytes if self.maxbytes is not None else None,
+            maxbytes=self.maxbytes,
+            policy=self.policy,
+        )
+        return info
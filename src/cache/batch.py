@@ -0,0 +1,118 @@
+"""
+Batched memoization for functions that can evaluate many inputs at once.
+
+A batch call deduplicates its inputs, probes the cache for every distinct key
+in one pass, computes only the misses with a single call to the vectorized
+function and scatters the results back into input order. NumPy arrays are
+handled with NumPy operations when NumPy is installed; it is optional.
+"""
+
+import functools
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+
+from .base import MISSING
+from .memo import _attach_cache, _latency, _make_store
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def batch_memoize(
+    func: Optional[Callable[[Sequence[Any]], Sequence[Any]]] = None,
+    *,
+    cache: Optional[MutableMapping] = None,
+    maxsize: Optional[int] = 1 << 16,
+    policy: Any = "lru",
+    ttl: Optional[float] = None,
+) -> Any:
+    """Memoize a vectorized function of one argument.
+
+    The wrapped function receives the distinct cache misses of a call, as a
+    NumPy array when the call was given one and as a list otherwise, and must
+    return one result per input in the same order. The wrapper returns an
+    array for array input and a list for any other sequence.
+
+    ``wrapper.scalar(x)`` evaluates a single input through the same code
+    path. ``wrapper.cache``, ``wrapper.cache_clear()`` and
+    ``wrapper.cache_info()`` work as for :func:`memoize`.
+
+    Args:
+        func: The vectorized function to wrap.
+        cache: An existing cache to store results in. When given, ``maxsize``,
+            ``policy`` and ``ttl`` are ignored.
+        maxsize: Entry limit for the cache created for ``func``.
+        policy: Eviction policy for the cache created for ``func``.
+        ttl: If given, results expire after this many seconds.
+    """
+
+    def decorator(fn: Callable[[Sequence[Any]], Sequence[Any]]) -> Callable:
+        store = _make_store(cache, maxsize, policy, ttl)
+        latency = _latency(store)
+
+        def get_many(keys: List[Hashable]) -> List[Any]:
+            if hasattr(store, "get_many"):
+                return store.get_many(keys, MISSING)
+            return [store.get(k, MISSING) for k in keys]
+
+        def compute(keys: List[Hashable], batch: Any) -> List[Any]:
+            """Evaluate ``fn`` on ``batch`` (the misses ``keys``) and cache it."""
+            start = time.perf_counter()
+            computed = fn(batch)
+            latency.record(time.perf_counter() - start)
+            if np is not None and isinstance(computed, np.ndarray):
+                computed = computed.tolist()
+            else:
+                computed = list(computed)
+            if len(computed) != len(keys):
+                raise ValueError(
+                    f"{fn.__name__} returned {len(computed)} results "
+                    f"for {len(keys)} inputs"
+                )
+            if hasattr(store, "set_many"):
+                store.set_many(zip(keys, computed))
+            else:
+                for k, v in zip(keys, computed):
+                    store[k] = v
+            return computed
+
+        def call_array(inputs: Any) -> Any:
+            unique, inverse = np.unique(inputs, return_inverse=True)
+            keys = unique.tolist()
+            values = get_many(keys)
+            miss_pos = [i for i, v in enumerate(values) if v is MISSING]
+            if miss_pos:
+                miss_keys = [keys[i] for i in miss_pos]
+                computed = compute(miss_keys, unique[miss_pos])
+                for i, v in zip(miss_pos, computed):
+                    values[i] = v
+            return np.asarray(values)[inverse.reshape(np.shape(inputs))]
+
+        def call_sequence(inputs: Sequence[Any]) -> List[Any]:
+            keys = list(dict.fromkeys(inputs))
+            values = get_many(keys)
+            found = dict(zip(keys, values))
+            misses = [k for k, v in found.items() if v is MISSING]
+            if misses:
+                found.update(zip(misses, compute(misses, misses)))
+            return [found[k] for k in inputs]
+
+        @functools.wraps(fn)
+        def wrapper(inputs: Sequence[Any]) -> Any:
+            if np is not None and isinstance(inputs, np.ndarray):
+                return call_array(inputs)
+            return call_sequence(inputs)
+
+        def scalar(x: Hashable) -> Any:
+            return call_sequence((x,))[0]
+
+        wrapper.scalar = scalar  # type: ignore[attr-defined]
+        _attach_cache(wrapper, store, latency)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,138 @@
+"""
+The ``memoize`` decorator: cache a function's results in a bounded cache.
+"""
+
+import functools
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .base import MISSING, Cache
+from .stats import LatencyHistogram
+from .ttl import TTLCache
+
+_KWARGS_MARK = object()
+_FAST_TYPES = {int, str}
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """Build a cache key from call arguments.
+
+    A single ``int`` or ``str`` argument is used as the key directly, which
+    keeps the common one-argument case as cheap as the plain dict pattern.
+    """
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    return args
+
+
+def _make_store(
+    cache: Optional[MutableMapping],
+    maxsize: Optional[int],
+    policy: Any,
+    ttl: Optional[float],
+    maxbytes: Optional[int] = None,
+) -> MutableMapping:
+    """Return ``cache``, or a new :class:`Cache` or :class:`TTLCache` if ``None``."""
+    if cache is not None:
+        return cache
+    if ttl is not None:
+        return TTLCache(maxsize=maxsize, ttl=ttl, policy=policy, maxbytes=maxbytes)
+    return Cache(maxsize=maxsize, policy=policy, maxbytes=maxbytes)
+
+
+def _latency(store: MutableMapping) -> LatencyHistogram:
+    """The histogram to record compute times in: the store's own if it has one.
+
+    A store whose ``stats`` is built on each access (like
+    :class:`ShardedCache`) offers a live ``latency`` histogram instead.
+    """
+    latency = getattr(store, "latency", None)
+    if isinstance(latency, LatencyHistogram):
+        return latency
+    stats = getattr(store, "stats", None)
+    return stats.latency if stats is not None else LatencyHistogram()
+
+
+def _attach_cache(
+    wrapper: Callable, store: MutableMapping, latency: LatencyHistogram
+) -> None:
+    """Expose ``store`` as ``wrapper.cache``, ``cache_clear`` and ``cache_info``."""
+
+    def cache_info() -> Dict[str, Any]:
+        if hasattr(store, "info"):
+            return store.info()
+        return {"entries": len(store), "compute_latency": latency.to_dict()}
+
+    wrapper.cache = store  # type: ignore[attr-defined]
+    wrapper.cache_clear = store.clear  # type: ignore[attr-defined]
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    cache: Optional[MutableMapping] = None,
+    maxsize: Optional[int] = 128,
+    policy: Any = "lru",
+    maxbytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    key: Callable[[Tuple[Any, ...], Dict[str, Any]], Hashable] = make_key,
+) -> Any:
+    """Memoize ``func`` in a bounded :class:`Cache`.
+
+    Can be used bare (``@memoize``) or with options
+    (``@memoize(maxsize=1000, policy="lfu")``). The cache is exposed as
+    ``wrapper.cache`` and can be emptied with ``wrapper.cache_clear()``;
+    ``wrapper.cache_info()`` returns its hit/miss/eviction counters, compute
+    latencies and size as a dict (see :func:`dump_stats` for JSON).
+
+    If the cache provides ``get_or_compute`` (as :class:`ShardedCache` does),
+    misses go through it so concurrent callers share one computation.
+
+    Args:
+        func: The function to wrap (supplied automatically when used bare).
+        cache: An existing cache to store results in. When given, ``maxsize``,
+            ``policy``, ``maxbytes`` and ``ttl`` are ignored.
+        maxsize: Entry limit for the cache created for ``func``.
+        policy: Eviction policy for the cache created for ``func``.
+        maxbytes: Byte limit for the cache created for ``func``.
+        ttl: If given, results expire after this many seconds and the cache
+            created for ``func`` is a :class:`TTLCache`.
+        key: Function turning ``(args, kwargs)`` into a hashable cache key.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        store = _make_store(cache, maxsize, policy, ttl, maxbytes)
+        latency = _latency(store)
+        get_or_compute = getattr(store, "get_or_compute", None)
+
+        if get_or_compute is not None:
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return get_or_compute(
+                    key(args, kwargs), functools.partial(fn, *args, **kwargs)
+                )
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                k = key(args, kwargs)
+                value = store.get(k, MISSING)
+                if value is MISSING:
+                    start = time.perf_counter()
+                    value = fn(*args, **kwargs)
+                    latency.record(time.perf_counter() - start)
+                    store[k] = value
+                return value
+
+        _attach_cache(wrapper, store, latency)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
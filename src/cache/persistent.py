@@ -0,0 +1,333 @@
+"""
+Disk-backed cache storage so memoized results survive restarts.
+
+``SqliteStore`` keeps pickled keys and values in an sqlite file. The file is
+opened on first use rather than at import or construction, and writes are
+buffered and flushed in batches by a background thread. ``TieredCache`` puts an
+in-memory :class:`Cache` in front of it as a fast first level.
+
+Only load cache files you created yourself: values are unpickled on read.
+"""
+
+import atexit
+import io
+import pickle  # nosec B403 - the cache file is written by this process
+import sqlite3
+import threading
+import weakref
+from collections.abc import MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .base import MISSING
+from .stats import CacheStats
+
+_DELETED = object()
+
+
+class SqliteStore(MutableMapping):
+    """A persistent mapping stored in an sqlite file with write-behind.
+
+    Args:
+        path: Path of the sqlite database file.
+        table: Table holding the entries; lets several caches share a file.
+        flush_interval: Seconds between background flushes of buffered writes.
+        batch_size: Number of buffered writes that triggers an early flush.
+
+    Buffered writes are visible to readers of this object immediately. They
+    reach the file on the next flush, on :meth:`flush`, on :meth:`close` and
+    at interpreter exit. Values are pickled when they are stored, so an
+    unpicklable value fails there rather than in a later flush.
+
+    Keys are looked up by their pickled form. Numbers are normalised first,
+    also inside tuples, so ``1``, ``1.0`` and ``True`` are the same key (and
+    come back from iteration as ``1``), as in a ``dict``. Other keys that
+    compare equal but pickle differently, such as equal ``frozenset`` objects
+    built in a different order, are different keys here.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        flush_interval: float = 1.0,
+        batch_size: int = 512,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name {table!r}")
+        self.path = path
+        self.table = table
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        # Held for a whole flush, so batches reach the file in order; the
+        # transaction runs without holding ``_lock``.
+        self._write_lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # pickled key -> pickled value, or _DELETED
+        self._pending: Dict[bytes, Any] = {}
+        self._flushing: Dict[bytes, Any] = {}  # batch being written, still readable
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            if self._closed:
+                raise ValueError("store is closed")
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key BLOB PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+            atexit.register(_flush_at_exit, weakref.ref(self))
+        return self._conn
+
+    @staticmethod
+    def _dump(obj: Any) -> bytes:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _key(key: Hashable) -> bytes:
+        """The pickled form of ``key``, the same for keys that compare equal.
+
+        The pickler's memo is turned off, otherwise ``(a, a)`` and ``(a, b)``
+        pickle differently even when ``a == b``.
+        """
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.fast = True
+        pickler.dump(_canonical(key))
+        return buffer.getvalue()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        blob = self._key(key)
+        with self._lock:
+            value = self._pending.get(blob, MISSING)
+            if value is MISSING:
+                value = self._flushing.get(blob, MISSING)
+            if value is _DELETED:
+                return default
+            if value is MISSING:
+                row = (
+                    self._connection()
+                    .execute(f"SELECT value FROM {self.table} WHERE key = ?", (blob,))
+                    .fetchone()
+                )
+                if row is None:
+                    return default
+                value = row[0]
+        return pickle.loads(value)  # nosec B301
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._buffer(self._key(key), self._dump(value))
+
+    def __delitem__(self, key: Hashable) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._buffer(self._key(key), _DELETED)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, MISSING) is not MISSING  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        self.flush()
+        with self._lock:
+            rows = (
+                self._connection().execute(f"SELECT key FROM {self.table}").fetchall()
+            )
+        return (pickle.loads(row[0]) for row in rows)  # nosec B301
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            cursor = self._connection().execute(f"SELECT COUNT(*) FROM {self.table}")
+            return cursor.fetchone()[0]
+
+    def clear(self) -> None:
+        with self._write_lock, self._lock:
+            self._pending.clear()
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def _buffer(self, blob: bytes, value: object) -> None:
+        with self._lock:
+            self._connection()
+            self._pending[blob] = value
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=_write_behind,
+                    args=(weakref.ref(self), self._wakeup, self.flush_interval),
+                    name="SqliteStore-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write all buffered entries to the database in one transaction.
+
+        Only swapping out the buffer happens under the store's lock, so
+        buffered reads and writes carry on while the batch is committed. If
+        the commit fails, the batch goes back into the buffer, under any
+        newer writes, and the error is raised.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._pending or self._conn is None:
+                    return
+                batch = self._flushing = self._pending
+                self._pending = {}
+                conn = self._conn
+            upserts: List[Tuple[bytes, bytes]] = []
+            deletes: List[Tuple[bytes]] = []
+            for blob, value in batch.items():
+                if value is _DELETED:
+                    deletes.append((blob,))
+                else:
+                    upserts.append((blob, value))
+            try:
+                with conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO {self.table} (key, value) "
+                        "VALUES (?, ?)",
+                        upserts,
+                    )
+                    conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", deletes)
+            except BaseException:
+                with self._lock:
+                    for blob, value in batch.items():
+                        self._pending.setdefault(blob, value)
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def close(self) -> None:
+        """Flush buffered writes, stop the writer thread and close the file."""
+        with self._write_lock, self._lock:
+            self.flush()
+            self._closed = True
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._wakeup.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def __enter__(self) -> "SqliteStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _write_behind(
+    ref: "weakref.ref[SqliteStore]", wakeup: threading.Event, interval: float
+) -> None:
+    while True:
+        wakeup.wait(interval)
+        wakeup.clear()
+        store = ref()
+        if store is None or store._closed:
+            return
+        try:
+            store.flush()
+        except Exception:  # nosec B110 - the batch stays buffered for a retry
+            pass
+        del store
+
+
+def _canonical(key: Any) -> Any:
+    """``key`` with equal numbers in one form: ``True`` and ``1.0`` become ``1``."""
+    kind = type(key)
+    if kind is tuple:
+        return tuple(map(_canonical, key))
+    if kind is bool or (kind is float and key.is_integer()):
+        return int(key)
+    return key
+
+
+def _flush_at_exit(ref: "weakref.ref[SqliteStore]") -> None:
+    store = ref()
+    if store is not None and not store._closed:
+        store.flush()
+
+
+class TieredCache(MutableMapping):
+    """Two-level cache: a fast in-memory ``l1`` in front of a persistent ``l2``.
+
+    Reads try ``l1`` first and promote ``l2`` hits into it. Writes and
+    deletes go to both levels. :attr:`stats` counts a lookup as a hit if
+    either level had the key.
+
+    Args:
+        l1: In-memory cache, typically a bounded :class:`Cache`.
+        l2: Backing store, typically a :class:`SqliteStore`.
+    """
+
+    def __init__(self, l1: MutableMapping, l2: MutableMapping) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.l1.get(key, MISSING)
+        if value is not MISSING:
+            self.stats.hits += 1
+            return value
+        value = self.l2.get(key, MISSING)
+        if value is MISSING:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self.l1[key] = value
+        return value
+
+    def info(self) -> Dict[str, Any]:
+        """Return the statistics of this cache and its in-memory level."""
+        info = self.stats.to_dict()
+        info["entries"] = len(self.l2)
+        if hasattr(self.l1, "info"):
+            info["l1"] = self.l1.info()
+        return info
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.l1[key] = value
+        self.l2[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.l1.pop(key, None)
+        del self.l2[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.l1 or key in self.l2
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.l2)
+
+    def __len__(self) -> int:
+        return len(self.l2)
+
+    def clear(self) -> None:
+        self.l1.clear()
+        self.l2.clear()
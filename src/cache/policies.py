@@ -0,0 +1,141 @@
+"""
+Eviction policies for bounded caches.
+
+A policy only tracks keys; the cache owns the values. Every operation is O(1)
+so the policy never becomes the bottleneck on the cache hit path.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Type, Union
+
+
+class EvictionPolicy:
+    """Decides which key a bounded cache should drop next."""
+
+    name = "base"
+
+    def insert(self, key: Hashable) -> None:
+        """Record that ``key`` was added to the cache."""
+        raise NotImplementedError
+
+    def touch(self, key: Hashable) -> None:
+        """Record a hit on ``key``."""
+        raise NotImplementedError
+
+    def remove(self, key: Hashable) -> None:
+        """Forget ``key`` after it was deleted or evicted."""
+        raise NotImplementedError
+
+    def victim(self) -> Hashable:
+        """Return the key that should be evicted next."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Forget every tracked key."""
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    name = "lru"
+
+    def __init__(self) -> None:
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def insert(self, key: Hashable) -> None:
+        self._order[key] = None
+
+    def touch(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        del self._order[key]
+
+    def victim(self) -> Hashable:
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used key, oldest first among ties.
+
+    Keys live in per-frequency buckets, so a hit moves a key from bucket ``f``
+    to bucket ``f + 1`` in constant time instead of re-sorting anything.
+    """
+
+    name = "lfu"
+
+    def __init__(self) -> None:
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_freq = 0
+
+    def insert(self, key: Hashable) -> None:
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def touch(self, key: Hashable) -> None:
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        freq = self._freq.pop(key)
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+
+    def victim(self) -> Hashable:
+        if self._min_freq not in self._buckets:
+            # Only reached after an explicit delete emptied the lowest bucket.
+            self._min_freq = min(self._buckets)
+        return next(iter(self._buckets[self._min_freq]))
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    LRUPolicy.name: LRUPolicy,
+    LFUPolicy.name: LFUPolicy,
+}
+
+
+def make_policy(
+    policy: Union[str, EvictionPolicy, Type[EvictionPolicy]]
+) -> EvictionPolicy:
+    """Build a policy from a name, a policy class or an existing instance.
+
+    Args:
+        policy: ``"lru"``, ``"lfu"``, an :class:`EvictionPolicy` subclass or
+            an instance of one.
+
+    Returns:
+        A fresh (or the given) :class:`EvictionPolicy` instance.
+
+    Raises:
+        ValueError: If ``policy`` is an unknown name.
+    """
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    if isinstance(policy, type) and issubclass(policy, EvictionPolicy):
+        return policy()
+    try:
+        return POLICIES[policy]()
+    except KeyError:
+        raise ValueError(
+            f"unknown eviction policy {policy!r}; expected one of {sorted(POLICIES)}"
+        ) from None
@@ -0,0 +1,212 @@
+"""
+Thread-safe cache split into independently locked shards.
+
+Keys are spread over ``shards`` sub-caches by hash, so threads working on
+different keys rarely contend for the same lock. Concurrent misses for the same
+key are coalesced: one thread computes the value and the others wait for it.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from .base import MISSING, Cache
+from .stats import CacheStats, LatencyHistogram
+from .ttl import TTLCache
+
+
+class _Call:
+    """A computation in flight that other threads can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class _Shard:
+    __slots__ = ("lock", "cache", "inflight")
+
+    def __init__(self, cache: Cache) -> None:
+        self.lock = threading.Lock()
+        self.cache = cache
+        self.inflight: Dict[Hashable, _Call] = {}
+
+
+class ShardedCache(MutableMapping):
+    """A lock-striped cache with single-flight miss handling.
+
+    Args:
+        maxsize: Total entry limit, split evenly across shards, or ``None``.
+        shards: Number of independently locked shards.
+        policy: Eviction policy used inside each shard.
+        maxbytes: Total byte limit, split evenly across shards, or ``None``.
+        ttl: If given, entries expire after this many seconds.
+        sizeof: Function estimating the size of a value in bytes.
+
+    Eviction is per shard, so with a skewed key distribution a shard may
+    evict while others still have room.
+
+    Compute times measured by :meth:`get_or_compute` are kept per shard.
+    Callers that compute values themselves, such as ``async_memoize`` and
+    ``batch_memoize``, record into :attr:`latency`, which :attr:`stats`
+    includes.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1024,
+        shards: int = 16,
+        policy: Any = "lru",
+        maxbytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.latency = LatencyHistogram()
+        per_size = None if maxsize is None else max(1, -(-maxsize // shards))
+        per_bytes = None if maxbytes is None else max(1, -(-maxbytes // shards))
+        self._shards: List[_Shard] = []
+        for _ in range(shards):
+            if ttl is None:
+                cache = Cache(
+                    maxsize=per_size, policy=policy, maxbytes=per_bytes, sizeof=sizeof
+                )
+            else:
+                cache = TTLCache(
+                    maxsize=per_size,
+                    ttl=ttl,
+                    policy=policy,
+                    maxbytes=per_bytes,
+                    sizeof=sizeof,
+                )
+            self._shards.append(_Shard(cache))
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it once on a miss.
+
+        If several threads miss on the same key at the same time, only the
+        first one calls ``compute``; the rest block until it finishes and get
+        its result (or its exception). Failed computations are not cached.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            value = shard.cache.get(key, MISSING)
+            if value is not MISSING:
+                return value
+            call = shard.inflight.get(key)
+            leader = call is None
+            if leader:
+                call = shard.inflight[key] = _Call()
+        if not leader:
+            return call.wait()
+        start = time.perf_counter()
+        try:
+            value = compute()
+        except BaseException as exc:
+            call.error = exc
+            with shard.lock:
+                del shard.inflight[key]
+            call.done.set()
+            raise
+        elapsed = time.perf_counter() - start
+        with shard.lock:
+            shard.cache.stats.latency.record(elapsed)
+            shard.cache[key] = value
+            del shard.inflight[key]
+        call.value = value
+        call.done.set()
+        return value
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the statistics of all shards added together."""
+        stats = CacheStats.merged(shard.cache.stats for shard in self._shards)
+        stats.latency.merge(self.latency)
+        return stats
+
+    def info(self) -> Dict[str, Any]:
+        """Return the combined statistics and size of all shards as a dict.
+
+        ``bytes`` is ``None`` unless ``maxbytes`` is set, as for :class:`Cache`.
+        """
+        info = self.stats.to_dict()
+        if self.maxbytes is None:
+            size = None
+        else:
+            size = sum(shard.cache.currbytes for shard in self._shards)
+        info.update(
+            entries=len(self),
+            maxsize=self.maxsize,
+            bytes=size,
+            maxbytes=self.maxbytes,
+            shards=len(self._shards),
+        )
+        return info
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.cache.get(key, default)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.cache.peek(key, default)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.cache[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.cache[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            del shard.cache[key]
+
+    def __contains__(self, key: object) -> bool:
+        shard = self._shard(key)  # type: ignore[arg-type]
+        with shard.lock:
+            return key in shard.cache
+
+    def __iter__(self) -> Iterator[Hashable]:
+        keys: List[Hashable] = []
+        for shard in self._shards:
+            with shard.lock:
+                keys.extend(shard.cache)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(len(shard.cache) for shard in self._shards)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(maxsize={self.maxsize}, "
+            f"shards={len(self._shards)}, len={len(self)})"
+        )
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.cache.clear()
@@ -0,0 +1,151 @@
+"""
+Lightweight cache instrumentation.
+
+Counters are plain integer attributes and latencies go into fixed
+power-of-two buckets, so recording costs a few attribute updates and never
+allocates. Everything can be read programmatically or dumped as JSON.
+"""
+
+import json
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+_BUCKETS = 40  # 2**39 microseconds is about six days
+
+
+class LatencyHistogram:
+    """Histogram of durations in power-of-two microsecond buckets.
+
+    Bucket ``i`` counts durations below ``2**i`` microseconds (and at least
+    ``2**(i - 1)``), so percentiles are accurate to within a factor of two.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration, in seconds."""
+        index = int(seconds * 1e6).bit_length()
+        self.counts[index if index < _BUCKETS else _BUCKETS - 1] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound, in seconds, of the bucket holding the ``q`` quantile.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. ``0.99``.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of ``other`` into this histogram."""
+        for index, n in enumerate(other.counts):
+            self.counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_s": self.mean,
+            "max_s": self.max,
+            "p50_s": self.percentile(0.5),
+            "p90_s": self.percentile(0.9),
+            "p99_s": self.percentile(0.99),
+            "buckets_us": {
+                f"<{1 << index}": n for index, n in enumerate(self.counts) if n
+            },
+        }
+
+
+class CacheStats:
+    """Hit, miss, eviction and expiry counters plus compute latencies."""
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "latency")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Zero every counter and the latency histogram."""
+        self.__init__()  # type: ignore[misc]
+
+    @classmethod
+    def merged(cls, parts: Iterable["CacheStats"]) -> "CacheStats":
+        """Return a new ``CacheStats`` summing ``parts`` (e.g. cache shards)."""
+        total = cls()
+        for part in parts:
+            total.hits += part.hits
+            total.misses += part.misses
+            total.evictions += part.evictions
+            total.expirations += part.expirations
+            total.latency.merge(part.latency)
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "compute_latency": self.latency.to_dict(),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations})"
+        )
+
+
+def dump_stats(target: Any, fp: Optional[IO[str]] = None, indent: int = 2) -> str:
+    """Serialize the statistics of a cache or memoized function as JSON.
+
+    Args:
+        target: A memoized function (anything with ``cache_info()``) or a
+            cache with an ``info()`` method.
+        fp: If given, the JSON is also written to this text file.
+        indent: JSON indentation.
+
+    Returns:
+        The JSON document.
+    """
+    info = target.cache_info() if hasattr(target, "cache_info") else target.info()
+    text = json.dumps(info, indent=indent, sort_keys=True)
+    if fp is not None:
+        fp.write(text)
+    return text
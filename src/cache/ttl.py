@@ -0,0 +1,238 @@
+"""
+Cache with per-entry time-to-live expiry.
+
+Expired entries are dropped lazily when they are read, and optionally by a
+background sweeper thread that removes them in small batches so the cost of
+expiry stays off the lookup path.
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .base import Cache
+
+
+class TTLCache(Cache):
+    """A bounded :class:`Cache` whose entries expire after ``ttl`` seconds.
+
+    All operations take an internal lock so the sweeper thread can run
+    alongside callers. ``len()`` may include expired entries that have not
+    been swept yet; iteration and ``in`` never report them.
+
+    Args:
+        maxsize: Maximum number of entries, or ``None`` for no count limit.
+        ttl: Default lifetime of an entry in seconds.
+        policy: Eviction policy used when the cache is full.
+        maxbytes: Maximum total estimated size of the cached values.
+        sizeof: Function estimating the size of a value in bytes.
+        timer: Clock returning seconds; ``time.monotonic`` by default.
+        sweep_interval: If given, start a sweeper thread that wakes up every
+            ``sweep_interval`` seconds.
+        sweep_batch: Maximum number of entries removed per lock acquisition
+            while sweeping.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        ttl: float = 60.0,
+        policy: Any = "lru",
+        maxbytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        timer: Callable[[], float] = time.monotonic,
+        sweep_interval: Optional[float] = None,
+        sweep_batch: int = 256,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        super().__init__(
+            maxsize=maxsize, policy=policy, maxbytes=maxbytes, sizeof=sizeof
+        )
+        self.ttl = ttl
+        self.sweep_batch = sweep_batch
+        self._timer = timer
+        self._lock = threading.RLock()
+        self._expires: Dict[Hashable, float] = {}
+        # (deadline, tiebreak, key); entries whose deadline no longer matches
+        # ``_expires`` are stale and skipped when popped.
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        self._stop: Optional[threading.Event] = None
+        self._sweeper: Optional[threading.Thread] = None
+        if sweep_interval is not None:
+            self.start_sweeper(sweep_interval)
+
+    def _expired(self, key: Hashable, now: float) -> bool:
+        deadline = self._expires.get(key)
+        return deadline is not None and deadline <= now
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if self._expired(key, self._timer()):
+                self._expire_key(key)
+                self.stats.misses += 1
+                raise KeyError(key)
+            return super().__getitem__(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if self._expired(key, self._timer()):
+                self._expire_key(key)
+                self.stats.misses += 1
+                return default
+            return super().get(key, default)
+
+    def get_many(self, keys: Iterable[Hashable], default: Any = None) -> List[Any]:
+        with self._lock:
+            return [self.get(key, default) for key in keys]
+
+    def set_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        with self._lock:
+            for key, value in items:
+                self.set(key, value)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if self._expired(key, self._timer()):
+                return default
+            return super().peek(key, default)
+
+    def _expire_key(self, key: Hashable) -> None:
+        del self[key]
+        self.stats.expirations += 1
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (default ``self.ttl``)."""
+        deadline = self._timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key not in self._data and (
+                self.maxbytes is not None
+                or (self.maxsize is not None and len(self._data) >= self.maxsize)
+            ):
+                # Drop expired entries before the policy evicts a live one.
+                self.expire()
+            super().__setitem__(key, value)
+            if key not in self._data:
+                return  # value was too large to cache
+            self._expires[key] = deadline
+            heapq.heappush(self._heap, (deadline, next(self._counter), key))
+            if len(self._heap) > 2 * len(self._expires) + 64:
+                self._compact()
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            super().__delitem__(key)
+            del self._expires[key]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data and not self._expired(key, self._timer())
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            now = self._timer()
+            keys = [k for k in self._data if not self._expired(k, now)]
+        return iter(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._expires.clear()
+            self._heap.clear()
+
+    def popvictim(self) -> Tuple[Hashable, Any]:
+        with self._lock:
+            return super().popvictim()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            info = super().info()
+        info["ttl"] = self.ttl
+        return info
+
+    def expire(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        """Remove entries whose deadline has passed.
+
+        Args:
+            now: Time to compare deadlines against; defaults to ``timer()``.
+            limit: Stop after removing this many entries.
+
+        Returns:
+            The number of entries removed.
+        """
+        removed = 0
+        with self._lock:
+            if now is None:
+                now = self._timer()
+            heap = self._heap
+            while heap and heap[0][0] <= now and (limit is None or removed < limit):
+                deadline, _, key = heapq.heappop(heap)
+                if self._expires.get(key) == deadline:
+                    self._expire_key(key)
+                    removed += 1
+        return removed
+
+    def _compact(self) -> None:
+        """Rebuild the deadline heap without stale entries."""
+        self._heap = [(d, next(self._counter), k) for k, d in self._expires.items()]
+        heapq.heapify(self._heap)
+
+    def start_sweeper(self, interval: float) -> None:
+        """Start a daemon thread that expires entries every ``interval`` seconds.
+
+        The thread holds only a weak reference to the cache and exits once
+        the cache is garbage collected or :meth:`stop_sweeper` is called.
+        """
+        if self._sweeper is not None:
+            raise RuntimeError("sweeper already running")
+        stop = threading.Event()
+        self._stop = stop
+        self._sweeper = threading.Thread(
+            target=_sweep_loop,
+            args=(weakref.ref(self), stop, interval),
+            name="TTLCache-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the sweeper thread, if one is running, and wait for it."""
+        if self._sweeper is None:
+            return
+        self._stop.set()
+        self._sweeper.join()
+        self._sweeper = None
+        self._stop = None
+
+
+def _sweep_loop(
+    ref: "weakref.ref[TTLCache]", stop: threading.Event, interval: float
+) -> None:
+    while not stop.wait(interval):
+        cache = ref()
+        if cache is None:
+            return
+        # Release the lock between batches so lookups are never blocked for
+        # longer than one batch.
+        while cache.expire(limit=cache.sweep_batch) == cache.sweep_batch:
+            if stop.is_set():
+                return
+        del cache
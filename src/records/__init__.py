@@ -0,0 +1,34 @@
+"""
+Record and table utilities.
+
+Scalable versions of the grouping and filtering patterns used on lists of
+dicts in the learning materials.
+"""
+
+from .external import external_group_by
+from .groupby import AGGREGATIONS, GroupBy, factorize, group_by
+from .index import INDEXES, HashIndex, SortedIndex, make_index
+from .parallel import hash_partition, parallel_group_by
+from .query import OPERATORS, Plan, Predicate, Query, query
+from .store import RecordStore, Row
+
+__all__ = [
+    "AGGREGATIONS",
+    "INDEXES",
+    "OPERATORS",
+    "GroupBy",
+    "HashIndex",
+    "Plan",
+    "Predicate",
+    "Query",
+    "RecordStore",
+    "Row",
+    "SortedIndex",
+    "external_group_by",
+    "factorize",
+    "group_by",
+    "hash_partition",
+    "make_index",
+    "parallel_group_by",
+    "query",
+]
@@ -0,0 +1,227 @@
+"""
+Out-of-core group-by that spills to disk when a memory budget is exceeded.
+
+Rows are aggregated in memory until the estimated size of the partial
+results passes ``memory_limit``. The partial results are then hash-partitioned
+into temporary spill files and memory is cleared. At the end each partition
+holds a disjoint set of keys and is aggregated on its own, so only one
+partition's groups are in memory at a time. A partition that is still too
+large is split again with a different hash.
+
+Note that ``memory_limit`` bounds the estimated size of the buffered groups,
+as measured with ``sys.getsizeof``; the interpreter's total RSS will be
+somewhat higher.
+"""
+
+import os
+import pickle  # nosec B403 - spill files are written and read by this process
+import shutil
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .groupby import AGGREGATIONS
+
+_ENTRY_OVERHEAD = 64  # rough cost of a dict slot, including resize slack
+_MAX_DEPTH = 4
+
+
+def _append(state: List[Any], value: Any) -> List[Any]:
+    state.append(value)
+    return state
+
+
+def _extend(left: List[Any], right: List[Any]) -> List[Any]:
+    left.extend(right)
+    return left
+
+
+# name -> (start state from a value, add a value, merge two states, finalize)
+_AGGREGATORS: Dict[str, Tuple[Callable, Callable, Callable, Callable]] = {
+    "count": (lambda v: 1, lambda s, v: s + 1, lambda a, b: a + b, lambda s: s),
+    "sum": (lambda v: v, lambda s, v: s + v, lambda a, b: a + b, lambda s: s),
+    "mean": (
+        lambda v: (v, 1),
+        lambda s, v: (s[0] + v, s[1] + 1),
+        lambda a, b: (a[0] + b[0], a[1] + b[1]),
+        lambda s: s[0] / s[1],
+    ),
+    "min": (lambda v: v, min, min, lambda s: s),
+    "max": (lambda v: v, max, max, lambda s: s),
+    "collect": (lambda v: [v], _append, _extend, lambda s: s),
+}
+assert set(_AGGREGATORS) == set(AGGREGATIONS)  # nosec B101
+
+
+def _sizeof(state: Any) -> int:
+    """Estimated size of an aggregation state, including a list's or tuple's items."""
+    size = sys.getsizeof(state)
+    if isinstance(state, (list, tuple)):
+        size += sum(map(sys.getsizeof, state))
+    return size
+
+
+def _getter(field: Union[str, int, Callable[[Any], Any], None]) -> Callable[[Any], Any]:
+    if field is None:
+        return lambda row: row
+    if callable(field):
+        return field
+    return lambda row: row[field]
+
+
+class _Spiller:
+    """Hash-partitions ``(key, state)`` pairs into files under ``directory``."""
+
+    def __init__(self, directory: str, partitions: int, salt: int, prefix: str) -> None:
+        self.paths = [
+            os.path.join(directory, f"{prefix}-{i}.pickle") for i in range(partitions)
+        ]
+        self.salt = salt
+        self.used = False
+
+    def spill(self, groups: Dict[Any, Any]) -> None:
+        buckets: List[List[Tuple[Any, Any]]] = [[] for _ in self.paths]
+        n = len(self.paths)
+        for key, state in groups.items():
+            buckets[hash((self.salt, key)) % n].append((key, state))
+        for path, bucket in zip(self.paths, buckets):
+            if bucket:
+                with open(path, "ab") as fp:
+                    pickle.dump(bucket, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self.used = True
+
+
+def _read_spill(path: str) -> Iterator[Tuple[Any, Any]]:
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as fp:
+        while True:
+            try:
+                bucket = pickle.load(fp)  # nosec B301
+            except EOFError:
+                break
+            yield from bucket
+
+
+def external_group_by(
+    rows: Iterable[Any],
+    key: Union[str, int, Callable[[Any], Any]],
+    value: Union[str, int, Callable[[Any], Any], None] = None,
+    how: str = "collect",
+    memory_limit: int = 64 << 20,
+    partitions: int = 16,
+    tmpdir: Optional[str] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Group ``rows`` by ``key`` with bounded memory, yielding ``(key, result)``.
+
+    Without a spill the groups come out in first-seen order, like
+    :func:`~src.records.groupby.group_by`; after a spill they come out
+    partition by partition. Within a group, ``"collect"`` keeps row order.
+
+    Args:
+        rows: Any iterable of records, e.g. dicts or tuples; read once.
+        key: Field name or index of the group key, or a function of a row.
+        value: Field name, index or function giving the aggregated value;
+            the whole row by default.
+        how: One of ``count``, ``sum``, ``mean``, ``min``, ``max``,
+            ``collect``.
+        memory_limit: Budget in bytes for the in-memory partial groups. A
+            group's key and state are measured when the group is created and
+            every value ``"collect"`` adds is counted as well, but other
+            states are not measured again as they change (a ``"sum"`` of
+            ever larger numbers, say).
+        partitions: Number of spill files per level.
+        tmpdir: Directory for spill files; the system default if ``None``.
+
+    Raises:
+        ValueError: For an unknown aggregation or fewer than one partition,
+            when called rather than when iteration starts.
+    """
+    if how not in _AGGREGATORS:
+        raise ValueError(f"unknown aggregation {how!r}; expected one of {AGGREGATIONS}")
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    return _external_group_by(rows, key, value, how, memory_limit, partitions, tmpdir)
+
+
+def _external_group_by(
+    rows: Iterable[Any],
+    key: Union[str, int, Callable[[Any], Any]],
+    value: Union[str, int, Callable[[Any], Any], None],
+    how: str,
+    memory_limit: int,
+    partitions: int,
+    tmpdir: Optional[str],
+) -> Iterator[Tuple[Any, Any]]:
+    start, add, merge, final = _AGGREGATORS[how]
+    get_key = _getter(key)
+    get_value = _getter(value)
+    collecting = how == "collect"
+    directory = tempfile.mkdtemp(prefix="groupby-", dir=tmpdir)
+    try:
+        spiller = _Spiller(directory, partitions, salt=0, prefix="part")
+        groups: Dict[Any, Any] = {}
+        used = 0
+        for row in rows:
+            k = get_key(row)
+            v = get_value(row)
+            state = groups.get(k)
+            if state is None and k not in groups:
+                state = groups[k] = start(v)
+                used += sys.getsizeof(k) + _sizeof(state) + _ENTRY_OVERHEAD
+            else:
+                groups[k] = add(state, v)
+                if collecting:
+                    used += sys.getsizeof(v) + 8
+            if used > memory_limit:
+                spiller.spill(groups)
+                groups.clear()
+                used = 0
+        if not spiller.used:
+            for k, state in groups.items():
+                yield k, final(state)
+            return
+        spiller.spill(groups)
+        groups.clear()
+        yield from _merge_partitions(spiller, merge, final, memory_limit, 1)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _merge_partitions(
+    spiller: _Spiller,
+    merge: Callable[[Any, Any], Any],
+    final: Callable[[Any], Any],
+    memory_limit: int,
+    depth: int,
+) -> Iterator[Tuple[Any, Any]]:
+    directory = os.path.dirname(spiller.paths[0])
+    for path in spiller.paths:
+        groups: Dict[Any, Any] = {}
+        used = 0
+        sub: Optional[_Spiller] = None
+        for k, state in _read_spill(path):
+            if k in groups:
+                groups[k] = merge(groups[k], state)
+                if isinstance(state, list):
+                    used += _sizeof(state)
+            else:
+                groups[k] = state
+                used += sys.getsizeof(k) + _sizeof(state) + _ENTRY_OVERHEAD
+            if used > memory_limit and depth < _MAX_DEPTH:
+                # Still too big: split this partition again with a new hash.
+                if sub is None:
+                    prefix = os.path.splitext(path)[0]
+                    sub = _Spiller(directory, len(spiller.paths), depth, prefix)
+                sub.spill(groups)
+                groups.clear()
+                used = 0
+        if os.path.exists(path):
+            os.remove(path)
+        if sub is not None:
+            sub.spill(groups)
+            groups.clear()
+            yield from _merge_partitions(sub, merge, final, memory_limit, depth + 1)
+            continue
+        for k, state in groups.items():
+            yield k, final(state)
@@ -0,0 +1,223 @@
+"""
+Columnar group-by with vectorized aggregations.
+
+The key column is factorized once into dense integer group codes (in
+first-seen order), and every aggregation is then a pass over the codes and
+a value column instead of a per-row dict lookup. NumPy arrays take NumPy
+code paths when NumPy is installed; plain sequences use tight Python loops.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max", "collect")
+
+
+def factorize(keys: Sequence[Any]) -> Tuple[Any, List[Any]]:
+    """Map each key to a dense group code, numbered in first-seen order.
+
+    Returns:
+        ``(codes, uniques)`` where ``uniques[codes[i]] == keys[i]``. ``codes``
+        is an int64 NumPy array for NumPy input and an ``array('q')``
+        otherwise.
+    """
+    numpy_keys = np is not None and isinstance(keys, np.ndarray)
+    if numpy_keys and keys.dtype.kind in "biufcmM":
+        uniques, first, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return rank[inverse.ravel()], uniques[order].tolist()
+    # Strings and objects: hashing beats sorting them.
+    ids: Dict[Any, int] = {}
+    setdefault = ids.setdefault
+    if numpy_keys:
+        codes = np.fromiter(
+            (setdefault(key, len(ids)) for key in keys.tolist()),
+            dtype=np.int64,
+            count=len(keys),
+        )
+    else:
+        codes = array("q", [setdefault(key, len(ids)) for key in keys])
+    return codes, list(ids)
+
+
+class GroupBy:
+    """Group rows by a key column and aggregate value columns.
+
+    Args:
+        keys: The key column (a sequence or NumPy array).
+
+    Example::
+
+        by_grade = GroupBy([s["grade"] for s in students])
+        by_grade.collect([s["name"] for s in students])
+        # {"A": ["Alice", "Charlie"], "B": ["Bob", "Eve"], "C": ["Diana"]}
+    """
+
+    def __init__(self, keys: Sequence[Any]) -> None:
+        self.codes, self.keys = factorize(keys)
+        self._numpy = np is not None and isinstance(self.codes, np.ndarray)
+        self._order: Optional[Tuple[Any, Any]] = None
+
+    @property
+    def ngroups(self) -> int:
+        return len(self.keys)
+
+    def _column(self, values: Sequence[Any]) -> Any:
+        if len(values) != len(self.codes):
+            raise ValueError(
+                f"value column has {len(values)} rows, key column {len(self.codes)}"
+            )
+        if self._numpy and not isinstance(values, np.ndarray):
+            return np.asarray(values)
+        return values
+
+    def _sorted(self) -> Tuple[Any, Any]:
+        """Row order that makes groups contiguous, and each group's start."""
+        if self._order is None:
+            order = np.argsort(self.codes, kind="stable")
+            sorted_codes = self.codes[order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            self._order = (order, starts)
+        return self._order
+
+    def _result(self, per_group: Any) -> Dict[Any, Any]:
+        if self._numpy and isinstance(per_group, np.ndarray):
+            per_group = per_group.tolist()
+        return dict(zip(self.keys, per_group))
+
+    def count(self) -> Dict[Any, int]:
+        """Number of rows per group."""
+        return self._result(self._counts())
+
+    def _counts(self) -> Any:
+        if self._numpy:
+            return np.bincount(self.codes, minlength=self.ngroups)
+        counts = [0] * self.ngroups
+        for code in self.codes:
+            counts[code] += 1
+        return counts
+
+    def _sums(self, values: Any) -> Any:
+        if self._numpy:
+            if values.dtype.kind == "f":
+                return np.bincount(self.codes, weights=values, minlength=self.ngroups)
+            # Like np.sum: small integers add up in int64 (uint64 if
+            # unsigned) so they do not wrap, and booleans count as 0 and 1.
+            kind = values.dtype.kind
+            if kind in "bi":
+                dtype = np.dtype(np.int64)
+            elif kind == "u":
+                dtype = np.dtype(np.uint64)
+            else:
+                dtype = values.dtype
+            sums = np.zeros(self.ngroups, dtype=dtype)
+            np.add.at(sums, self.codes, values)
+            return sums
+        sums = [0] * self.ngroups
+        for code, value in zip(self.codes, values):
+            sums[code] += value
+        return sums
+
+    def sum(self, values: Sequence[Any]) -> Dict[Any, Any]:
+        """Sum of ``values`` per group."""
+        return self._result(self._sums(self._column(values)))
+
+    def mean(self, values: Sequence[Any]) -> Dict[Any, float]:
+        """Arithmetic mean of ``values`` per group."""
+        sums = self._sums(self._column(values))
+        counts = self._counts()
+        if self._numpy:
+            return self._result(sums / counts)
+        return self._result([s / n for s, n in zip(sums, counts)])
+
+    def _extreme(self, values: Sequence[Any], smallest: bool) -> Dict[Any, Any]:
+        values = self._column(values)
+        if not self.ngroups:
+            return {}  # reduceat cannot reduce an empty array
+        if self._numpy:
+            order, starts = self._sorted()
+            ufunc = np.minimum if smallest else np.maximum
+            return self._result(ufunc.reduceat(values[order], starts))
+        best: List[Any] = [None] * self.ngroups
+        seen = [False] * self.ngroups
+        for code, value in zip(self.codes, values):
+            if not seen[code]:
+                best[code] = value
+                seen[code] = True
+            elif (value < best[code]) if smallest else (value > best[code]):
+                best[code] = value
+        return self._result(best)
+
+    def min(self, values: Sequence[Any]) -> Dict[Any, Any]:
+        """Smallest of ``values`` per group."""
+        return self._extreme(values, smallest=True)
+
+    def max(self, values: Sequence[Any]) -> Dict[Any, Any]:
+        """Largest of ``values`` per group."""
+        return self._extreme(values, smallest=False)
+
+    def collect(self, values: Sequence[Any]) -> Dict[Any, List[Any]]:
+        """List of ``values`` per group, in row order."""
+        values = self._column(values)
+        if self._numpy:
+            order, starts = self._sorted()
+            parts = np.split(values[order], starts[1:])
+            return dict(zip(self.keys, (part.tolist() for part in parts)))
+        groups: List[List[Any]] = [[] for _ in range(self.ngroups)]
+        for code, value in zip(self.codes, values):
+            groups[code].append(value)
+        return dict(zip(self.keys, groups))
+
+    def agg(
+        self,
+        values: Optional[Sequence[Any]] = None,
+        how: Union[str, Sequence[str]] = "collect",
+    ) -> Dict[Any, Any]:
+        """Aggregate ``values`` by name.
+
+        Args:
+            values: The value column; not needed for ``"count"``.
+            how: One of :data:`AGGREGATIONS`, or a list of them, in which
+                case each group maps to ``{aggregation: result}``.
+
+        Raises:
+            ValueError: For unknown aggregations or a missing value column.
+        """
+        if isinstance(how, str):
+            return self._aggregate(values, how)
+        results = {name: self._aggregate(values, name) for name in how}
+        return {key: {name: results[name][key] for name in how} for key in self.keys}
+
+    def _aggregate(self, values: Optional[Sequence[Any]], how: str) -> Dict[Any, Any]:
+        if how not in AGGREGATIONS:
+            raise ValueError(
+                f"unknown aggregation {how!r}; expected one of {AGGREGATIONS}"
+            )
+        if how == "count":
+            return self.count()
+        if values is None:
+            raise ValueError(f"aggregation {how!r} needs a value column")
+        return getattr(self, how)(values)
+
+
+def group_by(
+    keys: Sequence[Any],
+    values: Optional[Sequence[Any]] = None,
+    how: Union[str, Sequence[str]] = "collect",
+) -> Dict[Any, Any]:
+    """Group ``values`` by ``keys`` and aggregate each group.
+
+    ``group_by(categories, names)`` returns the same ``{key: [values...]}``
+    dict, in first-seen key order, as the ``setdefault(key, []).append(...)``
+    loops in the learning materials.
+    """
+    return GroupBy(keys).agg(values, how)
@@ -0,0 +1,214 @@
+"""
+Secondary indexes over the fields of a :class:`~src.records.store.RecordStore`.
+
+An index maps field values to row positions. :class:`SortedIndex` keeps the
+values in sorted order and answers range queries such as ``grade >= 90``
+with two bisections, in ``O(log n + k)`` for ``k`` matches.
+:class:`HashIndex` answers equality lookups in ``O(1 + k)``. The store keeps
+its indexes up to date as rows are appended, changed and deleted.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Type, Union
+
+
+def _shift_down(positions: array, removed: int) -> array:
+    """Renumber ``positions`` after the row at ``removed`` was deleted."""
+    return array("q", [p - 1 if p > removed else p for p in positions])
+
+
+class SortedIndex:
+    """Field values in sorted order, each with the position of its row.
+
+    Entries are ordered by ``(value, position)``, so every lookup returns
+    positions in row order for equal values. Values must be mutually
+    comparable.
+    """
+
+    kind = "sorted"
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._values: List[Any] = []
+        self._rows = array("q")
+
+    def build(self, values: Iterable[Any]) -> None:
+        """Replace the contents with ``values``, the field's column in row order."""
+        pairs = sorted((value, row) for row, value in enumerate(values))
+        self._values = [value for value, _ in pairs]
+        self._rows = array("q", [row for _, row in pairs])
+
+    def _locate(self, value: Any, row: int) -> int:
+        lo = bisect_left(self._values, value)
+        hi = bisect_right(self._values, value, lo)
+        return bisect_left(self._rows, row, lo, hi)
+
+    def add(self, value: Any, row: int) -> None:
+        """Record that the row at ``row`` holds ``value``."""
+        at = self._locate(value, row)
+        self._values.insert(at, value)
+        self._rows.insert(at, row)
+
+    def discard(self, value: Any, row: int) -> None:
+        """Forget that the row at ``row`` holds ``value``."""
+        at = self._locate(value, row)
+        if at < len(self._rows) and self._rows[at] == row:
+            del self._values[at]
+            del self._rows[at]
+
+    def delete_row(self, value: Any, row: int) -> None:
+        """Remove the row at ``row`` and renumber the rows after it."""
+        self.discard(value, row)
+        self._rows = _shift_down(self._rows, row)
+
+    def _bounds(
+        self,
+        low: Any,
+        high: Any,
+        include_low: bool,
+        include_high: bool,
+    ) -> slice:
+        values = self._values
+        if low is None:
+            start = 0
+        else:
+            start = (bisect_left if include_low else bisect_right)(values, low)
+        if high is None:
+            stop = len(values)
+        else:
+            stop = (bisect_right if include_high else bisect_left)(values, high, start)
+        return slice(start, max(start, stop))
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> List[int]:
+        """Positions of rows with ``low <= value <= high``, ordered by value.
+
+        Args:
+            low: Lower bound, or ``None`` for no lower bound.
+            high: Upper bound, or ``None`` for no upper bound.
+            include_low: Whether ``value == low`` matches.
+            include_high: Whether ``value == high`` matches.
+        """
+        return self._rows[self._bounds(low, high, include_low, include_high)].tolist()
+
+    def iter_range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> Iterator[int]:
+        """Lazily yield the positions :meth:`range` returns, in value order.
+
+        The index must not change while the iterator is in use.
+        """
+        bounds = self._bounds(low, high, include_low, include_high)
+        rows = self._rows
+        for i in range(bounds.start, bounds.stop):
+            yield rows[i]
+
+    def count_range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> int:
+        """Number of rows :meth:`range` would return, in ``O(log n)``."""
+        bounds = self._bounds(low, high, include_low, include_high)
+        return bounds.stop - bounds.start
+
+    def lookup(self, value: Any) -> List[int]:
+        """Positions of rows whose value equals ``value``, in row order."""
+        return self.range(value, value)
+
+    def count(self, value: Any) -> int:
+        return self.count_range(value, value)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class HashIndex:
+    """Field values mapped to the positions of the rows holding them."""
+
+    kind = "hash"
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._rows: Dict[Hashable, array] = {}
+
+    def build(self, values: Iterable[Hashable]) -> None:
+        """Replace the contents with ``values``, the field's column in row order."""
+        self._rows = {}
+        for row, value in enumerate(values):
+            self._rows.setdefault(value, array("q")).append(row)
+
+    def add(self, value: Hashable, row: int) -> None:
+        """Record that the row at ``row`` holds ``value``."""
+        rows = self._rows.setdefault(value, array("q"))
+        rows.insert(bisect_left(rows, row), row)
+
+    def discard(self, value: Hashable, row: int) -> None:
+        """Forget that the row at ``row`` holds ``value``."""
+        rows = self._rows.get(value)
+        if rows is None:
+            return
+        at = bisect_left(rows, row)
+        if at < len(rows) and rows[at] == row:
+            del rows[at]
+            if not rows:
+                del self._rows[value]
+
+    def delete_row(self, value: Hashable, row: int) -> None:
+        """Remove the row at ``row`` and renumber the rows after it."""
+        self.discard(value, row)
+        for key, rows in self._rows.items():
+            if rows and rows[-1] > row:
+                self._rows[key] = _shift_down(rows, row)
+
+    def lookup(self, value: Hashable) -> List[int]:
+        """Positions of rows whose value equals ``value``, in row order."""
+        rows = self._rows.get(value)
+        return rows.tolist() if rows is not None else []
+
+    def count(self, value: Hashable) -> int:
+        rows = self._rows.get(value)
+        return len(rows) if rows is not None else 0
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct values."""
+        return len(self._rows)
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._rows.values())
+
+
+Index = Union[SortedIndex, HashIndex]
+
+INDEXES: Dict[str, Type[Index]] = {
+    "hash": HashIndex,
+    "sorted": SortedIndex,
+}
+
+
+def make_index(field: str, kind: str = "sorted") -> Index:
+    """Create an empty index on ``field`` by kind name.
+
+    Raises:
+        ValueError: If ``kind`` is unknown.
+    """
+    try:
+        cls = INDEXES[kind]
+    except KeyError:
+        raise ValueError(
+            f"unknown index kind {kind!r}; expected one of {sorted(INDEXES)}"
+        ) from None
+    return cls(field)
@@ -0,0 +1,420 @@
+"""
+Declarative queries with a small cost-based planner.
+
+A comprehension such as ``[s["name"] for s in students if s["grade"] >= 90]``
+hides its filter in an expression Python cannot inspect. :class:`Query`
+spells the same thing out as data::
+
+    query(students).where("grade", ">=", 90).select("name").run()
+
+so a planner can use a secondary index for the most selective indexed
+predicate, test the remaining predicates most selective first, and stop as
+soon as ``limit`` rows are found. :meth:`Query.explain` shows the plan.
+Queries work on a :class:`~src.records.store.RecordStore` (with its
+indexes) and on any sequence of dicts (by scanning).
+"""
+
+import heapq
+import operator
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from .store import RecordStore
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, options: value in options,
+    "startswith": lambda value, prefix: value.startswith(prefix),
+}
+
+# Fraction of rows assumed to pass a predicate no index can measure.
+_GUESSED_SELECTIVITY = {
+    "==": 0.1,
+    "!=": 0.9,
+    "<": 0.33,
+    "<=": 0.33,
+    ">": 0.33,
+    ">=": 0.33,
+    "in": 0.2,
+    "startswith": 0.25,
+    None: 0.5,  # opaque callables
+}
+
+_RANGES = {
+    "<": (False, False),
+    "<=": (False, True),
+    ">": (True, False),
+    ">=": (True, True),
+}
+
+
+class Predicate:
+    """One ``field op value`` condition, or an opaque ``row -> bool`` test."""
+
+    __slots__ = ("field", "op", "value", "test")
+
+    def __init__(
+        self,
+        field: Union[str, Callable[[Any], bool]],
+        op: Optional[str] = None,
+        value: Any = None,
+    ) -> None:
+        if callable(field):
+            self.field: Optional[str] = None
+            self.op: Optional[str] = None
+            self.value = None
+            self.test: Callable[[Any], bool] = field
+            return
+        if op not in OPERATORS:
+            raise ValueError(
+                f"unknown operator {op!r}; expected one of {sorted(OPERATORS)}"
+            )
+        compare = OPERATORS[op]
+        self.field = field
+        self.op = op
+        self.value = value
+        self.test = lambda v: compare(v, value)
+
+    def __repr__(self) -> str:
+        if self.field is None:
+            return f"<{getattr(self.test, '__name__', 'callable')}>"
+        return f"{self.field} {self.op} {self.value!r}"
+
+
+def _prefix_end(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with ``prefix``."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+class _Access:
+    """How candidate rows are produced: by a scan or from one index."""
+
+    def __init__(
+        self,
+        description: str,
+        estimate: float,
+        rows: Callable[[], Iterator[int]],
+        predicate: Optional[Predicate] = None,
+        ordered_by: Optional[str] = None,
+    ) -> None:
+        self.description = description
+        self.estimate = estimate
+        self.rows = rows
+        self.predicate = predicate
+        self.ordered_by = ordered_by
+
+
+class Plan:
+    """The steps a query will run, with row estimates; see ``str(plan)``."""
+
+    def __init__(
+        self,
+        access: _Access,
+        filters: List[Any],
+        order: str,
+        limit: Optional[int],
+        estimate: float,
+    ) -> None:
+        self.access = access
+        self.filters = filters  # (predicate, selectivity, exact) tuples
+        self.order = order
+        self.limit = limit
+        self.estimate = estimate
+
+    def __str__(self) -> str:
+        lines = [
+            f"access: {self.access.description} (est. {self.access.estimate:.1f} rows)"
+        ]
+        for predicate, selectivity, exact in self.filters:
+            how = "measured" if exact else "guessed"
+            lines.append(
+                f"filter: {predicate!r} (selectivity {selectivity:.2f}, {how})"
+            )
+        lines.append(f"order: {self.order}")
+        if self.limit is not None:
+            lines.append(f"limit: {self.limit}")
+        lines.append(f"estimated rows: {self.estimate:.1f}")
+        return "\n".join(lines)
+
+
+class Query:
+    """A query over a record store or a sequence of dicts.
+
+    The builder methods change the query and return it, so calls chain.
+    Conditions given to :meth:`where` are combined with "and".
+
+    Args:
+        rows: A :class:`~src.records.store.RecordStore` or a sequence of
+            mappings.
+    """
+
+    def __init__(self, rows: Sequence[Any]) -> None:
+        self._rows = rows
+        self._predicates: List[Predicate] = []
+        self._fields: Optional[Sequence[str]] = None
+        self._order: Optional[str] = None
+        self._descending = False
+        self._limit: Optional[int] = None
+
+    def where(
+        self,
+        field: Union[str, Callable[[Any], bool]],
+        op: str = "==",
+        value: Any = None,
+    ) -> "Query":
+        """Keep rows where ``row[field] op value`` holds.
+
+        ``op`` is one of :data:`OPERATORS`; ``"startswith"`` accepts a
+        prefix or a tuple of prefixes, like :meth:`str.startswith`. A
+        callable ``field`` is used as an opaque ``row -> bool`` filter that
+        the planner cannot index or estimate.
+        """
+        self._predicates.append(Predicate(field, op, value))
+        return self
+
+    def select(self, *fields: str) -> "Query":
+        """Return dicts of just ``fields`` (a single field: bare values)."""
+        self._fields = fields
+        return self
+
+    def order_by(self, field: str, descending: bool = False) -> "Query":
+        self._order = field
+        self._descending = descending
+        return self
+
+    def limit(self, n: int) -> "Query":
+        self._limit = n
+        return self
+
+    def _getter(self, field: str) -> Callable[[int], Any]:
+        if isinstance(self._rows, RecordStore):
+            return self._rows.column(field).__getitem__
+        rows = self._rows
+        return lambda i: rows[i][field]
+
+    def _index(self, field: Optional[str], kind: Optional[str] = None) -> Any:
+        if field is None or not isinstance(self._rows, RecordStore):
+            return None
+        return self._rows.get_index(field, kind)
+
+    def _index_access(self, predicate: Predicate) -> Optional[_Access]:
+        """An access path for ``predicate`` through an index, if one exists."""
+        op, value, field = predicate.op, predicate.value, predicate.field
+        ordered = self._index(field, "sorted")
+        exact = self._index(field, "hash")
+        if exact is None:
+            exact = ordered
+        if op == "==" and exact is not None:
+            return _Access(
+                f"{exact.kind} index on {field} == {value!r}",
+                exact.count(value),
+                lambda: iter(exact.lookup(value)),
+                predicate,
+            )
+        if op == "in" and exact is not None and not isinstance(value, str):
+            options = list(dict.fromkeys(value))
+            return _Access(
+                f"{exact.kind} index on {field} in {options!r}",
+                sum(exact.count(v) for v in options),
+                lambda: iter(sorted(i for v in options for i in exact.lookup(v))),
+                predicate,
+            )
+        if ordered is None:
+            return None
+        if op in _RANGES:
+            is_low, inclusive = _RANGES[op]
+            low, high = (value, None) if is_low else (None, value)
+            bounds = dict(include_low=inclusive, include_high=inclusive)
+            return _Access(
+                f"sorted index range on {field} {op} {value!r}",
+                ordered.count_range(low, high, **bounds),
+                lambda: ordered.iter_range(low, high, **bounds),
+                predicate,
+                ordered_by=field,
+            )
+        if op == "startswith":
+            prefixes = _covering_prefixes([value] if isinstance(value, str) else value)
+            ranges = [(p, _prefix_end(p)) for p in prefixes]
+
+            def rows() -> Iterator[int]:
+                for low, high in ranges:
+                    yield from ordered.iter_range(low, high, True, False)
+
+            return _Access(
+                f"sorted index prefix on {field} startswith {value!r}",
+                sum(ordered.count_range(lo, hi, True, False) for lo, hi in ranges),
+                rows,
+                predicate,
+                ordered_by=field,
+            )
+        return None
+
+    def _checked_index_access(self, predicate: Predicate) -> Optional[_Access]:
+        """:meth:`_index_access`, or ``None`` if the index cannot order ``value``.
+
+        A sorted index bisects, so a value of another type than its keys
+        raises ``TypeError``, while a scan just finds no rows for ``==`` or
+        ``in``. Falling back to a scan keeps the results the same either way.
+        """
+        try:
+            return self._index_access(predicate)
+        except TypeError:
+            return None
+
+    def plan(self) -> Plan:
+        """Choose an access path, filter order and ordering strategy."""
+        total = len(self._rows)
+        accesses = [
+            access
+            for access in map(self._checked_index_access, self._predicates)
+            if access is not None
+        ]
+        best = min(accesses, key=lambda a: a.estimate, default=None)
+        order_index = self._index(self._order, "sorted")
+        if best is not None:
+            access = best
+        elif order_index is not None and not self._descending:
+            access = _Access(
+                f"sorted index scan on {self._order}",
+                total,
+                lambda: order_index.iter_range(),
+                ordered_by=self._order,
+            )
+        else:
+            access = _Access("full scan", total, lambda: iter(range(total)))
+
+        filters = []
+        for predicate in self._predicates:
+            if predicate is access.predicate:
+                continue
+            measured = next((a for a in accesses if a.predicate is predicate), None)
+            if measured is not None:
+                selectivity, exact = measured.estimate / max(total, 1), True
+            else:
+                selectivity, exact = _GUESSED_SELECTIVITY[predicate.op], False
+            filters.append((predicate, selectivity, exact))
+        # Most selective first; opaque callables last, as their cost is unknown.
+        filters.sort(key=lambda f: (f[0].field is None, f[1]))
+
+        estimate = float(access.estimate)
+        for _, selectivity, _ in filters:
+            estimate *= selectivity
+        if self._limit is not None:
+            estimate = min(estimate, self._limit)
+
+        if self._order is None:
+            order = "row order"
+            if access.ordered_by is not None:
+                order += " (index positions re-sorted)"
+        elif access.ordered_by == self._order and not self._descending:
+            order = f"{self._order} ascending, from the index"
+        else:
+            direction = "descending" if self._descending else "ascending"
+            how = "top-k heap" if self._limit is not None else "sort"
+            order = f"{self._order} {direction}, {how}"
+        return Plan(access, filters, order, self._limit, estimate)
+
+    def explain(self) -> str:
+        """Describe the chosen plan and its estimated row counts."""
+        return str(self.plan())
+
+    def _positions(self, plan: Plan) -> Iterator[int]:
+        tests = [
+            (self._getter(p.field), p.test) if p.field is not None else (None, p.test)
+            for p, _, _ in plan.filters
+        ]
+        rows = self._rows
+        candidates = plan.access.rows()
+        if plan.access.ordered_by is not None and self._order is None:
+            candidates = iter(sorted(candidates))  # back to row order
+        for i in candidates:
+            for get, test in tests:
+                if not test(get(i) if get is not None else rows[i]):
+                    break
+            else:
+                yield i
+
+    def _output(self, positions: Iterator[int]) -> Iterator[Any]:
+        rows = self._rows
+        if self._fields is None:
+            if isinstance(rows, RecordStore):
+                return iter(rows.take(positions))
+            return (rows[i] for i in positions)
+        getters = [self._getter(field) for field in self._fields]
+        if len(getters) == 1:
+            get = getters[0]
+            return (get(i) for i in positions)
+        fields = self._fields
+        return ({f: g(i) for f, g in zip(fields, getters)} for i in positions)
+
+    def __iter__(self) -> Iterator[Any]:
+        plan = self.plan()
+        positions = self._positions(plan)
+        limit = self._limit
+        if self._order is not None and not (
+            plan.access.ordered_by == self._order and not self._descending
+        ):
+            key = self._getter(self._order)
+            if plan.access.ordered_by is not None:
+                # Candidates come in another field's order: break ties on
+                # the position so equal values stay in row order.
+                get, sign = key, -1 if self._descending else 1
+
+                def key(i: int) -> Any:
+                    return get(i), sign * i
+
+            if limit is not None:
+                pick = heapq.nlargest if self._descending else heapq.nsmallest
+                positions = iter(pick(limit, positions, key=key))
+            else:
+                positions = iter(sorted(positions, key=key, reverse=self._descending))
+        elif limit is not None:
+            positions = _take(positions, limit)
+        return self._output(positions)
+
+    def run(self) -> List[Any]:
+        """Execute the query and return the results as a list."""
+        return list(self)
+
+    def count(self) -> int:
+        """Number of matching rows, ignoring ``select`` and ``order_by``."""
+        n = sum(1 for _ in self._positions(self.plan()))
+        return n if self._limit is None else min(n, self._limit)
+
+    def first(self) -> Any:
+        """The first result, or ``None`` if nothing matches."""
+        return next(iter(self), None)
+
+
+def _take(positions: Iterator[int], n: int) -> Iterator[int]:
+    for count, i in enumerate(positions):
+        if count >= n:
+            return
+        yield i
+
+
+def _covering_prefixes(prefixes: Sequence[str]) -> List[str]:
+    """Sorted prefixes with those implied by a shorter one dropped.
+
+    The remaining prefixes select disjoint, increasing ranges of a sorted
+    index, so reading them in turn yields each row once, in value order.
+    """
+    kept: List[str] = []
+    for prefix in sorted(set(prefixes)):
+        if not (kept and prefix.startswith(kept[-1])):
+            kept.append(prefix)
+    return kept
+
+
+def query(rows: Sequence[Any]) -> Query:
+    """Start a :class:`Query` over a record store or a sequence of dicts."""
+    return Query(rows)
@@ -0,0 +1,347 @@
+"""
+Column-oriented record storage with dict-like row views.
+
+A list of ``{"name": ..., "grade": ...}`` dicts pays for a hash table per row.
+:class:`RecordStore` fixes the field names once and keeps each field in a
+typed column instead: numbers in ``array`` buffers and strings as integer
+codes into a table of distinct values. Rows are handed out as small
+:class:`Row` views that read through to the columns, so code written for the
+list of dicts, such as ``[s["name"] for s in students if s["grade"] >= 90]``,
+works unchanged. Secondary indexes (:mod:`~src.records.index`) created with
+:meth:`RecordStore.create_index` are kept up to date on every change.
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .index import Index, make_index
+
+# Python type -> array typecode; str columns are dictionary-encoded.
+_TYPECODES = {int: "q", float: "d", bool: "b"}
+
+FieldType = Union[type, str]
+
+
+def _check(value: Any, kind: type) -> None:
+    if not isinstance(value, kind):
+        raise TypeError(f"expected {kind.__name__}, got {type(value).__name__}")
+
+
+class _StrColumn:
+    """Strings stored as ``array('q')`` codes into a list of distinct values."""
+
+    __slots__ = ("codes", "values", "_ids")
+
+    def __init__(self) -> None:
+        self.codes = array("q")
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def _id(self, value: str) -> int:
+        code = self._ids.get(value)
+        if code is None:
+            code = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: str) -> None:
+        _check(value, str)
+        self.codes.append(self._id(value))
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index: int, value: str) -> None:
+        _check(value, str)
+        self.codes[index] = self._id(value)
+
+    def pop(self) -> str:
+        return self.values[self.codes.pop()]
+
+    def __delitem__(self, index: int) -> None:
+        del self.codes[index]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + sum(
+            len(value) for value in self.values
+        )
+
+
+class _BoolColumn:
+    """Booleans stored one byte each."""
+
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data = array("b")
+
+    def append(self, value: bool) -> None:
+        _check(value, bool)
+        self.data.append(value)
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.data[index])
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        _check(value, bool)
+        self.data[index] = value
+
+    def pop(self) -> bool:
+        return bool(self.data.pop())
+
+    def __delitem__(self, index: int) -> None:
+        del self.data[index]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def nbytes(self) -> int:
+        return len(self.data)
+
+
+def _make_column(kind: FieldType) -> Any:
+    if kind is str:
+        return _StrColumn()
+    if kind is bool:
+        return _BoolColumn()
+    if isinstance(kind, str):
+        return array(kind)
+    if kind in _TYPECODES:
+        return array(_TYPECODES[kind])
+    return []  # any other type: a plain list of objects
+
+
+class Row(Mapping):
+    """Read-write view of one record of a :class:`RecordStore`.
+
+    Behaves like a read-only dict (``row["grade"]``, ``row.get``,
+    ``row.items()``, ``row == {...}``) and also supports
+    ``row["grade"] = 90``. A view refers to a position, so it follows the
+    record stored there.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "RecordStore", index: int) -> None:
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, field: str) -> Any:
+        return self._store._columns[field][self._index]
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        self._store._set(self._index, field, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.fields)
+
+    def __len__(self) -> int:
+        return len(self._store.fields)
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._store._columns
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: self[field] for field in self._store.fields}
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+class RecordStore:
+    """A list of records with a fixed schema, stored column by column.
+
+    Args:
+        schema: Field names mapped to their type: ``int``, ``float``,
+            ``bool`` or ``str``, an ``array`` typecode such as ``"i"`` for
+            narrower numbers, or any other type to store plain objects.
+        records: Initial records (mappings with every schema field).
+
+    Example::
+
+        students = RecordStore({"name": str, "grade": int})
+        students.append({"name": "Alice", "grade": 85})
+        [s["name"] for s in students if s["grade"] >= 80]  # ["Alice"]
+    """
+
+    def __init__(
+        self,
+        schema: Mapping,
+        records: Optional[Iterable[Mapping]] = None,
+    ) -> None:
+        if not schema:
+            raise ValueError("schema needs at least one field")
+        self.schema: Dict[str, FieldType] = dict(schema)
+        self.fields = tuple(self.schema)
+        self._columns: Dict[str, Any] = {
+            field: _make_column(kind) for field, kind in self.schema.items()
+        }
+        self._length = 0
+        self._indexes: Dict[str, Dict[str, Index]] = {}
+        if records is not None:
+            self.extend(records)
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping], schema: Optional[Mapping] = None
+    ) -> "RecordStore":
+        """Build a store, taking the schema from the first record if not given.
+
+        Raises:
+            ValueError: If ``records`` is empty and no schema is given.
+        """
+        records = iter(records)
+        if schema is None:
+            first = next(records, None)
+            if first is None:
+                raise ValueError("cannot infer a schema from no records")
+            store = cls({field: type(value) for field, value in first.items()})
+            store.append(first)
+        else:
+            store = cls(schema)
+        store.extend(records)
+        return store
+
+    def column(self, field: str) -> Any:
+        """The storage of ``field``: an ``array``, a list, or, for strings,
+        an object whose ``codes`` array indexes its ``values`` list."""
+        return self._columns[field]
+
+    def append(self, record: Mapping) -> None:
+        """Add a record, which must have every schema field.
+
+        Raises:
+            KeyError: If a field is missing.
+            TypeError: If a value does not fit its column.
+            OverflowError: If a number is out of range for its column.
+
+        On error the store is left unchanged.
+        """
+        values = [record[field] for field in self.fields]
+        done = []
+        try:
+            for field, value in zip(self.fields, values):
+                self._columns[field].append(value)
+                done.append(field)
+        except (TypeError, OverflowError):
+            for field in done:
+                self._columns[field].pop()
+            raise
+        row = self._length
+        self._length += 1
+        for field, by_kind in self._indexes.items():
+            value = self._columns[field][row]
+            for index in by_kind.values():
+                index.add(value, row)
+
+    def _set(self, row: int, field: str, value: Any) -> None:
+        column = self._columns[field]
+        by_kind = self._indexes.get(field)
+        if by_kind:
+            old = column[row]
+            column[row] = value
+            value = column[row]  # as stored, e.g. float columns turn ints into floats
+            for index in by_kind.values():
+                index.discard(old, row)
+                index.add(value, row)
+        else:
+            column[row] = value
+
+    def extend(self, records: Iterable[Mapping]) -> None:
+        for record in records:
+            self.append(record)
+
+    def create_index(self, field: str, kind: str = "sorted") -> Index:
+        """Index ``field`` and keep the index current; returns the index.
+
+        Args:
+            field: A schema field.
+            kind: ``"sorted"`` for range and equality lookups or ``"hash"``
+                for equality lookups only. A field can have one of each.
+
+        Raises:
+            KeyError: If ``field`` is not in the schema.
+            ValueError: If ``kind`` is unknown.
+        """
+        column = self._columns[field]
+        by_kind = self._indexes.setdefault(field, {})
+        if kind not in by_kind:
+            index = make_index(field, kind)
+            index.build(column[i] for i in range(self._length))
+            by_kind[kind] = index
+        return by_kind[kind]
+
+    def get_index(self, field: str, kind: Optional[str] = None) -> Optional[Index]:
+        """The index on ``field`` of the given kind, or of any kind if
+        ``kind`` is ``None``; ``None`` if there is none."""
+        by_kind = self._indexes.get(field, {})
+        if kind is not None:
+            return by_kind.get(kind)
+        return next(iter(by_kind.values()), None)
+
+    def drop_index(self, field: str, kind: Optional[str] = None) -> None:
+        """Remove the ``kind`` index on ``field``, or all of its indexes."""
+        by_kind = self._indexes.get(field, {})
+        if kind is None:
+            by_kind.clear()
+        else:
+            by_kind.pop(kind, None)
+        if not by_kind:
+            self._indexes.pop(field, None)
+
+    def take(self, positions: Iterable[int]) -> List[Row]:
+        """Row views for ``positions``, e.g. the result of an index lookup."""
+        return [Row(self, i) for i in positions]
+
+    def nbytes(self) -> int:
+        """Approximate bytes held by the column data."""
+        total = 0
+        for column in self._columns.values():
+            if hasattr(column, "nbytes"):
+                total += column.nbytes()
+            elif isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += 8 * len(column)
+        return total
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [Row(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return Row(self, index)
+
+    def __delitem__(self, index: int) -> None:
+        """Delete one record; later records move up one position.
+
+        Like ``del`` on a list this is ``O(n)``, and so is the renumbering of
+        each index.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        for field, by_kind in self._indexes.items():
+            value = self._columns[field][index]
+            for idx in by_kind.values():
+                idx.delete_row(value, index)
+        for column in self._columns.values():
+            del column[index]
+        self._length -= 1
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self._length):
+            yield Row(self, index)
+
+    def __repr__(self) -> str:
+        return f"RecordStore({[row.to_dict() for row in self]!r})"
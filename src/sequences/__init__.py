@@ -0,0 +1,25 @@
+"""
+Sequence and iteration utilities.
+
+Lazy and allocation-free versions of the list patterns used in the learning
+materials.
+"""
+
+from .blocklist import BlockList
+from .chunks import SliceView, chunk_views, map_chunks
+from .flatten import flatten
+from .gather import gather, safe_get
+from .pipeline import Pipeline
+from .ring import RingBuffer
+
+__all__ = [
+    "BlockList",
+    "Pipeline",
+    "RingBuffer",
+    "SliceView",
+    "chunk_views",
+    "flatten",
+    "gather",
+    "map_chunks",
+    "safe_get",
+]
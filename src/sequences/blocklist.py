@@ -0,0 +1,218 @@
+"""
+A list that is fast to change at the front, the back and in the middle.
+
+``list.insert(0, x)`` moves every element, so building a list from the front
+is quadratic. :class:`BlockList` stores its items in a list of blocks of
+bounded size. An insert or delete moves at most one block's worth of items,
+and a Fenwick tree over the block lengths finds the block holding a position
+in ``O(log(n / block))``. Operations at either end go straight to the first
+or last block.
+"""
+
+from collections.abc import MutableSequence
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+_DEFAULT_BLOCK = 512
+
+
+class BlockList(MutableSequence):
+    """Mutable sequence with cheap inserts and deletes anywhere.
+
+    ==========================  ===========================================
+    ``append``, ``appendleft``  ``O(1)`` amortized
+    ``pop()``, ``popleft()``    ``O(1)`` amortized
+    ``bl[i]``, ``bl[i] = x``    ``O(1)`` at the ends, ``O(log n)`` elsewhere
+    ``insert(i, x)``, ``del``   ``O(log n + block)`` amortized
+    iteration                   ``O(n)``
+    ==========================  ===========================================
+
+    Args:
+        items: Initial contents.
+        block: Target number of items per block. Blocks are split when they
+            reach twice this size and dropped when they become empty.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), block: int = _DEFAULT_BLOCK) -> None:
+        if block < 1:
+            raise ValueError("block size must be at least 1")
+        self._block = block
+        self._blocks: List[List[Any]] = [[]]
+        self._len = 0
+        self._tree: Optional[List[int]] = None  # None means "rebuild when needed"
+        self.extend(items)
+
+    # -- Fenwick tree over block lengths ------------------------------------
+
+    def _build_tree(self) -> List[int]:
+        tree = [0]
+        tree.extend(len(block) for block in self._blocks)
+        size = len(self._blocks)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        tree = self._tree
+        if tree is None:
+            return
+        size = len(tree) - 1
+        i = block_index + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Block number and offset of position ``index`` (already in range)."""
+        blocks = self._blocks
+        first = len(blocks[0])
+        if index < first:
+            return 0, index
+        last = len(blocks[-1])
+        if index >= self._len - last:
+            return len(blocks) - 1, index - (self._len - last)
+        tree = self._tree if self._tree is not None else self._build_tree()
+        size = len(tree) - 1
+        pos = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return pos, index
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockList index out of range")
+        return index
+
+    # -- block maintenance -----------------------------------------------
+
+    def _grew(self, block_index: int) -> None:
+        block = self._blocks[block_index]
+        if len(block) >= 2 * self._block:
+            half = len(block) // 2
+            self._blocks[block_index : block_index + 1] = [block[:half], block[half:]]
+            self._tree = None
+        else:
+            self._tree_add(block_index, 1)
+
+    def _shrank(self, block_index: int) -> None:
+        if not self._blocks[block_index] and len(self._blocks) > 1:
+            del self._blocks[block_index]
+            self._tree = None
+        else:
+            self._tree_add(block_index, -1)
+
+    # -- sequence API -----------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        block, offset = self._locate(self._normalize(index))
+        return self._blocks[block][offset]
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = value
+            self._reset(items)
+            return
+        block, offset = self._locate(self._normalize(index))
+        self._blocks[block][offset] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._reset(items)
+            return
+        block, offset = self._locate(self._normalize(index))
+        del self._blocks[block][offset]
+        self._len -= 1
+        self._shrank(block)
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert ``value`` before position ``index``, like ``list.insert``."""
+        if index < 0:
+            index = max(0, index + self._len)
+        if index >= self._len:
+            self.append(value)
+            return
+        block, offset = self._locate(index)
+        self._blocks[block].insert(offset, value)
+        self._len += 1
+        self._grew(block)
+
+    def append(self, value: Any) -> None:
+        self._blocks[-1].append(value)
+        self._len += 1
+        self._grew(len(self._blocks) - 1)
+
+    def appendleft(self, value: Any) -> None:
+        """Insert ``value`` at the front; the same as ``insert(0, value)``."""
+        self._blocks[0].insert(0, value)
+        self._len += 1
+        self._grew(0)
+
+    def pop(self, index: int = -1) -> Any:
+        block, offset = self._locate(self._normalize(index))
+        value = self._blocks[block].pop(offset)
+        self._len -= 1
+        self._shrank(block)
+        return value
+
+    def popleft(self) -> Any:
+        """Remove and return the first item."""
+        return self.pop(0)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        if values is self:
+            values = list(values)
+        last = self._blocks[-1]
+        size = self._block
+        added = 0
+        for value in values:
+            if len(last) >= size:
+                last = []
+                self._blocks.append(last)
+            last.append(value)
+            added += 1
+        if added:
+            self._len += added
+            self._tree = None
+
+    def clear(self) -> None:
+        self._reset(())
+
+    def _reset(self, items: Iterable[Any]) -> None:
+        self._blocks = [[]]
+        self._len = 0
+        self._tree = None
+        self.extend(items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BlockList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BlockList({list(self)!r})"
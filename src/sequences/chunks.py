@@ -0,0 +1,184 @@
+"""
+Zero-copy chunking and bounded parallel processing of chunks.
+
+``[lst[i : i + size] for i in range(0, len(lst), size)]`` copies every
+element into new lists, doubling the memory of a large buffer.
+:func:`chunk_views` yields views instead, one at a time: ``memoryview``
+slices for bytes-like objects and arrays, NumPy slices for NumPy arrays, and
+:class:`SliceView` index ranges for any other sequence. :func:`map_chunks`
+feeds such chunks to a thread or process pool while keeping only a bounded
+number of tasks in flight.
+"""
+
+import os
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Set, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+_TYPECODES = frozenset("bBuhHiIlLqQfd")
+
+
+class SliceView(Sequence):
+    """Read-only view of ``seq[start:stop:step]`` that copies nothing.
+
+    The view reads through to ``seq``, so it reflects later changes to it.
+    Slicing a view returns another view of the same sequence.
+
+    Args:
+        seq: The underlying sequence.
+        indices: The positions of ``seq`` the view shows, as a ``range``;
+            all of ``seq`` by default.
+    """
+
+    __slots__ = ("_seq", "_range")
+
+    def __init__(self, seq: Sequence, indices: Optional[range] = None) -> None:
+        self._seq = seq
+        self._range = range(len(seq)) if indices is None else indices
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return SliceView(self._seq, self._range[index])
+        return self._seq[self._range[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._seq.__getitem__, self._range)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SliceView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def tolist(self) -> list:
+        return list(self)
+
+    def __repr__(self) -> str:
+        r = self._range
+        return f"SliceView({type(self._seq).__name__}, {r.start}:{r.stop}:{r.step})"
+
+
+def chunk_views(seq: Any, size: int) -> Iterator[Any]:
+    """Lazily yield consecutive chunks of ``seq`` of at most ``size`` items.
+
+    Chunks are views, not copies: NumPy slices for NumPy arrays,
+    ``memoryview`` slices for other objects supporting the buffer protocol
+    (``bytes``, ``bytearray``, ``array.array``, ``mmap``), and
+    :class:`SliceView` for any other sequence such as a list.
+
+    Raises:
+        ValueError: If ``size`` is not positive.
+    """
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    if np is not None and isinstance(seq, np.ndarray):
+        view = seq
+        n = len(seq)
+    else:
+        try:
+            view = memoryview(seq)
+        except TypeError:
+            view = None
+        if view is not None and view.ndim == 1:
+            n = len(view)
+        else:
+            view = SliceView(seq)
+            n = len(seq)
+    for start in range(0, n, size):
+        yield view[start : start + size]
+
+
+def _portable(chunk: Any) -> Any:
+    """A picklable copy of ``chunk`` for sending to another process."""
+    if isinstance(chunk, memoryview):
+        if chunk.format in _TYPECODES:
+            return array(chunk.format, chunk.tobytes())
+        return chunk.tobytes()
+    if isinstance(chunk, SliceView):
+        return chunk.tolist()
+    return chunk
+
+
+def map_chunks(
+    func: Callable[[Any], Any],
+    chunks: Iterable[Any],
+    workers: Optional[int] = None,
+    processes: bool = False,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    executor: Optional[Executor] = None,
+) -> Iterator[Any]:
+    """Apply ``func`` to every chunk on a pool and yield the results.
+
+    ``chunks`` is read lazily and at most ``max_in_flight`` chunks are
+    submitted but not yet yielded, so memory stays bounded however long the
+    input is. Stopping the iteration early cancels tasks that have not
+    started.
+
+    Threads share the chunk views with no copying; they suit ``func``s that
+    release the GIL (I/O, NumPy, compression). With processes each chunk is
+    copied once into the task: memoryviews become ``array`` or ``bytes``
+    objects and :class:`SliceView` chunks become lists.
+
+    Args:
+        func: Function of one chunk. Must be picklable for processes.
+        chunks: Iterable of chunks, e.g. from :func:`chunk_views`.
+        workers: Pool size; defaults to ``os.cpu_count()``.
+        processes: Use a process pool instead of a thread pool.
+        max_in_flight: Bound on pending chunks; defaults to ``2 * workers``.
+        ordered: Yield results in input order. If false, yield each result
+            as soon as it is ready.
+        executor: Existing executor to use instead of a new pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    limit = max_in_flight or 2 * workers
+    if limit < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if executor is None:
+        pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        pool: Executor = pool_cls(max_workers=workers)
+    else:
+        pool = executor
+    copy = processes or isinstance(pool, ProcessPoolExecutor)
+    pending: Deque[Future] = deque()
+    waiting: Set[Future] = set()
+    try:
+        for chunk in chunks:
+            if len(pending) + len(waiting) >= limit:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, waiting = wait(waiting, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            future = pool.submit(func, _portable(chunk) if copy else chunk)
+            (pending.append if ordered else waiting.add)(future)
+        while pending:
+            yield pending.popleft().result()
+        while waiting:
+            done, waiting = wait(waiting, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in list(pending) + list(waiting):
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
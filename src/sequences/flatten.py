@@ -0,0 +1,72 @@
+"""
+Iterative flattening of nested containers.
+
+A recursive flatten makes one Python call per nesting level, so it fails
+with ``RecursionError`` on inputs nested about a thousand levels deep, and
+``result.extend(flatten(item))`` copies each leaf once per level above it.
+:func:`flatten` walks the structure with an explicit stack of iterators
+instead and yields each leaf exactly once, as soon as it is reached.
+"""
+
+from typing import Any, Iterable, Iterator, Optional, Set, Tuple, Type, Union
+
+# Always leaves, even when ``containers`` would match them: iterating a
+# string yields strings, which would never end.
+_ATOMIC = (str, bytes, bytearray)
+
+Containers = Union[Type, Tuple[Type, ...]]
+
+
+def flatten(
+    nested: Iterable[Any],
+    containers: Containers = list,
+    max_depth: Optional[int] = None,
+) -> Iterator[Any]:
+    """Lazily yield the leaves of ``nested`` in depth-first order.
+
+    ``list(flatten(x))`` equals the lessons' recursive ``flatten_list(x)``
+    for any nesting depth.
+
+    Args:
+        nested: The outer iterable; it is always expanded.
+        containers: Type or tuple of types to expand, e.g. ``(list, tuple)``,
+            or ``collections.abc.Iterable`` for every iterable. ``str``,
+            ``bytes`` and ``bytearray`` are always treated as leaves.
+        max_depth: Number of nesting levels below ``nested`` to expand;
+            deeper containers are yielded as they are. ``None`` expands all
+            levels, ``1`` flattens one level like ``itertools.chain``.
+
+    Raises:
+        ValueError: If ``max_depth`` is negative (on the call) or a container
+            contains itself (during iteration).
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must be non-negative")
+    return _flatten(nested, containers, -1 if max_depth is None else max_depth)
+
+
+def _flatten(
+    nested: Iterable[Any], containers: Containers, limit: int
+) -> Iterator[Any]:
+    stack = [iter(nested)]
+    # ids of the containers being expanded, to detect cycles
+    open_ids: Set[int] = {id(nested)}
+    owners = [id(nested)]
+    while stack:
+        for item in stack[-1]:
+            if (
+                isinstance(item, containers)
+                and not isinstance(item, _ATOMIC)
+                and len(stack) != limit + 1
+            ):
+                key = id(item)
+                if key in open_ids:
+                    raise ValueError("cannot flatten a container that contains itself")
+                open_ids.add(key)
+                owners.append(key)
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
+            open_ids.discard(owners.pop())
@@ -0,0 +1,87 @@
+"""
+Bounds-checked element access, one at a time or in bulk.
+
+The lessons' ``safe_get`` catches ``IndexError`` for every miss, and raising
+and catching an exception costs far more than a comparison. :func:`safe_get`
+and :func:`gather` check bounds up front instead. :func:`gather` handles a
+whole batch of indices in one pass, and with NumPy installed it does the
+checks and the lookups as array operations.
+"""
+
+from array import array
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# array typecodes NumPy reads with the same meaning
+_NUMPY_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+def safe_get(seq: Sequence[Any], index: int, default: Any = None) -> Any:
+    """Return ``seq[index]``, or ``default`` if ``index`` is out of range.
+
+    Negative indices count from the end as usual, so the valid range is
+    ``-len(seq) <= index < len(seq)``.
+    """
+    n = len(seq)
+    if -n <= index < n:
+        return seq[index]
+    return default
+
+
+def gather(seq: Sequence[Any], indices: Iterable[int], default: Any = None) -> Any:
+    """Return ``[safe_get(seq, i, default) for i in indices]``, computed in bulk.
+
+    With NumPy installed, a NumPy ``seq`` is gathered with array operations
+    and the result is a NumPy array. It keeps the dtype of ``seq`` when
+    ``default`` can be cast to it without loss; otherwise (a string, ``None``
+    or a float for an integer array, say) it is an object array, so neither
+    the items nor ``default`` change type. An ``array.array`` of numbers is
+    gathered the same way, without copying it, and the result is returned as
+    a list. Every other sequence returns a list built in a single pass.
+
+    Args:
+        seq: The sequence to read from.
+        indices: Positions to read; a list, any iterable or a NumPy array.
+        default: Value for positions outside ``seq``.
+    """
+    n = len(seq)
+    if np is not None:
+        if isinstance(seq, np.ndarray):
+            return _gather_numpy(seq, indices, default)
+        if isinstance(seq, array) and seq.typecode in _NUMPY_TYPECODES and n:
+            values = np.frombuffer(seq, dtype=seq.typecode)
+            return _gather_numpy(values, indices, default).tolist()
+        if isinstance(indices, np.ndarray):
+            indices = indices.tolist()
+    low = -n
+    return [seq[i] if low <= i < n else default for i in indices]
+
+
+def _gather_numpy(values: Any, indices: Iterable[int], default: Any) -> Any:
+    if not isinstance(indices, (np.ndarray, list, tuple)):
+        indices = list(indices)
+    index = np.asarray(indices, dtype=np.intp)
+    n = len(values)
+    if not n:
+        return np.full(index.shape, default)
+    inside = (index >= -n) & (index < n)
+    picked = values[np.where(inside, index, 0)]
+    if inside.all():
+        return picked
+    if _fits(default, values.dtype):
+        return np.where(inside, picked, default)
+    result = picked.astype(object)
+    # A 0-d holder makes NumPy store ``default`` as is, even a tuple or list.
+    missing = np.empty((), dtype=object)
+    missing[()] = default
+    result[~inside] = missing
+    return result
+
+
+def _fits(default: Any, dtype: Any) -> bool:
+    """Whether ``default`` can be stored in ``dtype`` without changing its value."""
+    return np.ndim(default) == 0 and np.can_cast(np.min_scalar_type(default), dtype)
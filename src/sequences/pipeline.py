@@ -0,0 +1,160 @@
+"""
+Lazy, single-pass pipelines over iterables.
+
+Chained comprehensions build a full list at every step::
+
+    long_upper = [w.upper() for w in words if len(w) > 4]
+    first_letters = [w[0] for w in long_upper]
+
+A :class:`Pipeline` records the steps instead and runs them only when a
+terminal operation asks for results. Each element then travels through every
+step before the next one is read, so no intermediate list exists::
+
+    Pipeline(words).filter(lambda w: len(w) > 4).map(str.upper).map(
+        itemgetter(0)
+    ).to_list()
+
+Steps are built from the C-level ``map``, ``filter`` and ``itertools``
+iterators, so a step adds no Python-level loop of its own.
+"""
+
+from collections import deque
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+Step = Tuple[str, Any]
+
+
+def _distinct(items: Iterable[Any], key: Optional[Callable[[Any], Hashable]]) -> Any:
+    seen = set()
+    add = seen.add
+    if key is None:
+        for item in items:
+            if item not in seen:
+                add(item)
+                yield item
+    else:
+        for item in items:
+            k = key(item)
+            if k not in seen:
+                add(k)
+                yield item
+
+
+def _apply(items: Iterator[Any], step: Step) -> Iterator[Any]:
+    kind, arg = step
+    if kind == "map":
+        return map(arg, items)
+    if kind == "filter":
+        return filter(arg, items)
+    if kind == "flat_map":
+        return chain.from_iterable(map(arg, items))
+    if kind == "take":
+        return islice(items, arg)
+    return _distinct(items, arg)
+
+
+class Pipeline:
+    """A lazy sequence of steps over a source iterable.
+
+    Every step returns a new pipeline and leaves this one unchanged, so a
+    common prefix can be shared. Nothing is read from the source until a
+    terminal operation (:meth:`to_list`, :meth:`to_dict`, :meth:`count`,
+    :meth:`first` or iteration) runs. A one-shot source such as a generator
+    or file can only be run once.
+
+    Args:
+        source: Any iterable.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, source: Iterable[Any], _steps: Tuple[Step, ...] = ()) -> None:
+        self._source = source
+        self._steps = _steps
+
+    def _then(self, kind: str, arg: Any) -> "Pipeline":
+        return Pipeline(self._source, self._steps + ((kind, arg),))
+
+    def map(self, func: Callable[[Any], Any]) -> "Pipeline":
+        """Replace each element ``x`` with ``func(x)``."""
+        return self._then("map", func)
+
+    def filter(self, predicate: Optional[Callable[[Any], Any]]) -> "Pipeline":
+        """Keep elements for which ``predicate`` is true (truthy ones if ``None``)."""
+        return self._then("filter", predicate)
+
+    def flat_map(self, func: Callable[[Any], Iterable[Any]]) -> "Pipeline":
+        """Replace each element with the elements of the iterable ``func(x)``."""
+        return self._then("flat_map", func)
+
+    def take(self, n: int) -> "Pipeline":
+        """Stop after ``n`` elements; the source is not read any further."""
+        if n < 0:
+            raise ValueError("take() needs a non-negative count")
+        return self._then("take", n)
+
+    def distinct(self, key: Optional[Callable[[Any], Hashable]] = None) -> "Pipeline":
+        """Drop repeats, keeping first occurrences in order.
+
+        Args:
+            key: Function giving the value that decides sameness; the
+                element itself by default. Memory grows with the number of
+                distinct keys.
+        """
+        return self._then("distinct", key)
+
+    def __iter__(self) -> Iterator[Any]:
+        items: Iterator[Any] = iter(self._source)
+        for step in self._steps:
+            items = _apply(items, step)
+        return items
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def to_dict(
+        self,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        value: Optional[Callable[[Any], Any]] = None,
+    ) -> Dict[Hashable, Any]:
+        """Collect into a dict; later elements win for equal keys.
+
+        Args:
+            key: Function giving each element's key. Without ``key`` and
+                ``value`` the elements must be ``(key, value)`` pairs.
+            value: Function giving each element's value; the element itself
+                by default.
+        """
+        if key is None and value is None:
+            return dict(self)
+        key = key or (lambda item: item)
+        if value is None:
+            return {key(item): item for item in self}
+        return {key(item): value(item) for item in self}
+
+    def count(self) -> int:
+        """Number of elements, counted without storing them."""
+        last = deque(enumerate(self, 1), maxlen=1)
+        return last[0][0] if last else 0
+
+    def first(self, default: Any = None) -> Any:
+        """The first element, or ``default`` if there is none.
+
+        Only as much of the source is read as is needed to find it.
+        """
+        return next(iter(self), default)
+
+    def __repr__(self) -> str:
+        steps = "".join(f".{kind}(...)" for kind, _ in self._steps)
+        return f"Pipeline({type(self._source).__name__}){steps}"
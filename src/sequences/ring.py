@@ -0,0 +1,110 @@
+"""
+A fixed-length sequence with constant-time rotation.
+
+``lst[n:] + lst[:n]`` copies the whole list on every rotation.
+:class:`RingBuffer` stores its items once and keeps an offset into them, so
+rotating only moves the offset. Indexing and iteration translate positions
+through the offset and never move the data.
+"""
+
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+
+class RingBuffer(Sequence):
+    """Fixed-length sequence whose :meth:`rotate` is ``O(1)``.
+
+    ``RingBuffer(items).rotate(n)`` leaves the buffer equal to the lessons'
+    ``rotate_list(items, n)``, i.e. ``items[n:] + items[:n]``.
+
+    Args:
+        items: Initial contents; the length is fixed from here on.
+        typecode: If given, store the items in an ``array`` of this type
+            (e.g. ``"q"``) instead of a list.
+    """
+
+    __slots__ = ("_data", "_offset")
+
+    def __init__(
+        self, items: Iterable[Any] = (), typecode: Optional[str] = None
+    ) -> None:
+        self._data: Union[List[Any], array] = (
+            list(items) if typecode is None else array(typecode, items)
+        )
+        self._offset = 0
+
+    def rotate(self, n: int = 1) -> None:
+        """Rotate left by ``n`` (right for negative ``n``) in ``O(1)``."""
+        size = len(self._data)
+        if size:
+            self._offset = (self._offset + n) % size
+
+    @property
+    def offset(self) -> int:
+        """Position in the underlying storage of the item at index 0."""
+        return self._offset
+
+    def _position(self, index: int) -> int:
+        size = len(self._data)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RingBuffer index out of range")
+        position = self._offset + index
+        return position - size if position >= size else position
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._data))
+            if step == 1:
+                return self._copy(start, stop)
+            data, size, offset = self._data, len(self._data), self._offset
+            return [data[(offset + i) % size] for i in range(start, stop, step)]
+        return self._data[self._position(index)]
+
+    def _copy(self, start: int, stop: int) -> List[Any]:
+        """Items ``start:stop`` as a list, copied with at most two slices."""
+        if start >= stop:
+            return []
+        data, size = self._data, len(self._data)
+        first, last = self._offset + start, self._offset + stop
+        if last <= size:
+            return list(data[first:last])
+        if first >= size:
+            return list(data[first - size : last - size])
+        return list(data[first:]) + list(data[: last - size])
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self._data[self._position(index)] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        offset = self._offset
+        size = len(self._data)
+        return map(self._data.__getitem__, chain(range(offset, size), range(offset)))
+
+    def __reversed__(self) -> Iterator[Any]:
+        offset = self._offset
+        size = len(self._data)
+        return map(
+            self._data.__getitem__,
+            chain(range(offset - 1, -1, -1), range(size - 1, offset - 1, -1)),
+        )
+
+    def to_list(self) -> List[Any]:
+        """The items in order as a new list."""
+        return self._copy(0, len(self._data))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RingBuffer, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({self.to_list()!r})"
@@ -0,0 +1,157 @@
+"""Tests for :func:`src.cache.async_memoize`."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.cache import Cache, ShardedCache, async_memoize, make_key
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_calls_share_one_task():
+    calls = []
+
+    @async_memoize
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    async def main():
+        results = await asyncio.gather(fetch(1), fetch(1), fetch(1), fetch(2))
+        assert results == [2, 2, 2, 4]
+        assert await fetch(1) == 2  # finished task: returned without awaiting
+
+    run(main())
+    assert calls == [1, 2]
+    assert len(fetch.cache) == 2
+
+
+def test_cancelled_waiter_does_not_poison_the_cache():
+    calls = []
+
+    @async_memoize
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.02)
+        return x
+
+    async def main():
+        first = asyncio.ensure_future(fetch(1))
+        second = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == 1
+        assert await fetch(1) == 1
+
+    run(main())
+    assert calls == [1]
+    task = fetch.cache[make_key((1,), {})]
+    assert task.done() and not task.cancelled()
+
+
+def test_cancelled_computation_is_dropped():
+    @async_memoize
+    async def fetch(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    async def main():
+        waiter = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        fetch.cache[make_key((1,), {})].cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)  # let the done callback run
+        assert len(fetch.cache) == 0
+        assert await fetch(1) == 1
+
+    run(main())
+
+
+def test_failed_tasks_are_evicted_and_retried():
+    calls = []
+
+    @async_memoize
+    async def flaky(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return x
+
+    async def main():
+        results = await asyncio.gather(flaky(1), flaky(1), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert results[0] is results[1]
+        # Retried before the done callback ran, or after it removed the entry.
+        assert await flaky(1) == 1
+        assert await flaky(1) == 1
+
+    run(main())
+    assert calls == [1, 1]
+
+
+def test_failed_task_does_not_remove_a_newer_entry():
+    @async_memoize
+    async def fail():
+        raise RuntimeError("boom")
+
+    async def main():
+        task = asyncio.ensure_future(fail())
+        await asyncio.sleep(0)
+        k = make_key((), {})
+        replacement = asyncio.get_running_loop().create_future()
+        replacement.set_result("newer")
+        fail.cache[k] = replacement
+        with pytest.raises(RuntimeError):
+            await task
+        assert fail.cache[k] is replacement
+
+    run(main())
+
+
+def test_options_and_helpers():
+    store = Cache(maxsize=1)
+
+    @async_memoize(cache=store)
+    async def square(x):
+        return x * x
+
+    @async_memoize(ttl=0.01)
+    async def stamp():
+        return time.perf_counter()
+
+    async def main():
+        assert await square(2) == 4
+        assert await square(3) == 9
+        assert len(store) == 1  # maxsize=1 evicted the first task
+        assert square.cache is store
+        assert square.cache_info()["entries"] == 1
+        square.cache_clear()
+        assert len(store) == 0
+
+        first = await stamp()
+        assert await stamp() == first
+        await asyncio.sleep(0.03)
+        assert await stamp() != first
+
+    run(main())
+
+
+def test_sharded_cache_records_compute_latency():
+    @async_memoize(cache=ShardedCache(shards=2))
+    async def square(x):
+        return x * x
+
+    async def main():
+        assert [await square(x) for x in (1, 2, 1)] == [1, 4, 1]
+
+    run(main())
+    assert square.cache_info()["compute_latency"]["count"] == 2
@@ -0,0 +1,95 @@
+"""Tests for :func:`src.cache.batch_memoize`."""
+
+import pytest
+
+from src.cache import Cache, ShardedCache, batch_memoize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+needs_numpy = pytest.mark.skipif(np is None, reason="needs numpy")
+
+
+def make_square():
+    batches = []
+
+    @batch_memoize
+    def square(xs):
+        batches.append(list(xs))
+        return [x * x for x in xs]
+
+    return square, batches
+
+
+def test_sequence_calls_compute_distinct_misses_once():
+    square, batches = make_square()
+    assert square([3, 1, 3, 2]) == [9, 1, 9, 4]
+    assert square((2, 4, 4)) == [4, 16, 16]
+    assert batches == [[3, 1, 2], [4]]
+    assert square.scalar(3) == 9 and square.scalar(5) == 25
+    assert batches[-1] == [5]
+    info = square.cache_info()
+    assert info["entries"] == 5 and info["compute_latency"]["count"] == 3
+
+
+@needs_numpy
+def test_array_calls_return_arrays_in_input_shape():
+    calls = []
+
+    @batch_memoize
+    def double(xs):
+        calls.append(xs)
+        return xs * 2
+
+    inputs = np.array([[3, 1], [3, 2]])
+    result = double(inputs)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [[6, 2], [6, 4]]
+    assert isinstance(calls[0], np.ndarray) and calls[0].tolist() == [1, 2, 3]
+    assert double(np.array([2, 5])).tolist() == [4, 10]
+    assert calls[-1].tolist() == [5]
+
+
+def test_wrong_result_length_is_an_error():
+    @batch_memoize
+    def broken(xs):
+        return xs[:1]
+
+    with pytest.raises(ValueError):
+        broken([1, 2])
+    assert len(broken.cache) == 0
+
+
+def test_existing_cache_and_helpers():
+    store = Cache(maxsize=2)
+
+    @batch_memoize(cache=store)
+    def ident(xs):
+        return list(xs)
+
+    assert ident([1, 2, 3]) == [1, 2, 3]
+    assert ident.cache is store and len(store) == 2
+    ident.cache_clear()
+    assert len(store) == 0
+
+    plain = {}
+
+    @batch_memoize(cache=plain)
+    def negate(xs):
+        return [-x for x in xs]
+
+    assert negate([1, 2]) == [-1, -2]
+    assert plain == {1: -1, 2: -2}
+    assert negate.cache_info()["entries"] == 2
+
+
+def test_sharded_cache_records_compute_latency():
+    @batch_memoize(cache=ShardedCache(shards=2))
+    def square(xs):
+        return [x * x for x in xs]
+
+    assert square([1, 2]) == [1, 4]
+    assert square([2, 3]) == [4, 9]
+    assert square.cache_info()["compute_latency"]["count"] == 2
@@ -0,0 +1,110 @@
+"""Tests for :class:`src.sequences.BlockList`."""
+
+import random
+
+import pytest
+
+from src.sequences import BlockList
+
+
+def check(bl, ref):
+    assert len(bl) == len(ref)
+    assert list(bl) == ref
+    assert list(reversed(bl)) == ref[::-1]
+
+
+@pytest.mark.parametrize("block", [1, 2, 3, 8])
+@pytest.mark.parametrize("seed", range(5))
+def test_random_operations_match_list(block, seed):
+    rng = random.Random(seed)
+    ref = list(range(20))
+    bl = BlockList(ref, block=block)
+    for step in range(600):
+        op = rng.random()
+        n = len(ref)
+        if op < 0.35:
+            i = rng.randint(-n - 2, n + 2)
+            ref.insert(i, step)
+            bl.insert(i, step)
+        elif op < 0.45:
+            ref.append(step)
+            bl.append(step)
+        elif op < 0.5:
+            ref.insert(0, step)
+            bl.appendleft(step)
+        elif op < 0.65 and n:
+            i = rng.randrange(-n, n)
+            assert bl.pop(i) == ref.pop(i)
+        elif op < 0.7 and n:
+            assert bl.pop() == ref.pop()
+        elif op < 0.8 and n:
+            i = rng.randrange(-n, n)
+            del ref[i]
+            del bl[i]
+        elif op < 0.9 and n:
+            i = rng.randrange(-n, n)
+            ref[i] = -step
+            bl[i] = -step
+        elif op < 0.93:
+            items = list(range(rng.randint(0, 5)))
+            ref.extend(items)
+            bl.extend(items)
+        elif op < 0.96:
+            start, stop = sorted(rng.randint(-n - 1, n + 1) for _ in range(2))
+            items = [-1] * rng.randint(0, 3)
+            ref[start:stop] = items
+            bl[start:stop] = items
+        else:
+            sl = slice(rng.randint(-n, n), rng.randint(-n, n), rng.choice([1, 2, -1]))
+            assert bl[sl] == ref[sl]
+            del ref[sl]
+            del bl[sl]
+        if ref:
+            i = rng.randrange(-len(ref), len(ref))
+            assert bl[i] == ref[i]
+        if step % 50 == 0:
+            check(bl, ref)
+    check(bl, ref)
+
+
+def test_out_of_range_and_empty():
+    bl = BlockList(block=2)
+    with pytest.raises(IndexError):
+        bl[0]
+    with pytest.raises(IndexError):
+        bl.pop()
+    with pytest.raises(IndexError):
+        bl.popleft()
+    bl.extend("abc")
+    with pytest.raises(IndexError):
+        bl[3]
+    with pytest.raises(IndexError):
+        del bl[-4]
+    with pytest.raises(ValueError):
+        BlockList(block=0)
+
+
+def test_list_like_helpers():
+    bl = BlockList("abcd", block=2)
+    assert bl == list("abcd") and bl == tuple("abcd") and bl == BlockList("abcd")
+    assert bl != list("abc")
+    assert bl.index("c") == 2 and "d" in bl and bl.count("a") == 1
+    bl.extend(bl)
+    assert bl == list("abcdabcd")
+    bl.remove("a")
+    assert bl.popleft() == "b"
+    bl.reverse()
+    assert bl == list("dcbadc")
+    assert repr(BlockList([1])) == "BlockList([1])"
+    bl.clear()
+    assert len(bl) == 0 and bl == []
+    with pytest.raises(TypeError):
+        hash(bl)
+
+
+def test_front_inserts_keep_blocks_bounded():
+    bl = BlockList(block=4)
+    for i in range(1000):
+        bl.appendleft(i)
+    assert bl == list(range(999, -1, -1))
+    assert max(map(len, bl._blocks)) < 8
@@ -0,0 +1,97 @@
+"""Tests for :class:`src.cache.Cache` and the eviction policies."""
+
+import pytest
+
+from src.cache import Cache, LFUPolicy, LRUPolicy, make_policy
+
+
+def test_dict_interface():
+    cache = Cache(maxsize=10)
+    cache["a"] = 1
+    cache.update(b=2)
+    assert cache["a"] == 1 and cache.get("b") == 2 and cache.get("z", 0) == 0
+    assert "a" in cache and len(cache) == 2 and sorted(cache) == ["a", "b"]
+    del cache["a"]
+    with pytest.raises(KeyError):
+        cache["a"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_evicts_least_recently_used():
+    cache = Cache(maxsize=2, policy="lru")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"]  # "b" is now the oldest
+    cache["c"] = 3
+    assert sorted(cache) == ["a", "c"]
+    assert cache.stats.evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used_oldest_first():
+    cache = Cache(maxsize=3, policy="lfu")
+    for key in "abc":
+        cache[key] = key
+    cache["a"]
+    cache["a"]
+    cache["c"]
+    cache["d"] = "d"  # "b" was used least
+    assert sorted(cache) == ["a", "c", "d"]
+    cache["e"] = "e"  # "d" is the only key still used once
+    assert sorted(cache) == ["a", "c", "e"]
+    del cache["e"]
+    cache["f"] = "f"
+    assert cache.popvictim() == ("f", "f")
+
+
+def test_peek_and_batch_helpers_do_not_disturb_order():
+    cache = Cache(maxsize=2)
+    cache.set_many([("a", 1), ("b", 2)])
+    assert cache.peek("a") == 1 and cache.peek("x", 0) == 0
+    cache["c"] = 3  # peek did not refresh "a"
+    assert "a" not in cache
+    assert cache.get_many(["b", "x", "c"], None) == [2, None, 3]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_byte_limit():
+    cache = Cache(maxsize=None, maxbytes=10, sizeof=len)
+    cache["a"] = "xxxx"
+    cache["b"] = "yyyy"
+    cache["c"] = "zzzz"
+    assert sorted(cache) == ["b", "c"] and cache.currbytes == 8
+    cache["b"] = "y"
+    assert cache.currbytes == 5
+    cache["huge"] = "x" * 11  # larger than the whole cache: not stored
+    assert "huge" not in cache and cache.currbytes == 5
+    cache["c"] = "x" * 11  # replacing with an oversized value drops the key
+    assert "c" not in cache and cache.currbytes == 1
+
+
+def test_info_and_validation():
+    cache = Cache(maxsize=2, policy="lfu")
+    cache["a"] = 1
+    cache.get("a")
+    cache.get("b")
+    info = cache.info()
+    assert info["entries"] == 1 and info["policy"] == "lfu"
+    assert info["hit_ratio"] == 0.5
+    assert info["bytes"] is None  # sizes are not measured without maxbytes
+    sized = Cache(maxbytes=100, sizeof=len)
+    sized["a"] = "xyz"
+    assert sized.info()["bytes"] == 3
+    with pytest.raises(KeyError):
+        Cache().popvictim()
+    with pytest.raises(ValueError):
+        Cache(maxsize=0)
+    with pytest.raises(ValueError):
+        Cache(maxbytes=0)
+
+
+def test_make_policy():
+    assert isinstance(make_policy("lru"), LRUPolicy)
+    assert isinstance(make_policy(LFUPolicy), LFUPolicy)
+    policy = LRUPolicy()
+    assert make_policy(policy) is policy
+    with pytest.raises(ValueError):
+        make_policy("fifo")
@@ -0,0 +1,104 @@
+"""Tests for :mod:`src.sequences.chunks`."""
+
+import time
+from array import array
+
+import pytest
+
+from src.sequences import SliceView, chunk_views, map_chunks
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+needs_numpy = pytest.mark.skipif(np is None, reason="needs numpy")
+
+
+def test_list_chunks_are_views():
+    data = list(range(10))
+    chunks = list(chunk_views(data, 4))
+    assert all(isinstance(chunk, SliceView) for chunk in chunks)
+    assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    data[0] = "changed"
+    assert chunks[0][0] == "changed"  # read-through, not a copy
+
+
+@pytest.mark.parametrize(
+    "data",
+    [bytes(range(10)), bytearray(range(10)), array("i", range(10))],
+    ids=["bytes", "bytearray", "array"],
+)
+def test_buffer_chunks_are_memoryviews(data):
+    chunks = list(chunk_views(data, 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert [x for chunk in chunks for x in chunk.tolist()] == list(data)
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+
+
+@needs_numpy
+def test_ndarray_chunks_share_memory():
+    data = np.arange(10)
+    chunks = list(chunk_views(data, 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert [x for chunk in chunks for x in chunk.tolist()] == list(data)
+    assert all(np.shares_memory(chunk, data) for chunk in chunks)
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        next(chunk_views([1], 0))
+
+
+def test_slice_view_behaves_like_a_slice():
+    data = list(range(20))
+    view = SliceView(data)[2:18:3]
+    assert view == data[2:18:3] and len(view) == len(data[2:18:3])
+    assert view[1:3] == data[2:18:3][1:3] and view[-1] == data[2:18:3][-1]
+    assert list(reversed(view)) == data[2:18:3][::-1]
+    assert 5 in view and view.index(8) == 2
+    assert view != data[:3]
+    assert repr(view) == "SliceView(list, 2:18:3)"
+    with pytest.raises(TypeError):
+        hash(view)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_map_chunks_on_threads(ordered):
+    chunks = chunk_views(list(range(100)), 7)
+    results = list(map_chunks(sum, chunks, workers=3, ordered=ordered))
+    expected = [sum(range(i, min(i + 7, 100))) for i in range(0, 100, 7)]
+    if not ordered:
+        results.sort()
+        expected.sort()
+    assert results == expected
+
+
+def test_map_chunks_on_processes_copies_views():
+    data = array("d", range(50))
+    results = list(map_chunks(sum, chunk_views(data, 10), workers=2, processes=True))
+    assert results == [sum(range(i, i + 10)) for i in range(0, 50, 10)]
+
+
+def test_map_chunks_keeps_a_bounded_number_in_flight():
+    produced = []
+
+    def source():
+        for i in range(50):
+            produced.append(i)
+            yield i
+
+    def slow(x):
+        time.sleep(0.001)
+        return x
+
+    results = map_chunks(slow, source(), workers=2, max_in_flight=3)
+    for taken, value in enumerate(results, 1):
+        assert value == taken - 1
+        assert len(produced) - taken <= 3
+        if taken == 10:
+            break
+    results.close()
+    assert len(produced) < 50
+    with pytest.raises(ValueError):
+        next(map_chunks(sum, [], max_in_flight=-1))
@@ -0,0 +1,89 @@
+"""Tests for :func:`src.records.external_group_by`."""
+
+import os
+import random
+
+import pytest
+
+from src.records import external, external_group_by, group_by
+
+ROWS = [{"k": random.Random(i).randrange(300), "v": i} for i in range(3000)]
+KEYS = [row["k"] for row in ROWS]
+VALUES = [row["v"] for row in ROWS]
+
+
+@pytest.fixture
+def spills(monkeypatch):
+    """Count the calls that write groups to disk."""
+    calls = []
+    spill = external._Spiller.spill
+
+    def counting(self, groups):
+        calls.append(len(groups))
+        spill(self, groups)
+
+    monkeypatch.setattr(external._Spiller, "spill", counting)
+    return calls
+
+
+@pytest.mark.parametrize("how", ["count", "sum", "mean", "min", "max", "collect"])
+def test_in_memory_matches_group_by(how):
+    result = list(external_group_by(ROWS, "k", "v", how))
+    expected = group_by(KEYS, VALUES, how)
+    assert result == list(expected.items())
+
+
+@pytest.mark.parametrize("how", ["count", "sum", "mean", "min", "max", "collect"])
+def test_spilled_results_match_group_by(how, spills, tmp_path):
+    result = dict(
+        external_group_by(
+            ROWS, "k", "v", how, memory_limit=4000, partitions=4, tmpdir=str(tmp_path)
+        )
+    )
+    assert spills  # the budget was exceeded for every aggregation
+    assert result == group_by(KEYS, VALUES, how)
+    assert os.listdir(tmp_path) == []
+
+
+def test_deep_repartitioning(tmp_path):
+    result = dict(
+        external_group_by(
+            ROWS,
+            "k",
+            "v",
+            "collect",
+            memory_limit=500,
+            partitions=2,
+            tmpdir=str(tmp_path),
+        )
+    )
+    assert result == group_by(KEYS, VALUES, "collect")
+    assert os.listdir(tmp_path) == []
+
+
+def test_key_and_value_functions_and_tuples():
+    rows = [("a", 1), ("b", 2), ("a", 3)]
+    assert dict(external_group_by(rows, 0, 1, "sum")) == {"a": 4, "b": 2}
+    assert dict(external_group_by(rows, lambda r: r[0].upper())) == {
+        "A": [("a", 1), ("a", 3)],
+        "B": [("b", 2)],
+    }
+
+
+def test_bad_arguments_raise_on_call(tmp_path):
+    with pytest.raises(ValueError):
+        external_group_by(ROWS, "k", "v", how="median")
+    with pytest.raises(ValueError):
+        external_group_by(ROWS, "k", partitions=0)
+    external_group_by(ROWS, "k", tmpdir=str(tmp_path))  # lazy: nothing created yet
+    assert os.listdir(tmp_path) == []
+
+
+def test_abandoned_iteration_cleans_up(tmp_path):
+    groups = external_group_by(
+        ROWS, "k", "v", memory_limit=1000, partitions=2, tmpdir=str(tmp_path)
+    )
+    next(groups)
+    assert os.listdir(tmp_path)
+    groups.close()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,75 @@
+"""Tests for :func:`src.sequences.flatten`."""
+
+from collections.abc import Iterable
+
+import pytest
+
+from src.sequences import flatten
+
+
+def flatten_list(nested):
+    """The recursive version from the lessons."""
+    result = []
+    for item in nested:
+        if isinstance(item, list):
+            result.extend(flatten_list(item))
+        else:
+            result.append(item)
+    return result
+
+
+@pytest.mark.parametrize(
+    "nested",
+    [
+        [],
+        [1, 2, 3],
+        [1, [2, [3, [4]], 5], [], [[6]]],
+        [[[]], "ab", (1, [2]), [b"x", [None]]],
+    ],
+)
+def test_matches_the_recursive_version(nested):
+    assert list(flatten(nested)) == flatten_list(nested)
+
+
+def test_very_deep_nesting_does_not_recurse():
+    nested = [0]
+    for i in range(1, 10000):
+        nested = [nested, i]
+    assert list(flatten(nested)) == list(range(10000))
+
+
+def test_max_depth():
+    nested = [1, [2, [3, [4]]]]
+    assert list(flatten(nested, max_depth=0)) == nested
+    assert list(flatten(nested, max_depth=1)) == [1, 2, [3, [4]]]
+    assert list(flatten(nested, max_depth=2)) == [1, 2, 3, [4]]
+    with pytest.raises(ValueError):
+        flatten(nested, max_depth=-1)
+
+
+def test_container_types():
+    nested = [1, (2, [3]), {4}, "str", range(5, 7)]
+    assert list(flatten(nested, containers=(list, tuple))) == [
+        1,
+        2,
+        3,
+        {4},
+        "str",
+        range(5, 7),
+    ]
+    assert list(flatten(nested, containers=Iterable)) == [1, 2, 3, 4, "str", 5, 6]
+
+
+def test_leaves_are_yielded_lazily():
+    leaves = flatten([1, [2, [3]]])
+    assert next(leaves) == 1
+    assert next(leaves) == 2
+
+
+def test_cycles_are_rejected_but_shared_items_are_fine():
+    shared = [1, 2]
+    assert list(flatten([shared, shared])) == [1, 2, 1, 2]
+    cyclic = [1]
+    cyclic.append(cyclic)
+    with pytest.raises(ValueError):
+        list(flatten(cyclic))
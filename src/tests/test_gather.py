@@ -0,0 +1,94 @@
+"""Tests for :mod:`src.sequences.gather`."""
+
+import math
+from array import array
+
+import pytest
+
+from src.sequences import gather, safe_get
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+needs_numpy = pytest.mark.skipif(np is None, reason="needs numpy")
+
+INDICES = [0, 2, -1, -3, 3, -4, 10]
+
+
+def expected(seq, default):
+    return [safe_get(seq, i, default) for i in INDICES]
+
+
+def test_safe_get_bounds():
+    data = [1, 2, 3]
+    assert safe_get(data, 0) == 1
+    assert safe_get(data, -3) == 1
+    assert safe_get(data, 3) is None
+    assert safe_get(data, -4, "missing") == "missing"
+
+
+@pytest.mark.parametrize("default", [-1, None, "Not found", 2.5, (1, 2)])
+def test_gather_list_matches_safe_get(default):
+    data = [10, 20, 30]
+    assert gather(data, INDICES, default) == expected(data, default)
+    assert gather(data, iter(INDICES), default) == expected(data, default)
+
+
+@needs_numpy
+@pytest.mark.parametrize("default", [-1, None, "Not found", 2.5, (1, 2)])
+def test_gather_list_with_ndarray_indices(default):
+    data = [10, 20, 30]
+    assert gather(data, np.array(INDICES), default) == expected(data, default)
+
+
+@pytest.mark.parametrize("default", [-1, None, "Not found", 2.5])
+def test_gather_array_keeps_item_types(default):
+    data = array("q", [10, 20, 30])
+    result = gather(data, INDICES, default)
+    assert result == expected(data, default)
+    assert [type(x) for x in result] == [type(x) for x in expected(data, default)]
+
+
+def test_gather_array_nan_default():
+    result = gather(array("q", [1, 2, 3]), [0, 10], math.nan)
+    assert result[0] == 1 and type(result[0]) is int
+    assert math.isnan(result[1])
+
+
+@needs_numpy
+def test_gather_ndarray_keeps_dtype_when_default_fits():
+    data = np.array([10, 20, 30], dtype=np.int64)
+    result = gather(data, INDICES, -1)
+    assert result.dtype == np.int64
+    assert result.tolist() == expected(data.tolist(), -1)
+
+    floats = np.array([0.5, 1.5])
+    assert gather(floats, [0, 5], math.inf).dtype == floats.dtype
+
+
+@needs_numpy
+@pytest.mark.parametrize("default", [None, "x", math.nan, 2**70])
+def test_gather_ndarray_uses_object_array_for_other_defaults(default):
+    data = np.array([10, 20, 30])
+    result = gather(data, [1, 10], default)
+    assert result.dtype == object
+    assert result[0] == 20
+    assert result[1] is default
+
+
+@needs_numpy
+def test_gather_ndarray_sequence_default_is_stored_whole():
+    result = gather(np.array([1, 2]), [0, 5], (7, 8))
+    assert result[1] == (7, 8)
+
+
+def test_gather_empty_sequences():
+    assert gather([], [0, -1], "x") == ["x", "x"]
+    assert gather(array("q"), [0, 1], 0) == [0, 0]
+
+
+@needs_numpy
+def test_gather_empty_ndarray():
+    assert gather(np.array([], dtype=int), [0, 1], 0).tolist() == [0, 0]
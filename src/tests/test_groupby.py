@@ -0,0 +1,103 @@
+"""Tests for :mod:`src.records.groupby` and :mod:`src.records.parallel`."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.records import GroupBy, factorize, group_by, parallel_group_by
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+needs_numpy = pytest.mark.skipif(np is None, reason="needs numpy")
+WRAPS = [
+    pytest.param(list, id="list"),
+    pytest.param(lambda items: np.array(items), id="ndarray", marks=needs_numpy),
+]
+
+KEYS = ["b", "a", "b", "c", "a", "b"]
+VALUES = [1, 2, 3, 4, 5, 6]
+
+
+def test_factorize_first_seen_order():
+    codes, uniques = factorize(KEYS)
+    assert uniques == ["b", "a", "c"]
+    assert [uniques[c] for c in codes] == KEYS
+
+
+@needs_numpy
+def test_factorize_array():
+    codes, uniques = factorize(np.array([3, 1, 3, 2]))
+    assert uniques == [3, 1, 2]
+    assert codes.tolist() == [0, 1, 0, 2]
+
+
+@pytest.mark.parametrize("wrap", WRAPS)
+def test_aggregations_match_python(wrap):
+    by = GroupBy(wrap(KEYS))
+    values = wrap(VALUES)
+    assert by.count() == {"b": 3, "a": 2, "c": 1}
+    assert by.sum(values) == {"b": 10, "a": 7, "c": 4}
+    assert by.mean(values) == {"b": 10 / 3, "a": 3.5, "c": 4.0}
+    assert by.min(values) == {"b": 1, "a": 2, "c": 4}
+    assert by.max(values) == {"b": 6, "a": 5, "c": 4}
+    assert by.collect(values) == {"b": [1, 3, 6], "a": [2, 5], "c": [4]}
+
+
+def test_agg_several_and_errors():
+    result = group_by(KEYS, VALUES, ["count", "max"])
+    assert result["b"] == {"count": 3, "max": 6}
+    with pytest.raises(ValueError):
+        group_by(KEYS, VALUES, "median")
+    with pytest.raises(ValueError):
+        group_by(KEYS, None, "sum")
+    with pytest.raises(ValueError):
+        group_by(KEYS, VALUES[:2], "sum")
+
+
+@needs_numpy
+@pytest.mark.parametrize("dtype", ["int8", "uint8", "int16", "uint32"])
+def test_narrow_integer_sums_do_not_wrap(dtype):
+    keys = np.array([1, 1, 2])
+    values = np.array([100, 100, 3], dtype=dtype)
+    assert group_by(keys, values, "sum") == {1: 200, 2: 3}
+    assert group_by(keys, values, "mean") == {1: 100.0, 2: 3.0}
+
+
+@pytest.mark.parametrize("wrap", WRAPS)
+@pytest.mark.parametrize("how", ["count", "sum", "mean", "min", "max", "collect"])
+def test_empty_input(wrap, how):
+    empty = wrap([])
+    assert group_by(empty, empty, how) == {}
+
+
+@needs_numpy
+def test_bool_sums_count_true_values():
+    keys = np.array([1, 1, 2])
+    values = np.array([True, True, False])
+    assert group_by(keys, values, "sum") == {1: 2, 2: 0}
+    assert group_by(keys, values, "mean") == {1: 1.0, 2: 0.0}
+
+
+@needs_numpy
+@pytest.mark.parametrize("how", ["count", "sum", "mean", "min", "max", "collect"])
+def test_parallel_matches_serial(how):
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 50, 2000)
+    values = rng.integers(0, 100, 2000).astype(np.int8)
+    with ThreadPoolExecutor(2) as executor:
+        result = parallel_group_by(keys, values, how, partitions=4, executor=executor)
+    expected = group_by(keys, values, how)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@needs_numpy
+def test_parallel_sum_does_not_wrap():
+    keys = np.array([1, 1, 2])
+    values = np.array([True, True, True])
+    with ThreadPoolExecutor(2) as executor:
+        result = parallel_group_by(keys, values, "sum", executor=executor)
+    assert result == {1: 2, 2: 1}
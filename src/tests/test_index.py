@@ -0,0 +1,78 @@
+"""Tests for the secondary indexes in :mod:`src.records.index`."""
+
+import random
+
+import pytest
+
+from src.records import HashIndex, RecordStore, SortedIndex, make_index
+
+NAMES = ["ann", "bob", "cid", "dee"]
+
+
+def brute_range(store, field, low, high, include_low=True, include_high=True):
+    """Positions with ``low <= value <= high``, ordered by value then row."""
+    rows = []
+    for i, row in enumerate(store):
+        value = row[field]
+        above = value > low or (include_low and value == low)
+        below = value < high or (include_high and value == high)
+        if above and below:
+            rows.append((value, i))
+    return [i for _, i in sorted(rows)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_indexes_stay_in_sync_with_random_edits(seed):
+    rng = random.Random(seed)
+    store = RecordStore({"name": str, "grade": int})
+    by_grade = store.create_index("grade", "sorted")
+    by_name = store.create_index("name", "hash")
+    for _ in range(300):
+        op = rng.random()
+        if op < 0.5 or not len(store):
+            store.append({"name": rng.choice(NAMES), "grade": rng.randrange(10)})
+        elif op < 0.65:
+            store[rng.randrange(len(store))]["name"] = rng.choice(NAMES)
+        elif op < 0.8:
+            store[rng.randrange(len(store))]["grade"] = rng.randrange(10)
+        else:
+            del store[rng.randrange(len(store))]
+
+        low, high = sorted(rng.randrange(10) for _ in range(2))
+        assert by_grade.range(low, high) == brute_range(store, "grade", low, high)
+        assert by_grade.range(low, high, False, False) == brute_range(
+            store, "grade", low, high, False, False
+        )
+        assert by_grade.count_range(low, high) == len(by_grade.range(low, high))
+        name = rng.choice(NAMES)
+        assert by_name.lookup(name) == [
+            i for i, row in enumerate(store) if row["name"] == name
+        ]
+        assert len(by_grade) == len(by_name) == len(store)
+
+
+def test_sorted_index_queries():
+    index = SortedIndex("grade")
+    index.build([70, 90, 80, 90, 60])
+    assert index.range(80) == [2, 1, 3]
+    assert index.range(high=70) == [4, 0]
+    assert list(index.iter_range(75, 95)) == [2, 1, 3]
+    assert index.lookup(90) == [1, 3] and index.count(90) == 2
+    assert index.range(100) == [] and index.range(85, 80) == []
+    index.delete_row(70, 0)
+    assert index.lookup(90) == [0, 2] and len(index) == 4
+
+
+def test_hash_index_queries():
+    index = make_index("name", "hash")
+    assert isinstance(index, HashIndex)
+    index.build(["a", "b", "a"])
+    assert index.lookup("a") == [0, 2] and index.lookup("z") == []
+    assert index.count("a") == 2 and index.distinct == 2
+    index.add("c", 3)
+    index.discard("z", 0)  # unknown values are ignored
+    index.delete_row("a", 0)
+    assert index.lookup("a") == [1] and index.lookup("b") == [0]
+    assert index.lookup("c") == [2] and len(index) == 3
+    with pytest.raises(ValueError):
+        make_index("name", "btree")
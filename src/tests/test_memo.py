@@ -0,0 +1,103 @@
+"""Tests for :func:`src.cache.memoize` and :func:`src.cache.make_key`."""
+
+import threading
+
+import pytest
+
+from src.cache import Cache, ShardedCache, TTLCache, make_key, memoize
+
+
+def test_make_key():
+    assert make_key((5,), {}) == 5
+    assert make_key(("a",), {}) == "a"
+    assert make_key((1.5,), {}) == (1.5,)
+    assert make_key((1, 2), {}) == (1, 2)
+    assert make_key((1,), {"b": 2, "a": 1}) == make_key((1,), {"a": 1, "b": 2})
+    assert make_key((1,), {"a": 1}) != make_key((1, "a", 1), {})
+
+
+def test_bare_decorator_caches_results():
+    calls = []
+
+    @memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(3), square(3), square(4)] == [9, 9, 16]
+    assert calls == [3, 4]
+    assert square.__name__ == "square"
+    assert isinstance(square.cache, Cache)
+    info = square.cache_info()
+    assert (info["hits"], info["misses"], info["entries"]) == (1, 2, 2)
+    assert info["compute_latency"]["count"] == 2
+    square.cache_clear()
+    square(3)
+    assert calls == [3, 4, 3]
+
+
+def test_options_choose_the_cache():
+    @memoize(maxsize=2, policy="lfu")
+    def ident(x):
+        return x
+
+    for x in (1, 1, 2, 3):
+        ident(x)
+    assert sorted(ident.cache) == [1, 3]
+
+    @memoize(ttl=60, maxbytes=1 << 20)
+    def timed(x):
+        return x
+
+    assert isinstance(timed.cache, TTLCache)
+    assert timed.cache.maxbytes == 1 << 20
+
+
+def test_custom_key_and_plain_dict_cache():
+    store = {}
+
+    @memoize(cache=store, key=lambda args, kwargs: args[0] % 10)
+    def last_digit(x):
+        return x % 10
+
+    assert last_digit(13) == 3 and last_digit(23) == 3
+    assert store == {3: 3}
+    info = last_digit.cache_info()
+    assert set(info) == {"entries", "compute_latency"}
+    assert info["entries"] == 1 and info["compute_latency"]["count"] == 1
+
+
+def test_failures_are_not_cached():
+    calls = []
+
+    @memoize
+    def flaky(x):
+        calls.append(x)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return x
+
+    with pytest.raises(RuntimeError):
+        flaky(1)
+    assert flaky(1) == 1 and flaky(1) == 1
+    assert calls == [1, 1]
+
+
+def test_sharded_cache_coalesces_concurrent_misses():
+    release = threading.Event()
+    calls = []
+
+    @memoize(cache=ShardedCache(shards=4))
+    def slow(x):
+        calls.append(x)
+        release.wait(5)
+        return x
+
+    threads = [threading.Thread(target=slow, args=(1,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert calls == [1]
+    assert slow.cache_info()["shards"] == 4
@@ -0,0 +1,39 @@
+"""Tests for :mod:`src.text.mmap_tokens`."""
+
+import mmap
+
+import pytest
+
+from src.text import count_tokens_mmap, count_words, count_words_mmap, iter_token_views
+
+TEXT = "to be or\tnot to be\n\nthat is the  question café to\r\n"
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_bytes(TEXT.encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 1 << 20])
+def test_counts_match_streaming_count(path, chunk_size):
+    assert count_words_mmap(path, chunk_size=chunk_size) == count_words(path)
+    tokens = count_tokens_mmap(path, chunk_size)
+    assert tokens[b"to"] == 3 and tokens["café".encode()] == 1
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert count_tokens_mmap(str(path)) == {}
+    assert count_words_mmap(str(path)) == {}
+
+
+def test_token_views_point_into_the_map(path):
+    with open(path, "rb") as fp, mmap.mmap(
+        fp.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        views = iter_token_views(mm)
+        tokens = [bytes(view) for view in views]
+        assert tokens == TEXT.encode().split()
@@ -0,0 +1,83 @@
+"""Tests for :mod:`src.text.parallel`."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.text import count_words, merge_counts, parallel_count_words, shard_ranges
+
+WORDS = ["alpha", "beta", "gamma", "délta", "εψιλον", "z"]
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    rng = random.Random(0)
+    parts = []
+    for _ in range(5000):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice([" ", "  ", "\n", "\t"]))
+    path = tmp_path / "words.txt"
+    path.write_text("".join(parts), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("shards", [1, 2, 7, 64])
+def test_shard_ranges_cover_the_file_on_word_boundaries(text_file, shards):
+    data = Path(text_file).read_bytes()
+    ranges = shard_ranges(text_file, shards)
+    assert 1 <= len(ranges) <= shards
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1 : start].isspace()
+    pieces = [data[start:end].decode("utf-8").split() for start, end in ranges]
+    assert [word for piece in pieces for word in piece] == data.decode().split()
+
+
+def test_shard_ranges_of_edge_files(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert shard_ranges(str(empty), 4) == []
+    single = tmp_path / "single.txt"
+    single.write_bytes(b"oneverylongword")
+    assert shard_ranges(str(single), 4) == [(0, 15)]
+
+
+@pytest.mark.parametrize("shards", [1, 3, 16])
+def test_parallel_count_matches_streaming_count(text_file, shards):
+    expected = count_words(text_file)
+    with ThreadPoolExecutor(4) as executor:
+        result = parallel_count_words(
+            text_file, workers=4, shards=shards, chunk_size=64, executor=executor
+        )
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_single_worker_and_empty_file(text_file, tmp_path):
+    assert parallel_count_words(text_file, workers=1) == count_words(text_file)
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert parallel_count_words(str(empty), workers=2) == {}
+
+
+def test_merge_counts_keeps_first_seen_order():
+    left = {"a": 1, "b": 2}
+    assert merge_counts(left, {"c": 1, "a": 3}) is left
+    assert list(left.items()) == [("a", 4), ("b", 2), ("c", 1)]
+
+
+def test_partial_counts_are_merged_in_the_parent(text_file):
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(fn.__name__)
+            return super().submit(fn, *args, **kwargs)
+
+    with RecordingExecutor(4) as executor:
+        result = parallel_count_words(text_file, shards=8, executor=executor)
+    assert result == count_words(text_file)
+    assert set(submitted) == {"count_range"}
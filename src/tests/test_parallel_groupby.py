@@ -0,0 +1,91 @@
+"""Tests for :mod:`src.records.parallel`."""
+
+import random
+
+import pytest
+
+from src.records import group_by, hash_partition, parallel_group_by
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+needs_numpy = pytest.mark.skipif(np is None, reason="needs numpy")
+WRAPS = [
+    pytest.param(list, id="list"),
+    pytest.param(lambda items: np.array(items), id="ndarray", marks=needs_numpy),
+]
+
+rng = random.Random(0)
+KEYS = [rng.choice(["red", "green", "blue", "cyan", "pink"]) for _ in range(500)]
+VALUES = [rng.randrange(100) for _ in range(500)]
+
+
+@pytest.mark.parametrize(
+    "kind",
+    [
+        pytest.param(None, id="list"),
+        pytest.param(str, id="str-array", marks=needs_numpy),
+        pytest.param(int, id="int-array", marks=needs_numpy),
+        pytest.param(float, id="float-array", marks=needs_numpy),
+    ],
+)
+def test_hash_partition_is_disjoint_and_ordered(kind):
+    if kind is None:
+        keys = KEYS
+    else:
+        keys = np.array(KEYS if kind is str else VALUES, dtype=kind)
+    parts = hash_partition(keys, 4)
+    assert len(parts) == 4
+    positions = [i for part in parts for i in part]
+    assert sorted(positions) == list(range(len(keys)))
+    owner = {}
+    for number, part in enumerate(parts):
+        assert list(part) == sorted(part)
+        for i in part:
+            key = keys[i].item() if hasattr(keys[i], "item") else keys[i]
+            assert owner.setdefault(key, number) == number
+
+
+@pytest.mark.parametrize("wrap", WRAPS)
+def test_hash_partition_treats_negative_zero_as_zero(wrap):
+    parts = hash_partition(wrap([0.0, -0.0]), 8)
+    assert sorted(len(part) for part in parts)[-1] == 2
+    with pytest.raises(ValueError):
+        hash_partition(KEYS, 0)
+
+
+@pytest.mark.parametrize("wrap", WRAPS)
+def test_serial_path_matches_group_by(wrap):
+    how = ["count", "sum", "min", "collect"]
+    timings = {}
+    result = parallel_group_by(
+        wrap(KEYS), wrap(VALUES), how, workers=1, partitions=3, timings=timings
+    )
+    expected = group_by(wrap(KEYS), wrap(VALUES), how)
+    assert result == expected and list(result) == list(expected)
+    assert set(timings) == {"partition", "aggregate", "collect"}
+
+
+@pytest.mark.parametrize("wrap", WRAPS)
+def test_process_pool_matches_group_by(wrap):
+    keys, values = wrap(KEYS), wrap(VALUES)
+    result = parallel_group_by(keys, values, "mean", workers=2)
+    assert result == pytest.approx(group_by(keys, values, "mean"))
+    assert list(result) == list(group_by(keys, values, "mean"))
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        parallel_group_by(KEYS, VALUES, "median", workers=1)
+    with pytest.raises(ValueError):
+        parallel_group_by(KEYS, VALUES[:3], "sum", workers=1)
+    keys = KEYS if np is None else np.array(KEYS)
+    for how in ("collect", ["count", "max"]):
+        with pytest.raises(ValueError, match="needs a value column"):
+            parallel_group_by(keys, None, how, workers=2)
+    assert parallel_group_by(KEYS, None, "count", workers=1) == group_by(
+        KEYS, None, "count"
+    )
+    assert parallel_group_by([], [], "sum", workers=1) == {}
@@ -0,0 +1,213 @@
+"""Tests for :class:`src.cache.SqliteStore` and :class:`src.cache.TieredCache`."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.cache import Cache, SqliteStore, TieredCache
+
+TIMEOUT = 5.0
+
+
+def rows_on_disk(path, table="cache"):
+    """Number of entries committed to the file, read over a separate connection."""
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.sqlite")
+
+
+def test_round_trip_across_close_and_reopen(path):
+    with SqliteStore(path) as store:
+        store["a"] = {"nested": [1, 2]}
+        store[("tuple", 3)] = "value"
+        store["a"] = {"nested": [1, 2, 3]}
+    with SqliteStore(path) as store:
+        assert store["a"] == {"nested": [1, 2, 3]}
+        assert store[("tuple", 3)] == "value"
+        assert sorted(map(repr, store)) == ["'a'", "('tuple', 3)"]
+        assert len(store) == 2
+
+
+def test_opens_file_lazily_and_rejects_bad_tables(path, tmp_path):
+    store = SqliteStore(path)
+    assert not (tmp_path / "cache.sqlite").exists()
+    store.close()
+    with pytest.raises(ValueError):
+        SqliteStore(path, table="cache; DROP TABLE x")
+    with pytest.raises(ValueError):
+        store["a"] = 1
+
+
+def test_writes_are_buffered_until_flush(path):
+    with SqliteStore(path, flush_interval=60) as store:
+        store["a"] = 1
+        assert store["a"] == 1
+        assert rows_on_disk(path) == 0
+        store.flush()
+        assert rows_on_disk(path) == 1
+
+
+def test_batch_size_triggers_write_behind(path):
+    with SqliteStore(path, flush_interval=60, batch_size=3) as store:
+        store["a"] = 1
+        store["b"] = 2
+        time.sleep(0.05)
+        assert rows_on_disk(path) == 0
+        store["c"] = 3
+        deadline = time.monotonic() + TIMEOUT
+        while rows_on_disk(path) < 3:
+            assert time.monotonic() < deadline, "batch was not flushed"
+            time.sleep(0.01)
+
+
+def test_flush_does_not_block_buffered_readers_and_writers(path):
+    with SqliteStore(path, flush_interval=60) as store:
+        store["old"] = 1
+        store["gone"] = 2
+        store.flush()
+        store["slow"] = "value"
+        del store["gone"]
+        # Another connection holds the write lock, so the commit has to wait.
+        blocker = sqlite3.connect(path)
+        blocker.execute("BEGIN IMMEDIATE")
+        flusher = threading.Thread(target=store.flush)
+        flusher.start()
+        try:
+            deadline = time.monotonic() + TIMEOUT
+            while not store._flushing:
+                assert time.monotonic() < deadline, "flush did not start"
+                time.sleep(0.001)
+            # The batch being written stays readable, tombstones included.
+            assert store["slow"] == "value"
+            assert "gone" not in store
+            store["new"] = 3
+            assert store["new"] == 3
+            assert flusher.is_alive()  # none of the above waited for the flush
+        finally:
+            blocker.rollback()
+            blocker.close()
+            flusher.join(TIMEOUT)
+        assert not flusher.is_alive()
+        assert rows_on_disk(path) == 2  # "old" and "slow"
+        store.flush()
+    with SqliteStore(path) as store:
+        assert sorted(store) == ["new", "old", "slow"]
+
+
+def test_unpicklable_values_fail_on_store(path):
+    with SqliteStore(path, flush_interval=60) as store:
+        store["good"] = 1
+        with pytest.raises(TypeError):
+            store["bad"] = threading.Lock()
+        assert "bad" not in store
+        store.flush()
+        assert store.get("good", 0) == 1
+    assert rows_on_disk(path) == 1
+
+
+def test_failed_commit_keeps_the_batch_and_the_writer(path):
+    with SqliteStore(path, flush_interval=0.01) as store:
+        store._connection().execute("PRAGMA busy_timeout = 0")
+        blocker = sqlite3.connect(path)
+        blocker.execute("BEGIN IMMEDIATE")
+        store["a"] = 1
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+        assert store["a"] == 1  # back in the buffer
+        store["b"] = 2
+        time.sleep(0.05)  # the writer thread hits the same error
+        assert store._writer.is_alive()
+        blocker.rollback()
+        blocker.close()
+        deadline = time.monotonic() + TIMEOUT
+        while rows_on_disk(path) < 2:
+            assert time.monotonic() < deadline, "write-behind stopped"
+            time.sleep(0.01)
+
+
+def test_equal_keys_are_one_entry(path):
+    a = "".join(["ke", "y"])
+    b = "".join(["k", "ey"])
+    assert a == b and a is not b
+    with SqliteStore(path) as store:
+        store[(a, a)] = 1
+        assert store.get((a, b)) == 1
+        store[(a, b)] = 2
+        store[(1, "x")] = "int"
+        assert store[(1.0, "x")] == store[(True, "x")] == "int"
+        store[(True, "x")] = "bool"
+        assert len(store) == 2
+        assert sorted(map(repr, store)) == ["('key', 'key')", "(1, 'x')"]
+        assert store[(b, b)] == 2
+
+
+def test_delete_tombstones(path):
+    with SqliteStore(path, flush_interval=60) as store:
+        store["a"] = 1
+        store["b"] = 2
+        store.flush()
+        del store["a"]
+        # The row is still on disk, but the buffered tombstone hides it.
+        assert rows_on_disk(path) == 2
+        assert "a" not in store and store.get("a", "gone") == "gone"
+        with pytest.raises(KeyError):
+            del store["a"]
+        with pytest.raises(KeyError):
+            store["a"]
+        store["a"] = 3  # a write replaces the tombstone
+        assert store["a"] == 3
+        del store["a"]
+    with SqliteStore(path) as store:
+        assert "a" not in store
+        assert list(store) == ["b"]
+
+
+def test_clear_drops_buffered_and_stored_entries(path):
+    with SqliteStore(path, flush_interval=60) as store:
+        store["a"] = 1
+        store.flush()
+        store["b"] = 2
+        store.clear()
+        assert len(store) == 0 and "b" not in store
+    assert rows_on_disk(path) == 0
+
+
+def test_tables_share_a_file(path):
+    with SqliteStore(path, table="one") as one, SqliteStore(path, table="two") as two:
+        one["k"] = 1
+        two["k"] = 2
+    with SqliteStore(path, table="one") as one:
+        assert one["k"] == 1
+
+
+def test_tiered_cache_promotes_l2_hits(path):
+    with SqliteStore(path) as l2:
+        l2["cold"] = "from disk"
+        tiered = TieredCache(Cache(maxsize=2), l2)
+        assert "cold" not in tiered.l1
+        assert tiered["cold"] == "from disk"
+        assert tiered.l1["cold"] == "from disk"
+        assert tiered.get("missing") is None
+        assert (tiered.stats.hits, tiered.stats.misses) == (1, 1)
+
+        tiered["hot"] = "both"
+        assert tiered.l1["hot"] == "both" and l2["hot"] == "both"
+        del tiered["hot"]
+        assert "hot" not in tiered.l1 and "hot" not in l2
+        info = tiered.info()
+        assert info["entries"] == 1 and "l1" in info
+
+
+def test_tiered_cache_survives_restart(path):
+    with SqliteStore(path) as l2:
+        TieredCache(Cache(maxsize=2), l2)["k"] = "v"
+    with SqliteStore(path) as l2:
+        tiered = TieredCache(Cache(maxsize=2), l2)
+        assert tiered["k"] == "v"
+        assert "k" in tiered.l1
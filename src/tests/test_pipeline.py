@@ -0,0 +1,68 @@
+"""Tests for :class:`src.sequences.Pipeline`."""
+
+from itertools import count
+
+import pytest
+
+from src.sequences import Pipeline
+
+WORDS = ["apple", "kiwi", "banana", "fig", "cherry", "apple"]
+
+
+def test_steps_match_chained_comprehensions():
+    long_upper = [w.upper() for w in WORDS if len(w) > 4]
+    expected = [w[0] for w in long_upper]
+    pipeline = Pipeline(WORDS).filter(lambda w: len(w) > 4).map(str.upper)
+    assert pipeline.map(lambda w: w[0]).to_list() == expected
+    assert Pipeline(WORDS).flat_map(list).take(7).to_list() == list("appleki")
+    assert Pipeline([0, 1, "", "a"]).filter(None).to_list() == [1, "a"]
+
+
+def test_distinct_keeps_first_occurrences():
+    assert Pipeline(WORDS).distinct().to_list() == WORDS[:5]
+    assert Pipeline(WORDS).distinct(key=len).to_list() == [
+        "apple",
+        "kiwi",
+        "banana",
+        "fig",
+    ]
+
+
+def test_steps_are_lazy_and_stop_early():
+    seen = []
+
+    def record(x):
+        seen.append(x)
+        return x
+
+    pipeline = Pipeline(count()).map(record).filter(lambda x: x % 2).take(3)
+    assert seen == []
+    assert pipeline.to_list() == [1, 3, 5]
+    assert seen == [0, 1, 2, 3, 4, 5]
+    assert Pipeline(count()).map(lambda x: x * x).first() == 0
+    assert Pipeline([]).first("empty") == "empty"
+
+
+def test_pipelines_are_immutable_and_reusable():
+    base = Pipeline(range(10)).filter(lambda x: x % 2 == 0)
+    doubled = base.map(lambda x: 2 * x)
+    assert base.to_list() == [0, 2, 4, 6, 8]
+    assert doubled.to_list() == [0, 4, 8, 12, 16]
+    assert base.count() == 5 and Pipeline([]).count() == 0
+    assert repr(doubled) == "Pipeline(range).filter(...).map(...)"
+
+
+def test_to_dict():
+    assert Pipeline([("a", 1), ("b", 2)]).to_dict() == {"a": 1, "b": 2}
+    assert Pipeline(WORDS).to_dict(key=len) == {
+        5: "apple",
+        4: "kiwi",
+        6: "cherry",
+        3: "fig",
+    }
+    assert Pipeline(WORDS[:2]).to_dict(value=len) == {"apple": 5, "kiwi": 4}
+
+
+def test_take_rejects_negative_counts():
+    with pytest.raises(ValueError):
+        Pipeline([]).take(-1)
@@ -0,0 +1,115 @@
+"""Tests for :mod:`src.records.query`."""
+
+import random
+
+import pytest
+
+from src.records import OPERATORS, Predicate, RecordStore, query
+
+NAMES = ["alice", "alan", "bob", "bea", "carl", "cat", "dora"]
+
+
+def make_rows(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "name": rng.choice(NAMES),
+            "grade": rng.randrange(100),
+            "year": rng.randrange(4),
+        }
+        for _ in range(n)
+    ]
+
+
+def random_predicate(rng):
+    choice = rng.random()
+    if choice < 0.5:
+        op = rng.choice(["==", "!=", "<", "<=", ">", ">="])
+        return ("grade", op, rng.randrange(100))
+    if choice < 0.65:
+        return ("year", "in", rng.sample(range(4), 2))
+    if choice < 0.8:
+        prefixes = rng.choice(["a", "al", "c", ("b", "ca"), ("a", "al"), "z"])
+        return ("name", "startswith", prefixes)
+    if choice < 0.9:
+        # values of another type than the column: no matches, with or
+        # without an index
+        return rng.choice(
+            [
+                ("grade", "==", "x"),
+                ("grade", "in", [rng.randrange(100), "x"]),
+                ("name", "==", 3),
+            ]
+        )
+    return ("name", "==", rng.choice(NAMES))
+
+
+def brute_force(rows, predicates, fields, order, descending, limit):
+    matches = [
+        row
+        for row in rows
+        if all(OPERATORS[op](row[field], value) for field, op, value in predicates)
+    ]
+    if order is not None:
+        matches = sorted(matches, key=lambda row: row[order], reverse=descending)
+    if limit is not None:
+        matches = matches[:limit]
+    if len(fields) == 1:
+        return [row[fields[0]] for row in matches]
+    if fields:
+        return [{field: row[field] for field in fields} for row in matches]
+    return matches
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_queries_match_brute_force(seed):
+    rng = random.Random(seed)
+    rows = make_rows(300, seed)
+    plain = RecordStore.from_records(rows)
+    indexed = RecordStore.from_records(rows)
+    indexed.create_index("grade", "sorted")
+    indexed.create_index("name", "sorted")
+    indexed.create_index("year", "hash")
+    for _ in range(60):
+        predicates = [random_predicate(rng) for _ in range(rng.randint(0, 3))]
+        fields = rng.choice([(), ("name",), ("name", "grade")])
+        order = rng.choice([None, "grade", "name"])
+        descending = rng.random() < 0.5
+        limit = rng.choice([None, 1, 5])
+        expected = brute_force(rows, predicates, fields, order, descending, limit)
+        for source in (rows, plain, indexed):
+            q = query(source)
+            for predicate in predicates:
+                q.where(*predicate)
+            if fields:
+                q.select(*fields)
+            if order is not None:
+                q.order_by(order, descending)
+            if limit is not None:
+                q.limit(limit)
+            result = [r.to_dict() if hasattr(r, "to_dict") else r for r in q.run()]
+            assert result == expected, (predicates, q.explain())
+            assert q.count() == len(expected)
+
+
+def test_planner_uses_the_most_selective_index():
+    store = RecordStore.from_records(make_rows(1000))
+    store.create_index("grade")
+    store.create_index("year", "hash")
+    q = query(store).where("year", "==", 1).where("grade", ">=", 98)
+    plan = q.explain()
+    assert plan.splitlines()[0].startswith("access: sorted index range on grade")
+    assert "full scan" in query(make_rows(10)).where("grade", ">", 0).explain()
+    mistyped = query(store).where("grade", "==", "x")
+    assert mistyped.explain().startswith("access: full scan")
+    assert mistyped.run() == []
+
+
+def test_callable_filters_and_first():
+    rows = make_rows(50)
+    q = query(rows).where(lambda row: row["grade"] % 2 == 0).select("grade")
+    assert all(grade % 2 == 0 for grade in q.run())
+    assert query(rows).where("grade", ">", 1000).first() is None
+    assert repr(Predicate("grade", ">=", 3)) == "grade >= 3"
+    with pytest.raises(ValueError):
+        query(rows).where("grade", "~", 3)
@@ -0,0 +1,83 @@
+"""Tests for :mod:`src.sequences.ring`."""
+
+import random
+
+import pytest
+
+from src.sequences import RingBuffer
+
+
+def rotate_list(lst, n):
+    n = n % len(lst)
+    return lst[n:] + lst[:n]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_matches_rotate_list(typecode):
+    rng = random.Random(0)
+    expected = list(range(37))
+    ring = RingBuffer(expected, typecode=typecode)
+    for _ in range(300):
+        n = rng.randrange(-100, 100)
+        ring.rotate(n)
+        expected = rotate_list(expected, n)
+        assert ring == expected
+        assert list(reversed(ring)) == expected[::-1]
+        assert ring.to_list() == expected
+        i = rng.randrange(-37, 37)
+        assert ring[i] == expected[i]
+        start, stop = sorted(rng.randrange(-40, 40) for _ in range(2))
+        step = rng.choice([1, 1, 2, -1, -3])
+        assert ring[start:stop:step] == expected[start:stop:step]
+        value = rng.randrange(1000)
+        ring[i] = value
+        expected[i] = value
+        assert ring == expected
+
+
+def test_offset_and_default_rotation():
+    ring = RingBuffer("abcd")
+    ring.rotate()
+    assert ring.offset == 1
+    assert ring == list("bcda")
+    ring.rotate(-2)
+    assert ring.offset == 3
+    assert ring == list("dabc")
+
+
+def test_index_errors():
+    ring = RingBuffer([1, 2, 3])
+    ring.rotate(2)
+    for index in (3, -4):
+        with pytest.raises(IndexError):
+            ring[index]
+        with pytest.raises(IndexError):
+            ring[index] = 0
+
+
+def test_empty():
+    ring = RingBuffer()
+    ring.rotate(5)
+    assert len(ring) == 0
+    assert list(ring) == list(reversed(ring)) == ring[:] == []
+    with pytest.raises(IndexError):
+        ring[0]
+
+
+def test_array_storage_checks_types():
+    ring = RingBuffer(range(4), typecode="q")
+    with pytest.raises(TypeError):
+        ring[0] = "x"
+
+
+def test_sequence_protocol():
+    ring = RingBuffer([3, 1, 2])
+    ring.rotate(1)
+    assert 3 in ring and 4 not in ring
+    assert ring.index(3) == 2
+    assert ring.count(1) == 1
+    assert ring == (1, 2, 3)
+    assert ring != [1, 2]
+    assert repr(ring) == "RingBuffer([1, 2, 3])"
+    with pytest.raises(TypeError):
+        hash(ring)
@@ -0,0 +1,146 @@
+"""Tests for :class:`src.cache.ShardedCache`."""
+
+import threading
+import time
+
+import pytest
+
+from src.cache import ShardedCache
+
+WAITERS = 8
+TIMEOUT = 5.0
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def run_concurrently(cache, key, compute):
+    """Call ``get_or_compute`` from several threads; collect their outcomes."""
+    outcomes = [None] * WAITERS
+
+    def worker(i):
+        try:
+            outcomes[i] = ("value", cache.get_or_compute(key, compute))
+        except Exception as exc:
+            outcomes[i] = ("error", exc)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(WAITERS)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_mapping_interface():
+    cache = ShardedCache(maxsize=100, shards=4)
+    cache["a"] = 1
+    cache.update(b=2, c=3)
+    assert cache["a"] == 1 and cache.get("z") is None and cache.peek("b") == 2
+    assert "c" in cache and len(cache) == 3
+    assert sorted(cache) == ["a", "b", "c"]
+    del cache["a"]
+    with pytest.raises(KeyError):
+        cache["a"]
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        ShardedCache(shards=0)
+
+
+def test_single_flight_leader_and_waiters():
+    cache = ShardedCache(shards=4)
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(threading.get_ident())
+        release.wait(TIMEOUT)
+        return "value"
+
+    threads, outcomes = run_concurrently(cache, "key", compute)
+    # Every thread has missed: one is computing and the rest are waiting on it.
+    wait_until(lambda: cache.stats.misses == WAITERS)
+    release.set()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    assert len(calls) == 1
+    assert outcomes == [("value", "value")] * WAITERS
+    assert cache["key"] == "value"
+    assert cache.get_or_compute("key", lambda: pytest.fail("recomputed")) == "value"
+    assert cache.stats.latency.count == 1
+
+
+def test_exception_reaches_waiters_and_is_not_cached():
+    cache = ShardedCache(shards=4)
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(None)
+        release.wait(TIMEOUT)
+        raise RuntimeError("boom")
+
+    threads, outcomes = run_concurrently(cache, "key", compute)
+    wait_until(lambda: cache.stats.misses == WAITERS)
+    release.set()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    assert len(calls) == 1
+    errors = [outcome[1] for outcome in outcomes]
+    assert all(outcome[0] == "error" for outcome in outcomes)
+    assert all(error is errors[0] for error in errors)
+    assert "key" not in cache
+    # The failure left nothing in flight, so the next call computes again.
+    assert cache.get_or_compute("key", lambda: 42) == 42
+
+
+def test_different_keys_compute_independently():
+    cache = ShardedCache(shards=2)
+    release = threading.Event()
+
+    def slow():
+        release.wait(TIMEOUT)
+        return "slow"
+
+    thread = threading.Thread(target=cache.get_or_compute, args=(0, slow))
+    thread.start()
+    wait_until(lambda: cache.stats.misses == 1)
+    # Key 1 lives in the other shard and key 2 in the same one; neither waits.
+    assert cache.get_or_compute(1, lambda: "fast") == "fast"
+    assert cache.get_or_compute(2, lambda: "fast") == "fast"
+    release.set()
+    thread.join(TIMEOUT)
+    assert cache[0] == "slow"
+
+
+def test_eviction_is_per_shard():
+    # Two shards of one entry each; small ints hash to themselves.
+    cache = ShardedCache(maxsize=2, shards=2)
+    cache[0] = "a"
+    cache[1] = "b"
+    cache[2] = "c"  # same shard as 0, so 0 goes even though 1 is older
+    assert 0 not in cache
+    assert cache[1] == "b" and cache[2] == "c"
+    cache[4] = "d"
+    assert sorted(cache) == [1, 4]
+    assert cache.stats.evictions == 2
+    assert cache.info()["shards"] == 2
+    assert cache.info()["bytes"] is None
+    sized = ShardedCache(shards=2, maxbytes=100, sizeof=len)
+    sized["a"] = "xyz"
+    sized["b"] = "uv"
+    assert sized.info()["bytes"] == 5
+
+
+def test_ttl_shards_expire():
+    cache = ShardedCache(shards=2, ttl=0.01)
+    cache["a"] = 1
+    time.sleep(0.03)
+    assert cache.get("a") is None
+    assert cache.get_or_compute("a", lambda: 2) == 2
@@ -0,0 +1,59 @@
+"""Tests for :mod:`src.cache.stats`."""
+
+import io
+import json
+
+from src.cache import Cache, CacheStats, LatencyHistogram, dump_stats, memoize
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.mean == 0.0 and histogram.percentile(0.5) == 0.0
+    for seconds in [0.000001] * 90 + [0.001] * 9 + [1.0]:
+        histogram.record(seconds)
+    assert histogram.count == 100 and histogram.max == 1.0
+    # Percentiles are bucket upper bounds: within a factor of two.
+    assert 0.000001 <= histogram.percentile(0.5) <= 0.000002
+    assert 0.001 <= histogram.percentile(0.99) <= 0.002
+    assert histogram.percentile(1.0) == 1.0
+    assert histogram.to_dict()["buckets_us"] == {"<2": 90, "<1024": 9, "<1048576": 1}
+
+
+def test_histogram_clamps_huge_durations():
+    histogram = LatencyHistogram()
+    histogram.record(10.0**9)
+    assert histogram.counts[-1] == 1
+
+
+def test_merged_stats_add_up():
+    parts = [CacheStats(), CacheStats()]
+    parts[0].hits, parts[0].misses = 3, 1
+    parts[1].hits, parts[1].evictions = 1, 2
+    parts[1].latency.record(0.5)
+    total = CacheStats.merged(parts)
+    assert (total.hits, total.misses, total.evictions) == (4, 1, 2)
+    assert total.lookups == 5 and total.hit_ratio == 0.8
+    assert total.latency.count == 1
+    total.reset()
+    assert total.lookups == 0 and total.latency.count == 0
+
+
+def test_dump_stats_for_caches_and_memoized_functions():
+    @memoize
+    def square(x):
+        return x * x
+
+    square(2)
+    square(2)
+    fp = io.StringIO()
+    text = dump_stats(square, fp)
+    assert fp.getvalue() == text
+    info = json.loads(text)
+    assert (info["hits"], info["misses"], info["entries"]) == (1, 1, 1)
+    assert info["compute_latency"]["count"] == 1
+
+    cache = Cache(maxsize=1)
+    cache["a"] = 1
+    cache["b"] = 2
+    info = json.loads(dump_stats(cache))
+    assert info["evictions"] == 1 and info["bytes"] is None
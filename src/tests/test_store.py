@@ -0,0 +1,102 @@
+"""Tests for :class:`src.records.RecordStore`."""
+
+import pytest
+
+from src.records import RecordStore
+
+SCHEMA = {"name": str, "grade": int, "passed": bool, "score": float}
+RECORDS = [
+    {"name": "Alice", "grade": 85, "passed": True, "score": 8.5},
+    {"name": "Bob", "grade": 40, "passed": False, "score": 4.0},
+    {"name": "Alice", "grade": 92, "passed": True, "score": 9.2},
+]
+
+
+@pytest.fixture
+def store():
+    return RecordStore(SCHEMA, RECORDS)
+
+
+def test_rows_behave_like_dicts(store):
+    assert len(store) == 3
+    assert [row.to_dict() for row in store] == RECORDS
+    assert store[-1] == RECORDS[-1]
+    assert [s["name"] for s in store if s["grade"] >= 80] == ["Alice", "Alice"]
+    assert [row["grade"] for row in store[1:]] == [40, 92]
+    assert store.column("name").values == ["Alice", "Bob"]
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_from_records_infers_schema():
+    store = RecordStore.from_records(RECORDS)
+    assert store.schema == SCHEMA
+    assert [row.to_dict() for row in store] == RECORDS
+    with pytest.raises(ValueError):
+        RecordStore.from_records([])
+
+
+def test_updates_and_deletes(store):
+    store[0]["grade"] = 70
+    store[1]["name"] = "Carol"
+    store[1]["passed"] = True
+    assert store[0]["grade"] == 70
+    assert store[1].to_dict()["name"] == "Carol" and store[1]["passed"] is True
+    del store[0]
+    assert [row["name"] for row in store] == ["Carol", "Alice"]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("name", 5),
+        ("name", None),
+        ("passed", "no"),
+        ("passed", 1),
+        ("grade", "90"),
+        ("score", "high"),
+    ],
+)
+def test_append_rejects_wrong_types_and_rolls_back(store, field, value):
+    record = dict(RECORDS[0], **{field: value})
+    with pytest.raises(TypeError):
+        store.append(record)
+    assert len(store) == 3
+    assert all(len(column) == 3 for column in store._columns.values())
+    assert [row.to_dict() for row in store] == RECORDS
+
+
+def test_append_rolls_back_on_overflow():
+    store = RecordStore({"name": str, "small": "b"})
+    with pytest.raises(OverflowError):
+        store.append({"name": "x", "small": 1000})
+    assert len(store) == 0 and len(store.column("name")) == 0
+
+
+@pytest.mark.parametrize("field, value", [("name", 5), ("passed", "no")])
+def test_setitem_rejects_wrong_types(store, field, value):
+    store.create_index(field, "hash")
+    with pytest.raises(TypeError):
+        store[1][field] = value
+    assert store[1] == RECORDS[1]
+    assert store.get_index(field).lookup(RECORDS[1][field]) == [1]
+
+
+def test_indexes_follow_changes(store):
+    by_name = store.create_index("name", "hash")
+    by_grade = store.create_index("grade")
+    assert store.create_index("grade") is by_grade
+    assert by_name.lookup("Alice") == [0, 2]
+    store.append({"name": "Dan", "grade": 60, "passed": True, "score": 6.0})
+    store[0]["name"] = "Eve"
+    assert by_name.lookup("Alice") == [2] and by_name.lookup("Eve") == [0]
+    del store[1]
+    assert by_name.lookup("Dan") == [2]
+    assert by_grade.range(60, 90) == [2, 0]
+    assert store.get_index("grade", "hash") is None
+    store.drop_index("grade")
+    assert store.get_index("grade") is None
+
+
+def test_nbytes_counts_columns(store):
+    assert store.nbytes() > 0
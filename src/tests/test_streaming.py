@@ -0,0 +1,69 @@
+"""Tests for :mod:`src.text.streaming`."""
+
+import gc
+import io
+
+import pytest
+
+from src.text.streaming import count_words, iter_chunks, iter_words
+
+TEXT = "the quick  brown fox\njumps over the lazy dog\n\nthe end"
+EXPECTED = {
+    "the": 3,
+    "quick": 1,
+    "brown": 1,
+    "fox": 1,
+    "jumps": 1,
+    "over": 1,
+    "lazy": 1,
+    "dog": 1,
+    "end": 1,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+def test_chunks_end_on_word_boundaries(chunk_size):
+    chunks = list(iter_chunks(io.StringIO(TEXT), chunk_size))
+    assert "".join(chunks) == TEXT
+    assert [w for chunk in chunks for w in chunk.split()] == TEXT.split()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+def test_count_words_sources(tmp_path, chunk_size):
+    path = tmp_path / "words.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    assert count_words(path, chunk_size) == EXPECTED
+    assert count_words(str(path), chunk_size) == EXPECTED
+    assert count_words(io.StringIO(TEXT), chunk_size) == EXPECTED
+    assert count_words(io.BytesIO(TEXT.encode()), chunk_size) == EXPECTED
+    assert count_words(TEXT.splitlines(), chunk_size) == EXPECTED
+    assert list(count_words(io.StringIO(TEXT), chunk_size)) == list(EXPECTED)
+
+
+def test_multibyte_characters_split_across_reads():
+    text = "café naïve café 日本語 naïve"
+    for chunk_size in (1, 2, 3, 5):
+        data = io.BytesIO(text.encode("utf-8"))
+        assert list(iter_words(data, chunk_size)) == text.split()
+
+
+def test_binary_file_is_left_open():
+    data = io.BytesIO(b"a b a")
+    assert count_words(data) == {"a": 2, "b": 1}
+    gc.collect()
+    assert not data.closed
+    data.seek(0)
+    assert data.read() == b"a b a"
+
+
+def test_abandoned_generator_leaves_binary_file_open():
+    data = io.BytesIO(b"a b c d")
+    words = iter_words(data, chunk_size=2)
+    assert next(words) == "a"
+    del words
+    gc.collect()
+    assert not data.closed
+
+
+def test_counts_accumulate():
+    assert count_words(["a b"], counts={"a": 1, "z": 2}) == {"a": 2, "z": 2, "b": 1}
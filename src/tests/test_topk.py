@@ -0,0 +1,86 @@
+"""Tests for :mod:`src.text.topk`."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.text import ExactCounter, SpaceSaving, make_counter, top_words
+
+
+def zipf_stream(n, seed=0):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(2000)]
+    weights = [1 / (i + 1) for i in range(len(words))]
+    return rng.choices(words, weights, k=n)
+
+
+def check_guarantees(counter, truth):
+    total = sum(truth.values())
+    assert counter.total == total
+    assert len(counter) <= counter.capacity
+    bound = total / counter.capacity
+    for item, true_count in truth.items():
+        estimate = counter.estimate(item)
+        if estimate:
+            assert estimate - counter.error(item) <= true_count <= estimate
+            assert counter.error(item) <= bound
+        else:
+            assert true_count <= bound  # heavy hitters are always tracked
+
+
+def test_exact_counter():
+    counter = make_counter("exact")
+    counter.update("abracadabra")
+    counter.add("z", 3)
+    assert counter.estimate("a") == 5 and counter.error("a") == 0
+    assert counter.top(2) == [("a", 5), ("z", 3)]
+    other = ExactCounter()
+    other.add("a")
+    assert counter.merge(other).estimate("a") == 6
+    assert counter.total == 15 and len(counter) == 6
+
+
+@pytest.mark.parametrize("capacity", [1, 10, 100])
+def test_space_saving_error_bounds(capacity):
+    stream = zipf_stream(20000)
+    counter = SpaceSaving(capacity)
+    counter.update(stream)
+    check_guarantees(counter, Counter(stream))
+
+
+def test_space_saving_finds_the_top_items():
+    stream = zipf_stream(20000)
+    counter = SpaceSaving(200)
+    counter.update(stream)
+    expected = [word for word, _ in Counter(stream).most_common(5)]
+    assert [word for word, _ in counter.top(5)] == expected
+
+
+def test_space_saving_merge_keeps_the_bounds():
+    left_stream, right_stream = zipf_stream(10000, 1), zipf_stream(10000, 2)
+    left, right = SpaceSaving(50), SpaceSaving(50)
+    left.update(left_stream)
+    right.update(right_stream)
+    merged = left.merge(right)
+    assert merged is left
+    check_guarantees(merged, Counter(left_stream) + Counter(right_stream))
+
+
+def test_weighted_adds_and_validation():
+    counter = SpaceSaving(2)
+    counter.add("a", 5)
+    counter.add("b", 1)
+    counter.add("c", 2)  # replaces "b" and inherits its count as error
+    assert counter.to_dict() == {"a": 5, "c": 3}
+    assert counter.error("c") == 1
+    with pytest.raises(ValueError):
+        SpaceSaving(0)
+    with pytest.raises(ValueError):
+        make_counter("sketch")
+
+
+@pytest.mark.parametrize("mode", ["exact", "spacesaving"])
+def test_top_words(mode):
+    lines = ["the cat and the hat", "the end"]
+    assert top_words(lines, k=2, mode=mode) == {"the": 3, "cat": 1}
@@ -0,0 +1,102 @@
+"""Tests for :class:`src.cache.TTLCache`."""
+
+import time
+
+import pytest
+
+from src.cache import TTLCache
+
+
+class Clock:
+    """Manually advanced timer."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_entries_expire_lazily(clock):
+    cache = TTLCache(maxsize=10, ttl=5, timer=clock)
+    cache["a"] = 1
+    cache.set("b", 2, ttl=20)
+    clock.now = 4.9
+    assert cache["a"] == 1 and "a" in cache
+    clock.now = 5
+    assert "a" not in cache and cache.peek("a") is None
+    assert len(cache) == 2  # not read or swept yet
+    assert list(cache) == ["b"]
+    assert cache.get("a", "gone") == "gone"
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert len(cache) == 1
+    assert cache.stats.expirations == 1 and cache.stats.misses == 2
+
+
+def test_overwrite_resets_the_deadline(clock):
+    cache = TTLCache(ttl=5, timer=clock)
+    cache["a"] = 1
+    clock.now = 4
+    cache["a"] = 2
+    clock.now = 8
+    assert cache["a"] == 2
+    assert cache.expire() == 0  # the first deadline is stale
+    clock.now = 9
+    assert cache.expire() == 1 and len(cache) == 0
+
+
+def test_expire_limit_and_batch_helpers(clock):
+    cache = TTLCache(maxsize=None, ttl=1, timer=clock)
+    cache.set_many((i, i) for i in range(10))
+    assert cache.get_many([0, 10], -1) == [0, -1]
+    clock.now = 2
+    assert cache.expire(limit=4) == 4
+    assert len(cache) == 6
+    assert cache.expire() == 6
+    assert cache.info()["ttl"] == 1
+
+
+@pytest.mark.parametrize("limits", [{"maxsize": 2}, {"maxbytes": 2, "sizeof": len}])
+def test_full_cache_drops_expired_entries_before_live_ones(clock, limits):
+    cache = TTLCache(ttl=10, timer=clock, **limits)
+    cache.set("old", "x", ttl=1)
+    cache["live"] = "y"
+    cache["live"]  # "old" is now the least recently used
+    clock.now = 2
+    cache["new"] = "z"
+    assert sorted(cache) == ["live", "new"]
+    assert cache.stats.expirations == 1 and cache.stats.evictions == 0
+
+
+def test_oversized_values_are_not_tracked(clock):
+    cache = TTLCache(ttl=1, maxbytes=4, sizeof=len, timer=clock)
+    cache["big"] = "xxxxx"
+    assert "big" not in cache
+    clock.now = 2
+    assert cache.expire() == 0
+
+
+def test_background_sweeper():
+    cache = TTLCache(maxsize=None, ttl=0.01, sweep_interval=0.01, sweep_batch=3)
+    try:
+        cache.set_many((i, i) for i in range(10))
+        deadline = time.monotonic() + 5
+        while len(cache):
+            assert time.monotonic() < deadline, "sweeper did not expire entries"
+            time.sleep(0.01)
+        with pytest.raises(RuntimeError):
+            cache.start_sweeper(1)
+    finally:
+        cache.stop_sweeper()
+    cache.stop_sweeper()  # stopping twice is harmless
+
+
+def test_invalid_ttl():
+    with pytest.raises(ValueError):
+        TTLCache(ttl=0)
@@ -0,0 +1,63 @@
+"""Tests for :class:`src.text.Vocabulary` and :class:`src.text.IdCounter`."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.text import IdCounter, Vocabulary
+
+
+def test_vocabulary_ids_are_dense_and_stable():
+    vocab = Vocabulary(["b", "a", "b"])
+    assert list(vocab) == ["b", "a"] and len(vocab) == 2
+    assert vocab.add("c") == 2 and vocab.add("a") == 1
+    ids = vocab.encode(["a", "d", "b"])
+    assert ids.tolist() == [1, 3, 0]
+    assert vocab.decode(ids) == ["a", "d", "b"]
+    assert vocab.get("zz") is None and vocab.get("zz", -1) == -1
+    assert vocab.id("d") == 3 and vocab.word(3) == "d"
+    assert "d" in vocab and "zz" not in vocab
+    with pytest.raises(KeyError):
+        vocab.id("zz")
+    with pytest.raises(IndexError):
+        vocab.word(-1)
+    with pytest.raises(IndexError):
+        vocab.word(4)
+
+
+def test_intern_returns_the_shared_copy():
+    vocab = Vocabulary()
+    first = "".join(["wo", "rd"])
+    second = "".join(["w", "ord"])
+    assert first is not second
+    assert vocab.intern(first) is first
+    assert vocab.intern(second) is first
+
+
+@pytest.mark.parametrize("n", [10, 5000])  # small batches loop, large use NumPy
+def test_id_counter_matches_counter(n):
+    rng = random.Random(n)
+    words = [f"w{rng.randrange(300)}" for _ in range(n)]
+    counter = IdCounter()
+    counter.update(words)
+    counter.update(words[:7])
+    counter.add("extra", 3)
+    expected = Counter(words) + Counter(words[:7]) + Counter({"extra": 3})
+    assert counter.to_dict() == dict(expected)
+    assert list(counter.to_dict()) == list(expected)
+    assert counter.get("extra") == 3 and counter.get("missing") == 0
+    assert len(counter) == len(expected)
+    top = counter.top(3)
+    assert [c for _, c in top] == [c for _, c in expected.most_common(3)]
+
+
+def test_counters_share_a_vocabulary():
+    vocab = Vocabulary()
+    left, right = IdCounter(vocab), IdCounter(vocab)
+    left.update(["a", "b"])
+    right.update(["c", "a", "c"])
+    assert left.to_dict() == {"a": 1, "b": 1}
+    assert right.to_dict() == {"a": 1, "c": 2}
+    assert left.get("c") == 0 and left.top(5) == [("a", 1), ("b", 1)]
+    assert len(vocab) == 3
@@ -0,0 +1,58 @@
+"""Tests for :class:`src.text.WindowedCounter`."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.text import WindowedCounter
+
+
+def expected_counts(events, now, width, buckets):
+    """Brute force: an event counts while its bucket is one of the newest."""
+    current = int(now // width)
+    counts = Counter()
+    for when, item in events:
+        if current - int(when // width) < buckets:
+            counts[item] += 1
+    return dict(counts)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    counter = WindowedCounter(window=10.0, buckets=5, timer=lambda: 0.0)
+    events = []
+    now = 0.0
+    for _ in range(500):
+        now += rng.choice([0.0, 0.1, 0.5, 1.5, 7.0])
+        item = rng.choice("abcde")
+        # Mostly current events, some a little late but still in the window.
+        when = max(0.0, now - rng.choice([0.0, 0.0, 3.0]))
+        counter.add(item, now=when)
+        events.append((when, item))
+        assert counter.counts(now) == expected_counts(events, now, 2.0, 5)
+    assert counter.get("a", now) == expected_counts(events, now, 2.0, 5).get("a", 0)
+
+
+def test_expiry_and_queries():
+    clock = [0.0]
+    counter = WindowedCounter(window=60, buckets=6, timer=lambda: clock[0])
+    counter.update(["error", "error", "warn"])
+    clock[0] = 30
+    counter.add("error", 3)
+    assert counter.get("error") == 5 and len(counter) == 2
+    assert counter.top(1) == [("error", 5)]
+    clock[0] = 65  # the first bucket has left the window
+    assert counter.counts() == {"error": 3}
+    counter.add("late", now=1)  # older than the window: ignored
+    assert counter.get("late") == 0
+    clock[0] = 1000  # everything expired at once
+    assert counter.counts() == {} and len(counter) == 0
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        WindowedCounter(window=0)
+    with pytest.raises(ValueError):
+        WindowedCounter(buckets=0)
@@ -0,0 +1,33 @@
+"""
+Text processing utilities.
+
+Scalable versions of the word-counting patterns used in the learning
+materials.
+"""
+
+from .mmap_tokens import count_tokens_mmap, count_words_mmap, iter_token_views
+from .parallel import merge_counts, parallel_count_words, shard_ranges
+from .streaming import count_words, iter_chunks, iter_words
+from .topk import COUNTERS, ExactCounter, SpaceSaving, make_counter, top_words
+from .vocab import IdCounter, Vocabulary
+from .windowed import WindowedCounter
+
+__all__ = [
+    "COUNTERS",
+    "ExactCounter",
+    "IdCounter",
+    "SpaceSaving",
+    "Vocabulary",
+    "WindowedCounter",
+    "count_tokens_mmap",
+    "count_words",
+    "count_words_mmap",
+    "iter_chunks",
+    "iter_token_views",
+    "iter_words",
+    "make_counter",
+    "merge_counts",
+    "parallel_count_words",
+    "shard_ranges",
+    "top_words",
+]
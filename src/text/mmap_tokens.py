@@ -0,0 +1,82 @@
+"""
+Memory-mapped tokenizing and counting on raw bytes.
+
+Instead of decoding the whole file and allocating a ``str`` for every token,
+the file is memory-mapped, split on ASCII whitespace as bytes and counted
+with ``bytes`` keys. Only the final vocabulary is decoded.
+
+Only ASCII whitespace separates tokens here (``bytes.split()`` semantics);
+``str.split()`` also splits on Unicode spaces such as U+00A0, so results can
+differ for text containing them.
+"""
+
+import mmap
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterator
+
+from .streaming import DEFAULT_CHUNK_SIZE
+
+_SPACE = re.compile(rb"[ \t\n\r\x0b\x0c]")
+_TOKEN = re.compile(rb"[^ \t\n\r\x0b\x0c]+")
+
+
+def iter_token_views(mm: mmap.mmap) -> Iterator[memoryview]:
+    """Yield each token of a mapped file as a zero-copy ``memoryview``.
+
+    The views point into ``mm``: use (or copy) each one before closing the
+    map, and exhaust or ``close()`` this generator first, since the map
+    cannot be closed while views of it are alive.
+    """
+    view = memoryview(mm)
+    try:
+        for match in _TOKEN.finditer(mm):
+            yield view[match.start() : match.end()]
+    finally:
+        view.release()
+
+
+def count_tokens_mmap(
+    path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[bytes, int]:
+    """Count the whitespace-separated tokens of a file, keyed on ``bytes``.
+
+    The file is mapped rather than read; each step copies one chunk of at
+    least ``chunk_size`` bytes, extended to the next whitespace so no token
+    is split, and counts it with ``bytes.split()``.
+    """
+    if os.path.getsize(path) == 0:
+        return {}
+    counts: Counter = Counter()
+    with open(path, "rb") as fp, mmap.mmap(
+        fp.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        size = len(mm)
+        pos = 0
+        while pos < size:
+            end = pos + chunk_size
+            if end < size:
+                match = _SPACE.search(mm, end)
+                end = match.end() if match else size
+            counts.update(mm[pos:end].split())
+            pos = end
+    return dict(counts)
+
+
+def count_words_mmap(
+    path: str,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, int]:
+    """Like :func:`~src.text.streaming.count_words`, decoding only the vocabulary.
+
+    Args:
+        path: File to count.
+        encoding: Encoding of the file; must be ASCII-compatible.
+        chunk_size: Bytes copied out of the map per step.
+    """
+    return {
+        word.decode(encoding): count
+        for word, count in count_tokens_mmap(path, chunk_size).items()
+    }
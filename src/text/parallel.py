@@ -0,0 +1,145 @@
+"""
+Multi-process word counting.
+
+A file is cut into byte ranges that start and end on ASCII whitespace, and
+each range is counted in a worker process. The parent merges the partial
+counts in range order as they arrive, while later ranges are still being
+counted, so each partial result crosses the process boundary only once.
+"""
+
+import codecs
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from .streaming import DEFAULT_CHUNK_SIZE, count_words
+
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+_PROBE = 1 << 16
+
+
+def shard_ranges(path: str, shards: int) -> List[Tuple[int, int]]:
+    """Split a file into at most ``shards`` byte ranges aligned on whitespace.
+
+    Ranges only begin right after an ASCII whitespace byte, so no word is
+    split between two ranges. In UTF-8 such bytes never occur inside a
+    multi-byte character, so every range is also valid text on its own.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    shards = max(1, min(shards, size))
+    bounds = [0]
+    with open(path, "rb") as fp:
+        for i in range(1, shards):
+            cut = _next_boundary(fp, max(size * i // shards, bounds[-1]), size)
+            if cut < size and cut > bounds[-1]:
+                bounds.append(cut)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _next_boundary(fp: BinaryIO, offset: int, size: int) -> int:
+    """First offset at or after ``offset`` that follows a whitespace byte."""
+    if offset == 0:
+        return 0
+    fp.seek(offset - 1)
+    while offset < size:
+        block = fp.read(_PROBE)
+        if not block:
+            break
+        for i, byte in enumerate(block):
+            if byte in _WHITESPACE:
+                return offset + i
+        offset += len(block)
+    return size
+
+
+class _RangeReader:
+    """Minimal text file object over ``[start, end)`` of a binary file."""
+
+    def __init__(self, fp: BinaryIO, start: int, end: int, encoding: str) -> None:
+        fp.seek(start)
+        self._fp = fp
+        self._left = end - start
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+    def read(self, size: int) -> str:
+        if size == 0:
+            return ""
+        text = ""
+        while not text and self._left > 0:
+            data = self._fp.read(min(size, self._left))
+            if not data:
+                break
+            self._left -= len(data)
+            text = self._decoder.decode(data, final=self._left == 0)
+        return text
+
+
+def count_range(
+    path: str,
+    start: int,
+    end: int,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, int]:
+    """Count the words in bytes ``[start, end)`` of ``path``."""
+    with open(path, "rb") as fp:
+        return count_words(_RangeReader(fp, start, end, encoding), chunk_size)
+
+
+def merge_counts(left: Dict[str, int], right: Dict[str, int]) -> Dict[str, int]:
+    """Add ``right`` into ``left`` and return it, keeping first-seen order."""
+    get = left.get
+    for word, count in right.items():
+        left[word] = get(word, 0) + count
+    return left
+
+
+def parallel_count_words(
+    path: str,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> Dict[str, int]:
+    """Count word frequencies of the file at ``path`` across processes.
+
+    The result is identical, including key order, to
+    :func:`~src.text.streaming.count_words` on the same file.
+
+    Args:
+        path: File to count. Must be seekable, so paths only.
+        workers: Worker processes; defaults to ``os.cpu_count()``.
+        shards: Number of byte ranges; defaults to ``4 * workers`` so a slow
+            range does not leave other workers idle.
+        encoding: Text encoding of the file. Must be ASCII-compatible
+            (e.g. UTF-8 or Latin-1) for the whitespace-aligned split.
+        chunk_size: Characters read per step inside each worker.
+        executor: Existing executor to use instead of a new process pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = shard_ranges(path, shards or 4 * workers)
+    if not ranges:
+        return {}
+    if workers == 1 and executor is None:
+        return count_words(path, chunk_size, encoding)
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(count_range, path, start, end, encoding, chunk_size)
+            for start, end in ranges
+        ]
+        # Merging in range order keeps the first-seen word order. Sending
+        # partial counts back to workers to merge would pickle every word
+        # once more per round, which costs more than the merge itself.
+        counts = futures[0].result()
+        for future in futures[1:]:
+            merge_counts(counts, future.result())
+        return counts
+    finally:
+        if executor is None:
+            pool.shutdown()
@@ -0,0 +1,244 @@
+"""
+Exact and approximate (bounded-memory) frequency counters.
+
+``ExactCounter`` keeps one counter per distinct item, like the ``word_count``
+dicts in the learning materials. ``SpaceSaving`` keeps at most ``capacity``
+counters no matter how many distinct items the stream has, and reports the
+heavy hitters with bounded error. Both share one interface, so callers can
+pick the mode by configuration with :func:`make_counter`.
+"""
+
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Type, Union
+
+from .streaming import DEFAULT_CHUNK_SIZE, Source, iter_chunks
+
+
+class ExactCounter:
+    """Exact frequency counter; memory grows with the number of distinct items.
+
+    Args:
+        capacity: Accepted for interface parity with :class:`SpaceSaving`
+            and ignored.
+    """
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        self._counts: Counter = Counter()
+
+    @property
+    def total(self) -> int:
+        """Number of items counted so far."""
+        return sum(self._counts.values())
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Count ``item`` ``count`` more times."""
+        self._counts[item] += count
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Count every item of ``items`` once."""
+        self._counts.update(items)
+
+    def estimate(self, item: Hashable) -> int:
+        """Return the count of ``item`` (exact)."""
+        return self._counts.get(item, 0)
+
+    def error(self, item: Hashable) -> int:
+        """Maximum overestimate of ``estimate(item)``; always 0 here."""
+        return 0
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """Return the ``k`` most frequent ``(item, count)`` pairs."""
+        return self._counts.most_common(k)
+
+    def merge(self, other: "ExactCounter") -> "ExactCounter":
+        """Add the counts of ``other`` into this counter and return it."""
+        self._counts.update(other._counts)
+        return self
+
+    def to_dict(self) -> Dict[Hashable, int]:
+        return dict(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+class SpaceSaving:
+    """Approximate top-K counter using the Space-Saving algorithm.
+
+    At most ``capacity`` items are tracked. When a new item arrives and every
+    slot is taken, the item with the smallest count is replaced and the new
+    item inherits that count as its possible overestimate.
+
+    With ``m = capacity`` and ``N`` items counted so far:
+
+    * ``estimate(x)`` never underestimates, and overestimates the true count
+      by at most ``error(x) <= N / m``;
+    * every item whose true count exceeds ``N / m`` is being tracked;
+    * ``estimate(x) - error(x)`` is a guaranteed lower bound.
+
+    Counters built over separate shards can be combined with :meth:`merge`;
+    the bound then holds with ``N`` the total over all shards.
+
+    Args:
+        capacity: Number of counters, i.e. the memory budget. For a top-K
+            query use a capacity several times ``K``.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # Items grouped by count, so the minimum is found without sorting.
+        self._buckets: Dict[int, Dict[Hashable, None]] = {}
+        self._min: Optional[int] = None  # None means "recompute when needed"
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Count ``item`` ``count`` more times."""
+        self.total += count
+        old = self._counts.get(item)
+        if old is not None:
+            self._move(item, old, old + count)
+            return
+        if len(self._counts) < self.capacity:
+            self._place(item, count, 0)
+            if self._min is not None and count < self._min:
+                self._min = count
+            return
+        floor = self._min_count()
+        bucket = self._buckets[floor]
+        victim = next(iter(bucket))
+        del bucket[victim]
+        if not bucket:
+            del self._buckets[floor]
+            self._min = None
+        del self._counts[victim]
+        del self._errors[victim]
+        self._place(item, floor + count, floor)
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Count every item of ``items`` once."""
+        add = self.add
+        for item in items:
+            add(item)
+
+    def _place(self, item: Hashable, count: int, error: int) -> None:
+        self._counts[item] = count
+        self._errors[item] = error
+        self._buckets.setdefault(count, {})[item] = None
+
+    def _move(self, item: Hashable, old: int, new: int) -> None:
+        bucket = self._buckets[old]
+        del bucket[item]
+        if not bucket:
+            del self._buckets[old]
+            if self._min == old:
+                # With unit increments nothing can lie between old and new.
+                self._min = new if new == old + 1 else None
+        self._buckets.setdefault(new, {})[item] = None
+        self._counts[item] = new
+
+    def _min_count(self) -> int:
+        if self._min is None:
+            self._min = min(self._buckets)
+        return self._min
+
+    def estimate(self, item: Hashable) -> int:
+        """Return the estimated count of ``item`` (0 if it is not tracked)."""
+        return self._counts.get(item, 0)
+
+    def error(self, item: Hashable) -> int:
+        """Maximum overestimate of ``estimate(item)``."""
+        return self._errors.get(item, 0)
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """Return the ``k`` items with the highest estimated counts."""
+        return heapq.nlargest(k, self._counts.items(), key=itemgetter(1))
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Combine the summary of another shard into this one and return it.
+
+        Items missing from a full summary may have been counted up to its
+        minimum count, so that minimum is added to both their count and
+        their error before the ``capacity`` largest counters are kept.
+        """
+        floor_self = self._min_count() if len(self) >= self.capacity else 0
+        floor_other = other._min_count() if len(other) >= other.capacity else 0
+        merged = []
+        for item in self._counts.keys() | other._counts.keys():
+            count = self._counts.get(item, floor_self) + other._counts.get(
+                item, floor_other
+            )
+            error = self._errors.get(item, floor_self) + other._errors.get(
+                item, floor_other
+            )
+            merged.append((count, error, item))
+        keep = heapq.nlargest(self.capacity, merged, key=itemgetter(0))
+        total = self.total + other.total
+        self.__init__(self.capacity)  # type: ignore[misc]
+        self.total = total
+        for count, error, item in keep:
+            self._place(item, count, error)
+        return self
+
+    def to_dict(self) -> Dict[Hashable, int]:
+        return dict(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+FrequencyCounter = Union[ExactCounter, SpaceSaving]
+
+COUNTERS: Dict[str, Type[FrequencyCounter]] = {
+    "exact": ExactCounter,
+    "spacesaving": SpaceSaving,
+}
+
+
+def make_counter(mode: str = "exact", capacity: int = 1000) -> FrequencyCounter:
+    """Create a frequency counter by name.
+
+    Args:
+        mode: ``"exact"`` or ``"spacesaving"``.
+        capacity: Memory budget (number of counters) for approximate modes.
+
+    Raises:
+        ValueError: If ``mode`` is unknown.
+    """
+    try:
+        cls = COUNTERS[mode]
+    except KeyError:
+        raise ValueError(
+            f"unknown counter mode {mode!r}; expected one of {sorted(COUNTERS)}"
+        ) from None
+    return cls(capacity)
+
+
+def top_words(
+    source: Source,
+    k: int = 100,
+    mode: str = "spacesaving",
+    capacity: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Dict[str, int]:
+    """Return the ``k`` most frequent words of ``source`` with their counts.
+
+    Args:
+        source: A path, a text or binary file object, or an iterable of lines.
+        k: Number of words to return, most frequent first.
+        mode: ``"spacesaving"`` for bounded memory or ``"exact"``.
+        capacity: Counters for approximate modes; defaults to ``max(10 * k,
+            1000)``.
+        chunk_size: Number of characters read from a file per step.
+        encoding: Encoding used for paths and binary file objects.
+    """
+    counter = make_counter(mode, capacity or max(10 * k, 1000))
+    for chunk in iter_chunks(source, chunk_size, encoding):
+        counter.update(chunk.split())
+    return dict(counter.top(k))
@@ -0,0 +1,150 @@
+"""
+Token interning: map each distinct string to a dense integer id.
+
+A :class:`Vocabulary` stores every distinct word once and hands out ids
+``0, 1, 2, ...`` in first-seen order. Counts can then live in a flat
+``array('q')`` indexed by id (:class:`IdCounter`) instead of a dict of
+``str -> int`` objects; each extra counter sharing the vocabulary costs
+8 bytes per word rather than a dict entry plus an ``int`` object.
+"""
+
+import heapq
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class Vocabulary:
+    """Bidirectional ``word <-> id`` mapping with dense, stable ids."""
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._ids: Dict[str, int] = {}
+        self._words: List[str] = []
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> int:
+        """Return the id of ``word``, assigning the next free id if it is new."""
+        wid = self._ids.get(word)
+        if wid is None:
+            wid = self._ids[word] = len(self._words)
+            self._words.append(word)
+        return wid
+
+    def encode(self, words: Iterable[str]) -> array:
+        """Return the ids of ``words`` as an ``array('q')``, adding new words."""
+        ids = self._ids
+        vocab = self._words
+        out = array("q")
+        append = out.append
+        for word in words:
+            wid = ids.get(word)
+            if wid is None:
+                wid = ids[word] = len(vocab)
+                vocab.append(word)
+            append(wid)
+        return out
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """Return the words for ``ids``."""
+        words = self._words
+        return [words[i] for i in ids]
+
+    def get(self, word: str, default: Optional[int] = None) -> Optional[int]:
+        """Return the id of ``word``, or ``default`` if it is unknown."""
+        return self._ids.get(word, default)
+
+    def id(self, word: str) -> int:
+        """Return the id of a known ``word``.
+
+        Raises:
+            KeyError: If ``word`` is not in the vocabulary.
+        """
+        return self._ids[word]
+
+    def word(self, wid: int) -> str:
+        """Return the word with id ``wid``.
+
+        Raises:
+            IndexError: If no word has that id.
+        """
+        if wid < 0:
+            raise IndexError(wid)
+        return self._words[wid]
+
+    def intern(self, word: str) -> str:
+        """Return the vocabulary's own copy of ``word``, adding it if new.
+
+        Replacing repeated equal strings with the shared copy keeps one
+        string object per distinct word in memory.
+        """
+        return self._words[self.add(word)]
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+class IdCounter:
+    """Word frequencies stored in an ``array('q')`` indexed by word id.
+
+    Args:
+        vocab: Vocabulary to share with other counters; a new one by default.
+    """
+
+    def __init__(self, vocab: Optional[Vocabulary] = None) -> None:
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self.counts = array("q")
+
+    def _grow(self) -> None:
+        missing = len(self.vocab) - len(self.counts)
+        if missing > 0:
+            self.counts.frombytes(bytes(8 * missing))
+
+    def update(self, words: Iterable[str]) -> None:
+        """Count every word of ``words`` once."""
+        ids = self.vocab.encode(words)
+        self._grow()
+        counts = self.counts
+        if np is not None and len(ids) > 1024:
+            hist = np.bincount(
+                np.frombuffer(ids, dtype=np.int64), minlength=len(counts)
+            )
+            np.frombuffer(counts, dtype=np.int64)[:] += hist
+        else:
+            for wid in ids:
+                counts[wid] += 1
+
+    def add(self, word: str, count: int = 1) -> None:
+        """Count ``word`` ``count`` more times."""
+        wid = self.vocab.add(word)
+        self._grow()
+        self.counts[wid] += count
+
+    def get(self, word: str) -> int:
+        """Return the count of ``word`` (0 if never counted)."""
+        wid = self.vocab.get(word)
+        if wid is None or wid >= len(self.counts):
+            return 0
+        return self.counts[wid]
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """Return the ``k`` most frequent ``(word, count)`` pairs."""
+        best = heapq.nlargest(k, range(len(self.counts)), key=self.counts.__getitem__)
+        return [(self.vocab.word(i), self.counts[i]) for i in best if self.counts[i]]
+
+    def to_dict(self) -> Dict[str, int]:
+        """Return ``{word: count}`` in first-seen order, like the lesson loops."""
+        return {word: n for word, n in zip(self.vocab, self.counts) if n}
+
+    def __len__(self) -> int:
+        return sum(1 for n in self.counts if n)
@@ -0,0 +1,106 @@
+"""
+Word counts over a sliding time window.
+
+Counts are kept per time bucket in a fixed ring of buckets, next to a running
+total for the whole window. When a bucket falls out of the window its counts
+are subtracted from the total, so expiring costs time proportional to that
+bucket's vocabulary and the window is never recounted from scratch.
+"""
+
+import heapq
+import time
+from collections import Counter
+from operator import itemgetter
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class WindowedCounter:
+    """Frequency counts for the last ``window`` seconds.
+
+    The window is split into ``buckets`` equal slices, so an item leaves the
+    counts between ``window - window / buckets`` and ``window`` seconds after
+    it was added. More buckets give sharper expiry at the cost of memory.
+
+    Args:
+        window: Length of the window in seconds.
+        buckets: Number of time slices in the ring.
+        timer: Clock returning seconds; ``time.monotonic`` by default.
+    """
+
+    def __init__(
+        self,
+        window: float = 300.0,
+        buckets: int = 60,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window <= 0 or buckets < 1:
+            raise ValueError("window must be positive and buckets at least 1")
+        self.window = window
+        self.width = window / buckets
+        self._timer = timer
+        self._ring: List[Counter] = [Counter() for _ in range(buckets)]
+        self._totals: Counter = Counter()
+        self._epoch = int(timer() // self.width)  # bucket number of the newest slot
+
+    def _advance(self, now: float) -> int:
+        """Expire the buckets that fell out of the window; return ``now``'s bucket."""
+        target = int(now // self.width)
+        if target <= self._epoch:
+            return target
+        size = len(self._ring)
+        if target - self._epoch >= size:
+            for slot in self._ring:
+                slot.clear()
+            self._totals.clear()
+        else:
+            totals = self._totals
+            for number in range(self._epoch + 1, target + 1):
+                slot = self._ring[number % size]
+                for item, count in slot.items():
+                    left = totals[item] - count
+                    if left:
+                        totals[item] = left
+                    else:
+                        del totals[item]
+                slot.clear()
+        self._epoch = target
+        return target
+
+    def _slot(self, now: Optional[float]) -> Optional[Counter]:
+        number = self._advance(self._timer() if now is None else now)
+        if self._epoch - number >= len(self._ring):
+            return None  # older than the window
+        return self._ring[number % len(self._ring)]
+
+    def add(self, item: Hashable, count: int = 1, now: Optional[float] = None) -> None:
+        """Count ``item`` at time ``now`` (default: the current time)."""
+        slot = self._slot(now)
+        if slot is not None:
+            slot[item] += count
+            self._totals[item] += count
+
+    def update(self, items: Iterable[Hashable], now: Optional[float] = None) -> None:
+        """Count every item of ``items`` once, all at time ``now``."""
+        slot = self._slot(now)
+        if slot is not None:
+            items = list(items)
+            slot.update(items)
+            self._totals.update(items)
+
+    def get(self, item: Hashable, now: Optional[float] = None) -> int:
+        """Return the count of ``item`` in the current window."""
+        self._advance(self._timer() if now is None else now)
+        return self._totals.get(item, 0)
+
+    def counts(self, now: Optional[float] = None) -> Dict[Hashable, int]:
+        """Return a ``{item: count}`` snapshot of the current window."""
+        self._advance(self._timer() if now is None else now)
+        return dict(self._totals)
+
+    def top(self, k: int, now: Optional[float] = None) -> List[Tuple[Hashable, int]]:
+        """Return the ``k`` most frequent items of the current window."""
+        self._advance(self._timer() if now is None else now)
+        return heapq.nlargest(k, self._totals.items(), key=itemgetter(1))
+
+    def __len__(self) -> int:
+        return len(self._totals)